@@ -21,22 +21,35 @@
 import tkinter as tk # Essential for the GUI.
 from tkinter import ttk # Used to set scrollbar colors.
 from tkinter import font # Used to set a default font.
+from tkinter import messagebox # Used to report databases that cannot be loaded.
 from functools import partial # Used for interactive font styles.
+import os # Used to find the optional SQLite database.
+import threading # Used to import matplotlib and read the databases in the background.
+import queue # Hands databases read in the background to the Tk thread.
+import logging # Used to skip trace output that is switched off.
 from time import sleep # Used for troubleshooting and delaying script execution.
-from fractions import Fraction # Used in simplifying fractional exponents.
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
+from coalexicon import UnitEngine, favorite_key, load_conversion_database, load_symbol_database, load_unit_database # Headless Unit Manager pipeline and database loaders.
+from coalexicon.prefixes import power_of_ten, prefix_powers # Values of the prefix buttons.
+from coalexicon.formatting import is_value # Tells the value in the display from its units.
+from coalexicon.storage import SQLiteStorage # Optional storage of the databases with single-row updates.
+from coalexicon.grid import VirtualGrid # Symbol Manager table that only creates widgets for visible rows.
+from coalexicon.dimensions import DimensionIndex # Finds Symbol Manager entries by the dimensions of their units.
+from coalexicon.views import SortedViews # Cached Symbol Manager rows for each category and sorting method.
+from coalexicon.search import FuzzyIndex, TrigramIndex # Substring index of Symbol Manager names, and typo-tolerant index of all columns.
+from coalexicon.tracing import get_logger, set_trace, setup_tracing # Trace output for each subsystem, off by default.
+from coalexicon.timing import StageTimer # Optional timing of the Unit Manager pipeline and Symbol Manager loaders.
+from coalexicon.saving import SaveWriter, format_table # Writes the notes and databases in the background.
 
 #############################################################################################################################################################################################
 ## Global datasets
-current_unit_list = [] # Holds a mutable list of elements of positive_numerator_list and negative_numerator_list. Ex=["m", "m", "-s", "-s"]
-current_unit_name = [] # Holds a unique keyname for the current unit, given by name_creator. Ex=['meter_squared_per_second_squared']
-current_display = [] # Holds a list of all strings that are processed for the main display. Ex=["1.23×10⁻¹", "MeV", "s⁻¹"]
+units_log = get_logger("units") # Traces Unit Manager. Switched on with the "trace units" keyword or CLX_TRACE=units. See coalexicon/tracing.py.
+symbols_log = get_logger("symbols") # Traces Symbol Manager.
+io_log = get_logger("io") # Traces loading and saving of notes, favorites, and databases.
+graphing_log = get_logger("graphing") # Traces the Graphing Calculator.
+
 display_list = [] # Holds an organized list of current units. Ex=["g", "m³", "C⁻²", "s⁻²"]
 favorites_list = [] # Holds a mutable list of the current saved favorites. Ex=[<consolidated>, <units>, <denominator prefixes>, <numerator prefixes>, <value>]
 
-current_value = 1 # Holds and initializes the total numerical value of the current units, not including current prefixes.
-entry_unit_index = 7 # Holds and initializes an index to assist the entry of non-base units.
 application_index = 0 # Designates the currently toggled application, which could be Unit Manager (0) or Symbol Manager (1).
 theme_index = 1 # Designates the currently toggled theme.
 textbox_index = 1 # Tracks the current textbox in the lower subframe.
@@ -47,79 +60,76 @@ current_category = "All" # Holds and initializes the name of the current categor
 current_sort = "Name" # Holds and initializes the name of the current sorting method.
 index_type = "Index" # Holds and initializes the sorting method for Symbols. Possible options are ["Primary", "Secondary", "Index"].
 
-unit_names = ["candela", "coulomb", "gram", "kelvin", "meter", "mole", "second", "1"] # Indexed, immutable list of names of base units.
-exponent_codes = [] # Mutable list of exponent symbols from 0 to x. Does not share an index with any other set.
-exponent_symbols = ["⁰", "¹", "²", "³", "⁴", "⁵", "⁶", "⁷", "⁸", "⁹", "¹⁰"] # Immutable exponent symbols from 0 to 9.
-positive_denominator_exponent_array = [] # Indexed, closed numerical array, corresponding to positive exponents of base units. Ex=[0, 0, 2, 0, 4, 0, 0, 0, 0]
-exponent_array, exponent_tuple_array = [], [] # Initializes the global form of exponent_tuple_array and its temporary form.
-
-positive_numerator_symbols = ["cd", "C", "g", "K", "m", "mol", "s", "1"] # Indexed, mutable list of positive unit symbols.
-negative_numerator_symbols = ["-cd", "-C", "-g", "-K", "-m", "-mol", "-s", "1"] # Indexed, mutable list of negative unit symbols.
-positive_denominator_symbols = ["_cd", "_C", "_g", "_K", "_m", "_mol", "_s", "1"] # Indexed, mutable list of positive unit symbols.
-numerator_value_list = [0, 0, 0, 0, 0, 0, 0, 0] # Initializes an indexed, mutable array that corresponds to the prefix value of all units in the numerator.
-denominator_value_list = [0, 0, 0, 0, 0, 0, 0, 0]  # Initializes an indexed, mutable array that corresponds to the prefix value of all units in the denominator.
-positive_numerator_custom_array = [] # Initializes an indexed, mutable array that corresponds to positive exponents of base and user-defined units. Ex=[0, 0, 0, 0, 0, 0, 0, 0, 2]
-negative_numerator_custom_array = [] # Initializes an indexed, mutable array that corresponds to negative exponents of base and user-defined units. Ex=[0, 0, 0, 0, 0, 0, 0, 0, 0]
-positive_denominator_custom_array = [] # Initializes an indexed, mutable array that corresponds to positive exponents of base and user-defined units. Ex=[0, 0, 0, 0, 0, 0, 0, 0, 2]
-exponent_array_custom, exponent_tuple_array_custom = [], [] # Initializes the global form of exponent_tuple_array_custom and its temporary form.
-
-current_unit_consolidated = [] # Holds a mutable list of units with respective exponents, given by consolidate_current_unit_list. Ex=["m²", "s⁻²"]
-current_unit_custom = [] # Holds a mutable list of base and non-base units with respective exponents. Ex=["eV", "s⁻¹"]
-current_unit_reduced = [] # Holds current base and non-base units without exponents. Ex=["eV", "s"]
-compound_units_list = [] # Holds lists of each unit, prefix, and numerator. Ex=[["eV", "M", 1], ["s⁻¹", "k", 100]]
-significand_order_units = [] # Holds current_unit_custom and the significand and order of current_value. # Ex=["1.23", 1000, ["eV", "s⁻¹"]]
-units_exponents_totals = [] # Holds a list of current units, associated values, and multiplicity. Ex=[["s²", "s", 2, 2], ["eV", "eV", 1, 1000000]]
-
 current_database_list = [] # Holds sorted data of the current database and category. Ex=[("<Name>", ["<Primary>", "<Secondary>", "<Other>", "<Units>", "<Index>", "<Category>"])]
 notation_database_dictionary = {} # Holds the current database in a dictionary. Ex={"distance": ["d", "0", "l;s;r", "m", "d", "quantity"]}
-notation_database_list = [] # Holds the current database in a list of tuples. Ex=[("distance", ["d", "0", "l;s;r", "m", "d", "quantity"])]
-notation_database_quantities = [] # Holds saved quantities in a list of tuples. Ex=[("distance", ["d", "0", "l;s;r", "m", "d", "quantity"])]
-notation_database_constants = [] # Holds saved constants in a list of tuples. Ex=[("Planck constant", ["h", "ℏ", "0", "g⸱m²⸱s⁻¹", "h", "constant"]}]
-notation_database_modifiers = [] # Holds saved modifiers in a list of tuples. Ex=[("average", ["̅", "⟨ ⟩", "0", "0", "0", "modifier"])]
-notation_database_other = []  # Holds saved uncategorized entries in a list of tuples. Ex=[("field", ["₣", "0", "0", "0", "F", "other"])]
+symbol_views = SortedViews() # Holds the sorted rows of each category and sorting method. Ex=symbol_views.view("Quantities", "Units", "Index") → [("distance", ["d", "0", "l;s;r", "m", "d", "quantity"])]
 notation_database_search = [] # Holds results of the current search. Ex=[("field", ["₣", "0", "0", "0", "F", "other"])]
 conversion_database = {} # Holds a selection of non-base units for conversion to base units.
 unit_database = {} # Holds information about particular combinations of base units.
+search_index = TrigramIndex() # Holds the names of the current database for search_names(). Updated by load_symbols() and cell_return(), or replaced by one built in the background at startup.
+fuzzy_index = None # Holds every column of the current database once fuzzy search is on and the index has been built in the background. Otherwise searches only match names.
+fuzzy_search = False # True while fuzzy search is on, including while fuzzy_index is being built.
+fuzzy_building = False # True while read_fuzzy_index() is building an index in the background. Only one is built at a time.
 cell_dictionary = {} # Initializes a dictionary of key-value pairs. Ex={'Name1': [<tkinter.Entry object .!frame2.!frame.!entry>, ₣]'}
+stage_timer = StageTimer() # Records the time of each stage once the "timing" keyword is entered. See coalexicon/timing.py.
+timing_file = "coalexicon_timing.json" # Receives the timing summary when timing is switched off.
+timing_panel = None # Holds the window that shows the timing summary while timing is on.
+engine = UnitEngine(conversion_database, unit_database, timer=stage_timer) # Holds the current set of units for Unit Manager. See coalexicon/engine.py.
+plot_engine = UnitEngine(conversion_database, unit_database) # Reduces the units of Graphing Calculator equations without changing the units in Unit Manager.
+dimension_index = DimensionIndex(engine) # Holds the entries of the current database by the dimensions of their units. Updated by load_units(), load_symbols(), and cell_return().
+storage_file = "coalexicon.sqlite3" # Holds the symbol and unit databases while the SQLite backend is on. Removed when it is turned off, so that the text files are used at the next launch.
+symbol_files = ("database_clx.txt", "database_iso.txt", "database_custom.txt") # Lists the symbol databases kept in storage_file.
+storage = None # Holds the SQLiteStorage object when the SQLite backend is on. Otherwise the text files are read and rewritten directly.
+graphing_modules = {} # Holds coalexicon/graphing.py once it and matplotlib have been imported. See load_graphing().
+graphing_loader = None # Holds the thread that imports matplotlib.
+graphing_canvas = None # Holds the figure of the Graphing Calculator. Created by the first plot.
+load_queue = queue.Queue() # Receives the databases read by read_databases() and the indexes built by read_fuzzy_index() on background threads. Emptied by poll_loading() on the Tk thread.
+load_generations = {"units": 0, "symbols": 0, "fuzzy": 0} # Counts the loads of each database and builds of the fuzzy index, so that a background result is discarded if it is out of date.
+background_threads = 0 # Counts the background threads that have not yet reported to load_queue.
+polling = False # True while poll_loading() is scheduled.
+databases_loading = False # True until the databases read at startup have been installed. Only the notes are saved until then, so that empty databases are not written over the files.
+failed_loads = set() # Holds the database files that could not be read. They are not saved until they have been loaded, for the same reason. Ex={"database_units.txt"}
+poll_interval = 50 # Milliseconds between checks of load_queue and save_writer.
+save_writer = SaveWriter() # Writes copies of the notes and databases on a background thread. See coalexicon/saving.py.
+save_errors = [] # Holds the errors of the writes since the last click of Save. Reported by poll_saving().
+save_polling = False # True while poll_saving() is waiting for save_writer.
+save_deferred = False # True if the last click of Save only saved the notes, as the databases were still loading.
 
 #############################################################################################################################################################################################
 ## Functions
-def print_sets(function=True):
-    """ Optional. Called for troubleshooting and procedural insight. Optional. """
-    print('print_sets():')  
-    print(f'current_unit_list:                 {current_unit_list}')
-    print(f'current_unit_name:                 {current_unit_name}')
-    print(f'current_display:                   {current_display}')
-    #print(f'positive_numerator_custom_array:   {positive_numerator_custom_array}')
-    #print(f'negative_numerator_custom_array:   {negative_numerator_custom_array}')
-    #print(f'numerator_value_list:             {numerator_value_list}')
-    #print(f'denominator_value_list:           {denominator_value_list}')
-    print(f'units_exponents_totals:            {units_exponents_totals}')
-    #print(f'positive_numerator_symbols:        {positive_numerator_symbols}')
-    #print(f'exponent_array_custom:             {exponent_array_custom}')
-    #print(f'negative_numerator_symbols:        {negative_numerator_symbols}')
-    print(f'current_value:                     {current_value}')
-    if function:
-        print(f"{'-'*98}\n")
+def print_sets():
+    """ Optional. Called for troubleshooting and procedural insight. Writes the state of engine to the Unit Manager trace, and does nothing while the trace is off. """
+    if not units_log.isEnabledFor(logging.DEBUG): # Skips building current_unit_list.
+        return
+    units_log.debug('print_sets():')
+    units_log.debug('current_unit_list:                 %s', engine.current_unit_list)
+    units_log.debug('current_unit_name:                 %s', engine.current_unit_name)
+    units_log.debug('current_display:                   %s', engine.current_display)
+    #units_log.debug('positive_numerator_custom_array:   %s', engine.positive_numerator_custom_array)
+    #units_log.debug('negative_numerator_custom_array:   %s', engine.negative_numerator_custom_array)
+    #units_log.debug('numerator_value_list:             %s', engine.numerator_value_list)
+    #units_log.debug('denominator_value_list:           %s', engine.denominator_value_list)
+    units_log.debug('units_exponents_totals:            %s', engine.units_exponents_totals)
+    #units_log.debug('positive_numerator_symbols:        %s', engine.positive_numerator_symbols)
+    #units_log.debug('exponent_tuple_array_custom:       %s', engine.exponent_tuple_array_custom)
+    #units_log.debug('negative_numerator_symbols:        %s', engine.negative_numerator_symbols)
+    units_log.debug('current_value:                     %s', engine.current_value)
 
 def main_units():
-    """ Calls a series of primary functions to process current data and update the GUI display. Called by entry_unit(), update_units_and_values(),
-        invert(), clear(), and favorites_trigger(). Two new lines signify the end of a main_units() call. """
-    print("main_units():\n") # Optional.
-    consolidate_current_unit_list() # Updates current_unit_consolidated, current_unit_custom, positive_numerator_custom_array, and negative_numerator_custom_array.
-    name = name_creator() # Updates and returns current_unit_name.
-    unit_data_finder(name) # Updates conversions and quantities displays.
-    prefix_finder() # Updates units_exponents_totals and current_unit_reduced.
-    units_exponents_totals_to_compound_units_list() # Processes data for display.
-    current_unit_custom_to_significand_order_units() # Processes data for display.
-    significand_order_units_to_current_display() # Processes data for display.
-    set_current_display() # Updates current unit display.
-    print_sets(False) # Optional.
-    print(f"\n{'-'*98}") # Optional.
+    """ Runs the Unit Manager pipeline in engine and updates the GUI display. Called by entry_unit(), update_units_and_values(), invert(), clear(), and
+        favorites_trigger(). The state of engine is traced at the end of each call. """
+    units_log.debug("main_units()") # Optional.
+    with stage_timer.stage("main_units"):
+        engine.reduce() # Updates current_unit_name, units_exponents_totals, compound_units_list, and current_display.
+        with stage_timer.stage("unit_data_finder"):
+            unit_data_finder(engine.current_unit_name[0]) # Updates conversions and quantities displays.
+        with stage_timer.stage("set_current_display"): # Includes the Tk display update.
+            set_current_display() # Updates current unit display.
+    print_sets() # Optional.
 
 def load_notes():
     """ Loads saved notes for the lower subframe. """
-    print("load_notes():") # Optional.
+    io_log.debug("load_notes()") # Optional.
     notes_index = 1
     with open("database_notes.txt", 'r', encoding='utf-8') as notes: # Loads previous notes from a text file.
         for line in notes.readlines():
@@ -144,73 +154,99 @@ def load_notes():
         textbox.delete('1.0', 'end')
         textbox.insert('end', notes.strip())
     notes_toggle()
-    print() # Optional.
 
-def load_units():
-    """ Converts an existing text file to a global dictionary of saved values. ={"} """
-    print("load_units():") # Optional.
-    global unit_database
+def read_units():
+    """ Reads the unit and conversion databases without changing the global dictionaries. Safe to call from a background thread unless the SQLite backend is on. """
+    if storage:
+        units = storage.load_units()
+    else:
+        units = load_unit_database("database_units.txt")
+    return units, load_conversion_database("database_conversions.txt")
+
+def install_units(units, conversions):
+    """ Replaces the global dictionaries used by engine. Called on the Tk thread. """
     unit_database.clear() # Prepares the global list for updating.
-    with open("database_units.txt", 'r', encoding='utf-8') as database:
-        units_list = list(zip(*(line.strip().split('\t') for line in database)))
-    names_list = list(units_list[0]) # Produces a list of unit names from the specified text file.
-    data_list = [] # Initializes a list of lists from the specified text file.
-    for i in range(len(units_list)-1): # Produces a list of lists from the specified text file.
-        data_list.append(list(units_list[i+1]))
-    for i in range(len(names_list)):
-        column_data = [] # Ex=['d', '0', 'l;s;r', 'm']
-        for j in range(len(data_list)):
-            column_data.append(data_list[j][i])
-        unit_database[names_list[i]] = column_data
+    unit_database.update(units)
     conversion_database.clear()
-    with open("database_conversions.txt", 'r', encoding='utf-8') as database:
-        conversions_list = list(zip(*(line.strip().split('\t') for line in database)))
-    names_list = list(conversions_list[0]) # Produces a list of units from the specified text file.
-    convert_list = [string.replace("'", "") for string in conversions_list[1]]
-    convert_list = [string.strip("[]").split(", ") for string in convert_list]
-    value_list = [float(string) for string in conversions_list[2]]
-    data_list = []
-    data_list.append(convert_list)
-    data_list.append(value_list)
-    for i in range(len(names_list)):
-        column_data = [] # Ex=['d', '0', 'l;s;r', 'm']
-        for j in range(len(data_list)):
-            column_data.append(data_list[j][i])
-        conversion_database[names_list[i]] = column_data
-    print() # Optional.
+    conversion_database.update(conversions)
+    engine.clear_name_cache() # Discards unit names and data resolved from the previous databases.
+    plot_engine.clear_name_cache()
+
+def load_units():
+    """ Converts existing text files to the global dictionaries of saved values used by engine. """
+    io_log.debug("load_units()") # Optional.
+    load_generations["units"] += 1 # Discards units still being read in the background.
+    try:
+        units = read_units()
+    except Exception as error: # Keeps the previous databases, and stops them from being saved over the file.
+        report_load_error("database_units.txt", error)
+        return
+    install_units(*units)
+    failed_loads.discard("database_units.txt")
+    dimension_index.build(notation_database_dictionary) # Reads the Units column again with the new conversions.
 
 def save_command():
-    """ Opens a text file and calls the current application's save routine. """
-    with open("database_notes.txt", 'w', encoding='utf-8') as notes:
-        print(textbox_1.get('1.0', 'end'), file=notes)
-        print(">>", file=notes)
-        print(textbox_2.get('1.0', 'end'), file=notes)
-        print(">>", file=notes)
-        print(textbox_3.get('1.0', 'end'), file=notes)
-    if application_index == 1:
+    """ Saves the notes and calls the current application's save routine. Files are copied here and written in the background, and the Save button shows the result.
+        Only the notes are saved while the databases are loading. """
+    global save_polling, save_deferred
+    notes = f"{textbox_1.get('1.0', 'end')}\n>>\n{textbox_2.get('1.0', 'end')}\n>>\n{textbox_3.get('1.0', 'end')}\n" # Ex="<notes 1>\n\n>>\n<notes 2>\n\n>>\n<notes 3>\n\n"
+    save_writer.save("database_notes.txt", notes)
+    save_deferred = databases_loading
+    if databases_loading: # The databases are still empty.
+        io_log.warning("Saved the notes only, as the databases are loading.") # Optional.
+    elif application_index == 1:
         save_units()
     else:
         save_symbols()
+    save_button.config(text='Saving...', bg=green)
+    if not save_polling:
+        save_polling = True
+        root.after(poll_interval, poll_saving)
+
+def poll_saving():
+    """ Reads the results of save_writer and shows them on the Save button once every file has been written. Errors are also written to the io trace. """
+    global save_polling
+    while not save_writer.results.empty():
+        path, error = save_writer.results.get()
+        if error:
+            io_log.warning("Cannot save %s: %s", path, error) # Optional.
+            save_errors.append(path)
+    if save_writer.busy():
+        root.after(poll_interval, poll_saving)
+        return
+    save_polling = False
+    if save_errors:
+        save_button.config(text='Not saved!', bg=red)
+        save_errors.clear()
+    elif save_deferred:
+        save_button.config(text='Loading...')
+    else:
+        save_button.config(text='Saved')
+    root.after(1500, reset_save_button)
+
+def reset_save_button():
+    """ Restores the Save button after poll_saving() has shown a result, unless another save has started. """
+    if not save_polling:
+        save_button.config(text='Save', bg=green)
 
 def save_units():
     """ Saves data within the Unit Manager application. """
-    print("save_units():") # Optional.
-    global unit_database
-    with open("database_units.txt", 'w', encoding='utf-8') as database:
-        for name in unit_database: # Assumes notation_database_dictionary.
-            name_and_data = f"{name}" # Initializes the string of tab-spaced values.
-            for data in unit_database[name]:
-                name_and_data = f"{name_and_data}\t{data}"
-            print(name_and_data, file=database)
-    sleep(0.5) # Optional, though errors may occur otherwise.
-    print() # Optional.
+    io_log.debug("save_units()") # Optional.
+    if "database_units.txt" in failed_loads: # Reported as not saved by poll_saving().
+        save_errors.append("database_units.txt")
+        return
+    if storage: # Edits have already been written by data_return().
+        storage.commit()
+        return
+    save_writer.save("database_units.txt", {name: list(data) for name, data in unit_database.items()}, format_table) # Copies each row, as later edits change the rows in place.
 
 def data_return(event, cell):
     """ Updates the database with the current entry. Called when return/enter has been pressed in Unit Manager. """
     global unit_database
-    print(f"data_return():") # Optional.
+    units_log.debug("data_return()") # Optional.
     data = cell.get()  # Gets text/data from the specified cell.
     new_list = []
+    current_unit_name = engine.current_unit_name
     if current_unit_name[0] not in unit_database:
         unit_database[current_unit_name[0]] = ["", ""]
     if str(cell) == ".!frame.!frame.!entry": # Updates the Common Conversions entry for the current unit.
@@ -222,655 +258,69 @@ def data_return(event, cell):
         new_list.append(old_data)
         new_list.append(new_data)
     unit_database[current_unit_name[0]] = new_list
-    print() # Optional.
+    if storage: # Writes only the current unit. Saved with the "Save" button.
+        storage.upsert_unit(current_unit_name[0], new_list)
+    engine.clear_name_cache() # Discards the previous data of the current unit.
 
 def entry_unit(event, unit, operator):
-    """ Adds or removes a user-defined unit from current_unit_list, positive_numerator_symbols, and negative_numerator_symbols. 
+    """ Adds or removes a user-defined unit from the current set of units, or multiplies the current value by a number.
         For the operator variable, "×" corresponds to multiplication, and ÷ corresponds to division. """
-    print("entry_unit():\n") # Optional.
+    units_log.debug("entry_unit()") # Optional.
     #print(f"event: {event}\nunit: {unit}\noperator: {operator}") # Optional
-    global entry_unit_index, current_value
     if event:
         unit = unit_entry.get()
         root.focus()
     if unit: # Prevents errors following a null entry.
         if unit == "theme": # Triggers keyword entry to alter the GUI background and foreground images. Not used in CLX Lite.
             set_theme(operator) # Handles theme changes.
+        elif unit == "exact": # Triggers keyword entry to keep values as exact fractions (×) or floats (÷).
+            engine.set_exact(operator == "×")
+            units_log.info("Exact arithmetic: %s", 'on' if engine.exact else 'off') # Optional.
+            main_units()
+        elif unit == "binary": # Triggers keyword entry to display large values with binary prefixes such as Ki and Mi (×) or with SI prefixes (÷).
+            engine.binary = operator == "×"
+            main_units()
+        elif unit.startswith("trace "): # Triggers keyword entry to switch trace output on (×) or off (÷) for a subsystem. Ex="trace units", "trace symbols", "trace io", "trace all"
+            set_trace(unit[6:], operator == "×")
+        elif unit == "timing": # Triggers keyword entry to time each stage of Unit Manager and Symbol Manager (×), or to stop and save the results (÷).
+            set_timing(operator == "×")
+        elif unit == "fuzzy": # Triggers keyword entry to search every Symbol Manager column and allow typos (×) or to search names only (÷).
+            set_fuzzy_search(operator == "×")
+        elif unit == "sqlite": # Triggers keyword entry to store the databases in SQLite (×) or return to the text files (÷).
+            set_storage(operator == "×")
         elif unit == "C" and current_database_file == "database_iso.txt":
-            index = positive_numerator_symbols.index(unit)
+            index = engine.positive_numerator_symbols.index(unit)
             update_units_and_values(index, operator, convert=True)
         else: # True for units, as opposed to keywords.
             if "." in unit or unit.isdigit(): # Multiplies or divides the current value by the entry value.
-                #print(f"old current_value: {current_value}")
+                #print(f"old current_value: {engine.current_value}")
                 if operator == "×":
-                    current_value *= float(unit)
+                    engine.current_value *= engine.number(unit)
                 else:
-                    current_value /= float(unit)
-                #print(f"new current_value: {current_value}")
+                    engine.current_value /= engine.number(unit)
+                #print(f"new current_value: {engine.current_value}")
                 main_units()
-            else: # True for "÷". Adds the unit to the global list of base and non-base units.
-                if unit not in positive_numerator_symbols:
-                    negative_numerator_unit, positive_denominator_unit = "-" + unit, "_" + unit
-                    positive_numerator_symbols.append(unit)
-                    negative_numerator_symbols.append(negative_numerator_unit)
-                    positive_denominator_symbols.append(positive_denominator_unit)
-                    numerator_value_list.append(0)
-                    denominator_value_list.append(0)
-                    entry_unit_index += 1
-                    update_units_and_values(entry_unit_index, operator)
-                else:
-                    index = positive_numerator_symbols.index(unit)
-                    update_units_and_values(index, operator)
-
-def populate_exponent_codes():
-    """ Handles errors by lengthening the global list of exponents. """
-    #print(f"populate_exponent_codes():") # Optional.
-    #print(f"exponent_codes: {exponent_codes}") # Optional.
-    global exponent_codes
-    zero_to_nine = ["\u2070", "\u00b9", "\u00b2", "\u00b3", "\u2074", "\u2075", "\u2076", "\u2077", "\u2078", "\u2079"]
-    if (len(exponent_codes) == 0) and (len(current_unit_list) < len(exponent_codes)+10):
-        exponent_codes = zero_to_nine
-    else:
-        if (len(current_unit_list) > len(exponent_codes)+10):
-            exponent_codes = zero_to_nine
-            for i in range(10):
-                if len(current_unit_list) >= 10 * i:
-                        if i != 0:
-                            for j in range(10):
-                                exponent_codes.append(zero_to_nine[i] + zero_to_nine[j])
-                else:
-                    break
-        else:    
-            for i in range(10):
-                if len(exponent_codes) == 10 * i:
-                    for j in range(10):
-                        exponent_codes.append(zero_to_nine[i] + zero_to_nine[j])
-                    break
+            else: # Adds the unit to the global list of base and non-base units, if necessary.
+                index = engine.add_symbol(unit)
+                update_units_and_values(index, operator)
 
 def update_units_and_values(button_index, operator, convert=False):
-    """ Calls prefix_value_tuple() and updates current_unit_list, numerator_value_list, denominator_value_list, and current_value. 
-        This is a fundamental function that runs immediately after any unit is entered. def entry_unit(event, unit, operator): """
-    print("update_units_and_values():") # Optional.
-    global numerator_value_list, denominator_value_list, current_value
+    """ Reads the prefix and fraction buttons and passes the specified unit to engine. This is a fundamental function that runs immediately after any unit is entered. """
+    units_log.debug("update_units_and_values()") # Optional.
     #print(f"button_index: {button_index}\noperator: {operator}") # Optional.
     if button_index == 1 and current_database_file == "database_iso.txt" and not convert:
             entry_unit("", "A", operator)
     else:
-        prefix_tuple = prefix_value_tuple(button_index) # Produces a tuple that contains a prefix symbol and its value. Ex=("M", 1000000)
-        #print(f"numerator_value_list: {numerator_value_list}\ndenominator_value_list: {denominator_value_list}\n") # Optional.
-        if fraction_button.config('relief')[-1] == 'raised': # Adds or removes a numerator from the exponent of the specified unit.
-            if operator == "×":
-                if numerator_value_list[button_index] == 0: # Updates the prefix value of the numerator for a previous value of zero.
-                    numerator_value_list[button_index] = prefix_tuple # Sets the prefix value for the entered unit.
-                else: # Updates the prefix value from a nonzero value.
-                    numerator_value_list[button_index] *= prefix_tuple # Updates the prefix value for the entered unit.
-                if negative_numerator_symbols[button_index] in current_unit_list: # Removes the symbol from current_unit_list.
-                    current_unit_list.remove(negative_numerator_symbols[button_index])
-                    if negative_numerator_symbols[button_index] not in current_unit_list: # Only true for an exponent of zero. Moves leftover value to current_value.
-                        if denominator_value_list[button_index] == 0: # Initializes denominator_value_list for computation.
-                            denominator_value_list[button_index] = 1
-                        leftover_value = numerator_value_list[button_index] / denominator_value_list[button_index]
-                        current_value *= leftover_value
-                        numerator_value_list[button_index] *= 0 # Resets the prefix counter for that unit.
-                        denominator_value_list[button_index] *= 0
-                else: # Adds the symbol to current_unit_list.
-                    current_unit_list.append(positive_numerator_symbols[button_index])
-            else: # True for "÷".
-                if denominator_value_list[button_index] == 0: # Updates denominator_value_list.
-                    denominator_value_list[button_index] = prefix_tuple
-                else:
-                    denominator_value_list[button_index] *= prefix_tuple
-                if positive_numerator_symbols[button_index] in current_unit_list: # Removes the symbol from current_unit_list.
-                    current_unit_list.remove(positive_numerator_symbols[button_index])
-                    if positive_numerator_symbols[button_index] not in current_unit_list: # Updates current_value if necessary.
-                        if numerator_value_list[button_index] == 0: # Initializes denominator_value_list for computation.
-                            numerator_value_list[button_index] = 1
-                        leftover_value = numerator_value_list[button_index] / denominator_value_list[button_index]
-                        current_value *= leftover_value
-                        numerator_value_list[button_index] *= 0 # Resets the prefix counter for that unit.
-                        denominator_value_list[button_index] *= 0
-                else: # Adds the symbol to current_unit_list.
-                    current_unit_list.append(negative_numerator_symbols[button_index])
-        else: # Adds or removes a denominator from the exponent of the specified unit.
-            if operator == "×":
-                current_unit_list.append(positive_denominator_symbols[button_index])
-                if positive_numerator_symbols[button_index] not in current_unit_list and negative_numerator_symbols[button_index] not in current_unit_list:
-                    current_unit_list.append(positive_numerator_symbols[button_index])
-            else: # True for "÷".
-                if positive_denominator_symbols[button_index] in current_unit_list: # Removes a denominator element from the current list.
-                    positive_unit = positive_denominator_symbols[button_index].replace("_", "")
-                    negative_unit = "-" + positive_unit
-                    denominator_count = current_unit_list.count(positive_denominator_symbols[button_index])
-                    if (denominator_count == 1) and ((current_unit_list.count(positive_unit) == 1) or (current_unit_list.count(negative_unit) == 1)):
-                        try:
-                            current_unit_list.remove(positive_numerator_symbols[button_index])
-                            #print(True) # Optional.
-                        except:
-                            current_unit_list.remove(negative_numerator_symbols[button_index])
-                            #print(False) # Optional.
-                    current_unit_list.remove(positive_denominator_symbols[button_index])
-        print() # Optional.
+        prefix_tuple = prefix_value_tuple(button_index) # Produces the value of the selected prefix. Ex=1000000
+        fractional = fraction_button.config('relief')[-1] != 'raised' # Adds or removes a denominator from the exponent of the specified unit.
+        engine.update_units_and_values(button_index, operator, prefix_tuple, fractional)
         main_units()
 
-def consolidate_current_unit_list():
-    """ Uses current_unit_list to build current_unit_consolidated, current_unit_custom, positive_numerator_custom_array, and negative_numerator_custom_array.
-        It converts duplicate units to a single unit with a nonzero exponent and converts ("simplifies") user-defined units to their base equivalent for naming and
-        data recollection. <×/÷> """
-    print("consolidate_current_unit_list():") # Optional.
-    positive_numerator_list, negative_numerator_list = [], [] # Initializes simplified exponent arrays to be saved globally as <±>_numerator_exponent_array.
-    positive_denominator_list = [] # Initializes simplified exponent arrays to be saved globally as positive_denominator_exponent_array.
-    positive_numerator_custom, negative_numerator_custom = [], [] # Initializes the unsimplified numerator exponent arrays.
-    positive_denominator_custom = [] # Initializes an unsimplified denominator exponent array.
-    units, units_display = [], [] # Initializes the simplified and unsimplified lists of current units with respective exponents for current_unit_consolidated.
-    temporary_unit_list = current_unit_list[:] # Initializes a copy of the current unit list.
-    if len(positive_numerator_symbols) > 8: # Checks for entry_unit occurances and converts to base units, if applicable.
-        for i in range(len(positive_numerator_symbols)-8): # Iterates over each non-base unit in positive_numerator_symbols.
-            #print(f"positive_numerator_symbols[i]: {positive_numerator_symbols[i]}") # Optional.
-            positive_equivalent = entry_data_finder(positive_numerator_symbols[(-1)-i]) # Checks for existing positive data and returns a list. Ex=["cd", "-m", "-m"]
-            negative_equivalent = entry_data_finder(negative_numerator_symbols[(-1)-i]) # Checks for existing negative data and returns a list. Ex=["-cd", "m", "m"]
-            if positive_equivalent: # Replaces entry_unit with positive_equivalent, if applicable.
-                while positive_numerator_symbols[-1-i] in temporary_unit_list: # Looks for each occurance of entry_unit in current_unit_list.
-                    if positive_equivalent[0] != "1": # Accounts for non-base units that are equal to unity.
-                        temporary_unit_list.remove(positive_numerator_symbols[-1-i])
-                        temporary_unit_list.extend(positive_equivalent)
-                    else:
-                        temporary_unit_list.remove(positive_numerator_symbols[-1-i])
-            if negative_equivalent: # Replaces entry_unit with negative_equivalent, if applicable.
-                while negative_numerator_symbols[-1-i] in temporary_unit_list: # Looks for each occurance of entry_unit in current_unit_list.
-                    temporary_unit_list.remove(negative_numerator_symbols[-1-i])
-                    if positive_equivalent[0] != "1": # Accounts for non-base units that are equal to unity.
-                        temporary_unit_list.extend(negative_equivalent)
-        for j in range(7): # Iterates over all base units to simplify temporary_unit_list.
-            while positive_numerator_symbols[j] in temporary_unit_list and negative_numerator_symbols[j] in temporary_unit_list:
-                temporary_unit_list.remove(positive_numerator_symbols[j])
-                temporary_unit_list.remove(negative_numerator_symbols[j])
-    for i in range(len(positive_numerator_symbols)): # Searches current_unit_list for base units and adds the count to the respective list.
-        positive_numerator_list.append(temporary_unit_list.count(positive_numerator_symbols[i]))
-        negative_numerator_list.append(temporary_unit_list.count(negative_numerator_symbols[i]))
-        positive_denominator_list.append(temporary_unit_list.count(positive_denominator_symbols[i]))
-        fractional_exponent_to_tuple(positive_numerator_list[i], negative_numerator_list[i], positive_denominator_list[i], "base") # Updates exponent_tuple_array[i].
-        positive_numerator_custom.append(current_unit_list.count(positive_numerator_symbols[i]))
-        negative_numerator_custom.append(current_unit_list.count(negative_numerator_symbols[i]))
-        positive_denominator_custom.append(current_unit_list.count(positive_denominator_symbols[i]))
-        fractional_exponent_to_tuple(positive_numerator_custom[i], negative_numerator_custom[i], positive_denominator_custom[i], "custom") # Updates exponent_tuple_array[i].
-    positive_numerator_custom_array.clear()
-    negative_numerator_custom_array.clear()
-    positive_numerator_custom_array.extend(positive_numerator_custom) # Updates a global list.
-    negative_numerator_custom_array.extend(negative_numerator_custom) # Updates a global list.
-    print() # Optional.
-
-def fractional_exponent_to_tuple(positive_numerator, negative_numerator, positive_denominator, input_list):
-    """ Simplifies the exponent of each unit an populates a list of lists with two elements: the numerator and denominator of each respective exponent. """
-    #print("fractional_exponent_to_tuple():") # Optional.
-    #print(f"positive_numerator: {positive_numerator}\nnegative_numerator: {negative_numerator}\npositive_denominator: {positive_denominator}\ninput_list: {input_list}") # Optional.
-    if positive_numerator: # Returns numerator to be multiplied by the denominator.
-        numerator = Fraction(positive_numerator, 1)
-    elif negative_numerator: # Returns numerator to be multiplied by the denominator.
-        numerator = Fraction(-negative_numerator, 1)
-    else:
-        numerator = Fraction(0, 1)
-    if positive_denominator: # Returns denominator to be multiplied by the numerator.
-        denominator = Fraction(1, positive_denominator+1)
-    else:
-        denominator = Fraction(1, 1)
-    final_numerator, final_denominator = (numerator * denominator).numerator, (numerator * denominator).denominator
-    #print(f"(numerator, denominator): ({numerator}, {denominator})") # Optional.
-    exponent_list = [final_numerator, final_denominator]
-    if input_list == "base":
-        exponent_tuple_array.append(exponent_list)
-    else: # True for "custom".
-        exponent_tuple_array_custom.append(exponent_list)
-
-def name_creator():
-    """ Generates a name for the current unit that may correspond to a database entry in unit_data_finder. """
-    print("name_creator():") # Optional.
-    global exponent_array, exponent_array_custom
-    #print(f"exponent_tuple_array: {exponent_tuple_array}") # Ex=[[0, 1], [0, 1], [0, 1], [0, 1], [3, 2], [0, 1], [0, 1], [0, 1]] for [±numerator, denominator] # Optional.
-    #print(f"exponent_tuple_array_custom: {exponent_tuple_array_custom}") # Ex=[[0, 1], [0, 1], [0, 1], [0, 1], [3, 2], [0, 1], [0, 1], [0, 1]] # Optional.
-    negative_name_list, negative_name_list, exponent_numerator_array, exponent_numerator_custom_array, units_display, counter = [], [], [], [], [], int(0)
-    for i in range(len(exponent_tuple_array)):
-        exponent_numerator_array.append(exponent_tuple_array[i][0])
-    for i in range(len(exponent_tuple_array_custom)):
-        exponent_numerator_custom_array.append(exponent_tuple_array_custom[i][0])
-    if any(exponent_numerator_array) or any(exponent_numerator_custom_array): # False for unity.
-        name_list, positive_name_list, negative_name_list = [], [], [] # Clears unit name and initializes temporary lists.
-        for i in range(len(exponent_tuple_array_custom)): # Cycles through each base and non-base unit in the current list.
-            if len(positive_numerator_symbols) > 8: # Optional. Moves non-base units in front of base units.
-                if i + 8 >= len(positive_numerator_symbols):
-                    i = counter
-                    counter = int(counter) + 1
-                else:
-                    i += 8
-            populate_exponent_codes()
-            if exponent_tuple_array_custom[i] != [0, 1]: # Specifies nonzero exponents. Ex=-2
-                if exponent_tuple_array_custom[i][0] > 0: # Specifies positive exponents. Ex=2
-                    if exponent_tuple_array_custom[i][1] == 1: # Specifies positive integer exponents.
-                        if exponent_tuple_array_custom[i][0] == 1:
-                            units_display.append(positive_numerator_symbols[i])
-                        else:
-                            #print(f"positive_numerator_symbols: {positive_numerator_symbols}) # Optional
-                            #print(exponent_codes: {exponent_codes}\nexponent_tuple_array_custom: {exponent_tuple_array_custom}") # Optional
-                            #print(i) # Optional.
-                            display_unit = positive_numerator_symbols[i] + exponent_codes[exponent_tuple_array_custom[i][0]]
-                            units_display.append(display_unit)
-                    else: # Specifies positive fractional exponents of base units. True if exponent_tuple_array_custom[i][1] != 1.
-                        display_unit = positive_numerator_symbols[i] + exponent_codes[exponent_tuple_array_custom[i][0]]
-                        display_unit = display_unit + "\u141F" + exponent_codes[exponent_tuple_array_custom[i][1]]
-                        units_display.append(display_unit)
-                else: # Specifies negative exponents. Ex=-2
-                    exponent_tuple_array_custom[i][0] *= -1
-                    if exponent_tuple_array_custom[i][1] == 1: # Specifies negative integer exponents.
-                        display_unit = positive_numerator_symbols[i] + "\u207B" + exponent_codes[exponent_tuple_array_custom[i][0]]
-                    else: # Specifies negative fractional exponents of base units. True if exponent_tuple_array_custom[i][1] != 1.
-                        display_unit = positive_numerator_symbols[i] + "\u207B" + exponent_codes[exponent_tuple_array_custom[i][0]]
-                        display_unit = display_unit + "\u141F" + exponent_codes[exponent_tuple_array_custom[i][1]]
-                    units_display.append(display_unit)
-        for i in range(len(exponent_tuple_array)): # Cycles through each base and non-base unit in the current list.
-            if exponent_tuple_array[i] != [0, 1]: # Specifies nonzero exponents. Ex=-2
-                if i < 8: # Specifies base units.
-                    database = unit_names
-                else: # Specifies non-base units.
-                    database = positive_numerator_symbols
-                if exponent_tuple_array[i][0] > 0: # Specifies positive exponents. Ex=2
-                    if exponent_tuple_array[i][1] == 1: # Specifies positive integer exponents.
-                        if exponent_tuple_array[i][0] == 1: # Accounts for all exponents that simplify to [1, 1].
-                            positive_name_list.append(database[i])
-                        else: # Accounts for [X, 1].
-                            if exponent_tuple_array[i][0] == 2:
-                                positive_name_list.append(f"{database[i]}_squared")
-                            elif exponent_tuple_array[i][0] == 3:
-                                positive_name_list.append(f"{database[i]}_cubed")
-                            else:
-                                positive_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}")
-                    else: # Specifies positive fractional exponents of base units. True if exponent_tuple_array[i][1] != 1.
-                        if exponent_tuple_array[i][1] == 2: # Accounts for [X, 2].
-                            if exponent_tuple_array[i][0] == 2:
-                                positive_name_list.append(f"{database[i]}")
-                            elif exponent_tuple_array[i][0] == 4:
-                                positive_name_list.append(f"{database[i]}_squared")
-                            elif exponent_tuple_array[i][0] == 6:
-                                positive_name_list.append(f"{database[i]}_cubed")
-                            else:
-                                positive_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}/2")
-                        elif exponent_tuple_array[i][1] == 3: # Accounts for [X, 3].
-                            if exponent_tuple_array[i][0] == 3:
-                                positive_name_list.append(f"{database[i]}")
-                            elif exponent_tuple_array[i][0] == 6:
-                                positive_name_list.append(f"{database[i]}_squared")
-                            else:
-                                positive_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}/3")
-                        else: # Accounts for [X, Y].
-                            positive_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}/{exponent_tuple_array[i][1]}")
-                    positive_name_list.append("_")
-                else: # Specifies negative exponents. Ex=-2
-                    exponent_tuple_array[i][0] *= -1
-                    if exponent_tuple_array[i][1] == 1: # Specifies negative integer exponents.
-                        if exponent_tuple_array[i][0] == 1: # Accounts for [1, 1].
-                            negative_name_list.append(database[i])
-                        else: # Accounts for [X, 1].
-                            if exponent_tuple_array[i][0] == 2:
-                                negative_name_list.append(f"{database[i]}_squared")
-                            elif exponent_tuple_array[i][0] == 3:
-                                negative_name_list.append(f"{database[i]}_cubed")
-                            else:
-                                negative_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}")
-                    else: # Specifies negative fractional exponents of base units. True if exponent_tuple_array[i][1] != 1.
-                        if exponent_tuple_array[i][1] == 2: # Accounts for [X, 2].
-                            if exponent_tuple_array[i][0] == 2:
-                                negative_name_list.append(f"{database[i]}")
-                            elif exponent_tuple_array[i][0] == 4:
-                                negative_name_list.append(f"{database[i]}_squared")
-                            elif exponent_tuple_array[i][0] == 6:
-                                negative_name_list.append(f"{database[i]}_cubed")
-                            else:
-                                negative_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}/2")
-                        elif exponent_tuple_array[i][1] == 3: # Accounts for [X, 3].
-                            if exponent_tuple_array[i][0] == 3:
-                                negative_name_list.append(f"{database[i]}")
-                            elif exponent_tuple_array[i][0] == 6:
-                                negative_name_list.append(f"{database[i]}_squared")
-                            else:
-                                negative_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}/3") # Adds the unit and exponent placeholder to the current name
-                        else: # Accounts for [X, Y].
-                            negative_name_list.append(f"{database[i]}_{exponent_tuple_array[i][0]}/{exponent_tuple_array[i][1]}")
-                    negative_name_list.append("_")
-        name_list.clear()
-        if negative_name_list:
-            positive_name_list.append("per_")
-        if positive_name_list and negative_name_list: # Adds a trailing underscore if negative exponents are present.
-            name_list.extend(positive_name_list)
-            try:
-                del negative_name_list[-1]
-                name_list.extend(negative_name_list)
-            except:
-                name_list.extend(negative_name_list)
-        elif positive_name_list:
-            del positive_name_list[-1]
-            name_list.extend(positive_name_list)
-        else:
-            try:
-                del negative_name_list[-1]
-                name_list.extend(negative_name_list)
-            except:
-                name_list.extend(negative_name_list)
-        unit_name = "".join(name_list)
-    if not any(exponent_numerator_array):
-        unit_name = "one" # Sets the default value to unity.
-    positive_units_display, negative_units_display = [], [] # Initializes temporary lists to sort units with positive and negative exponents.
-    for i in range(len(units_display)):
-        if "⁻" in units_display[i]:
-            negative_units_display.append(units_display[i])
-        else:
-            positive_units_display.append(units_display[i])
-    units_display.clear()
-    units_display.extend(positive_units_display)
-    units_display.extend(negative_units_display)
-    current_unit_custom.clear()
-    current_unit_custom.extend(units_display)
-    current_unit_consolidated.clear() # Initializes a global list for updating.
-    if units_display: # Verifies that the current unit is not one.
-        current_unit_consolidated.extend(units_display) # Updates a global list.
-    else: # True if the current unit is one.
-        current_unit_consolidated.extend("1") # Updates a global list.
-    current_unit_name.clear()
-    current_unit_name.append(unit_name) # Updates a global list.
-    exponent_array, exponent_array_custom = exponent_tuple_array, exponent_tuple_array_custom # Updates global values.
-    exponent_tuple_array.clear()
-    exponent_tuple_array_custom.clear()
-    print() # Optional.
-    return unit_name
-
-def prefix_finder():
-    """ Called by main_units() to update units_exponents_totals and current_unit_reduced. """
-    print("prefix_finder():") # Optional.
-    global units_exponents_totals
-    #print(f"old units_exponents_totals: {units_exponents_totals}") # Optional.
-    units_exponents_totals.clear() # Initializes list for data collection.
-    current_unit_reduced.clear() # Initializes list for exponent removal.
-    symbols_indexes_exponents, counter = [], 0
-    current_unit_reduced.extend(current_unit_custom[:]) # Initializes list for exponent removal.
-    for i in range(len(current_unit_custom)): # Removes numerical exponents and produces a list of their values. Ex=["m²", "s⁻²"]
-        symbol_index_exponent = [current_unit_custom[i]] # Initializes a list of data. Ex=["m²"]
-        #print(f"current_unit_custom: {current_unit_custom}") # Optional.
-        if "ᐟ" in current_unit_custom[i]:
-            symbol_index_exponent.append(4) # Unknown. Removal seemed to cause an error.
-            symbol_index_exponent.append(1)
-        else:
-            for j in range(len(exponent_symbols)): # Removes numerical exponents. range=10
-                number = current_unit_reduced[i].count(exponent_symbols[j])
-                #print(f"old current_unit_reduced[i]: {current_unit_reduced[i]}") # Optional.
-                current_unit_reduced[i] = current_unit_reduced[i].replace(exponent_symbols[j], "", number)
-                #print(f"new current_unit_reduced[i]: {current_unit_reduced[i]}") # Optional.
-            if current_unit_reduced[i][-1] == "⁻": # Removes minus sign.
-                current_unit_reduced[i] = current_unit_reduced[i].replace("⁻", "")
-                if current_unit_reduced[i] in positive_numerator_symbols:
-                    index = positive_numerator_symbols.index(current_unit_reduced[i])
-                    exponent = negative_numerator_custom_array[index]
-                    symbol_index_exponent.append(index)
-                    symbol_index_exponent.append(exponent)
-            else:
-                if current_unit_reduced[i] in positive_numerator_symbols:
-                    index = positive_numerator_symbols.index(current_unit_reduced[i])
-                    exponent = positive_numerator_custom_array[index] # exponent_tuple_array[index][0]
-                    symbol_index_exponent.append(index)
-                    symbol_index_exponent.append(exponent)
-        symbols_indexes_exponents.append(symbol_index_exponent)
-    #print(f"numerator_value_list: {numerator_value_list}\ndenominator_value_list: {denominator_value_list}") # Optional.
-    for i in range(len(positive_numerator_symbols)): # Finds optimal units with respect to the exponent of each current unit.
-        if len(positive_numerator_symbols) > 8: # Optional. Moves non-base units in front of base units.
-            if i + 8 >= len(positive_numerator_symbols):
-                i = counter
-                counter = int(counter) + 1
-            else:
-                i += 8
-        #print(f"positive_numerator_symbols[i]: {positive_numerator_symbols[i]}") # Optional.
-        for j in range(len(symbols_indexes_exponents)): # The index j corresponds to each unit in symbols_indexes_exponents.
-            if symbols_indexes_exponents[j][1] == i: # Targets units with nonzero exponents. The index i corresponds to a particular unit in positive_numerator_symbols.
-                units_exponent_total = [symbols_indexes_exponents[j][0], positive_numerator_symbols[i], symbols_indexes_exponents[j][2]] # Ex=['s⁻²', 's', 2]
-                if numerator_value_list[i] != 0 and denominator_value_list[i] != 0: # Calculates total value for each unit.
-                    #print(f"negative_numerator_custom_array: {negative_numerator_custom_array}") # Optional.
-                    if negative_numerator_custom_array[i] == 0:
-                        total_value = numerator_value_list[i] / denominator_value_list[i]
-                    else:
-                        total_value = denominator_value_list[i] / numerator_value_list[i]
-                elif numerator_value_list[i] != 0:
-                    total_value = numerator_value_list[i]
-                elif denominator_value_list[i] != 0:
-                    total_value = denominator_value_list[i]
-                else:
-                    total_value = 1
-                units_exponent_total.append(total_value) # Adds the total.  # Ex=['s⁻²', 's', 2, 1000000]
-                units_exponents_totals.append(units_exponent_total)
-            else:
-                continue
-    #print(f"new units_exponents_totals: {units_exponents_totals}") # Optional.
-    print() # Optional.
-
-def units_exponents_totals_to_compound_units_list():
-    """ Looks at units_exponents_totals to determine compound prefixes, output compound_units_list, and update current_value. """
-    print("units_exponents_totals_to_compound_units_list():") # Optional.
-    global current_value, compound_units_list
-    compound_units_list.clear()
-    relative_total = 0
-    for i in range(len(units_exponents_totals)): # Looks through all current units.
-        compound_unit_list = [units_exponents_totals[i][0]] # Adds the unit and associated exponent to a temporary list for compound_units_list.
-        if units_exponents_totals[i][2] != 0: # Prevents a possible error. Might be optional.
-            relative_total = units_exponents_totals[i][3] ** (1 / units_exponents_totals[i][2])
-        if len(str(units_exponents_totals[i][3])) > 12: # Fixes rounding errors for 
-            if str(units_exponents_totals[i][3])[10] == "9" and str(units_exponents_totals[i][3][11]) == "9":
-                units_exponents_totals[i][3] += (units_exponents_totals[i][3] / 100000000000)
-        if (relative_total + (relative_total / 100000000000)) >= (10 ** 24): # True if the unit's value corresponds to that of the repespective prefix.
-            compound_unit_list.append("Y")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 24) ** units_exponents_totals[i][2])
-        elif (10 ** 21) <= (relative_total + (relative_total / 100000000000)) < (10 ** 24):
-            compound_unit_list.append("Z")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 21) ** units_exponents_totals[i][2])
-        elif (10 ** 18) <= (relative_total + (relative_total / 100000000000)) < (10 ** 21):
-            compound_unit_list.append("E")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 18) ** units_exponents_totals[i][2])
-        elif (10 ** 15) <= (relative_total + (relative_total / 100000000000)) < (10 ** 18):
-            compound_unit_list.append("P")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 15) ** units_exponents_totals[i][2])
-        elif (10 ** 12) <= (relative_total + (relative_total / 100000000000)) < (10 ** 15):
-            compound_unit_list.append("T")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 12) ** units_exponents_totals[i][2])
-        elif (10 ** 9) <= (relative_total + (relative_total / 100000000000)) < (10 ** 12):
-            compound_unit_list.append("G")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 9) ** units_exponents_totals[i][2])
-        elif (10 ** 6) <= (relative_total + (relative_total / 100000000000)) < (10 ** 9):
-            compound_unit_list.append("M")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 6) ** units_exponents_totals[i][2])
-        elif (10 ** 3) <= (relative_total + (relative_total / 100000000000)) < (10 ** 6):
-            compound_unit_list.append("k")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 3) ** units_exponents_totals[i][2])
-        elif (10 ** 2) <= (relative_total + (relative_total / 100000000000)) < (10 ** 3):
-            compound_unit_list.append("h")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 2) ** units_exponents_totals[i][2])
-        elif (10 ** 1) <= (relative_total + (relative_total / 100000000000)) < (10 ** 2):
-            compound_unit_list.append("da")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** 1) ** units_exponents_totals[i][2])
-        elif (10 ** -2) < (relative_total - (relative_total / 100000000000)) <= (10 ** -1):
-            compound_unit_list.append("d")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -1) ** units_exponents_totals[i][2])
-        elif (10 ** -3) < (relative_total - (relative_total / 100000000000)) <= (10 ** -2):
-            compound_unit_list.append("c")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -2) ** units_exponents_totals[i][2])
-        elif (10 ** -6) < (relative_total - (relative_total / 100000000000)) <= (10 ** -3):
-            compound_unit_list.append("m")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -3) ** units_exponents_totals[i][2])
-        elif (10 ** -9) < (relative_total - (relative_total / 100000000000)) <= (10 ** -6):
-            compound_unit_list.append("μ")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -6) ** units_exponents_totals[i][2])
-        elif (10 ** -12) < (relative_total - (relative_total / 100000000000)) <= (10 ** -9):
-            compound_unit_list.append("n")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -9) ** units_exponents_totals[i][2])
-        elif (10 ** -15) < (relative_total - (relative_total / 100000000000)) <= (10 ** -12):
-            compound_unit_list.append("p")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -12) ** units_exponents_totals[i][2])
-        elif (10 ** -18) < (relative_total - (relative_total / 100000000000)) <= (10 ** -15):
-            compound_unit_list.append("f")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -15) ** units_exponents_totals[i][2])
-        elif (10 ** -21) < (relative_total - (relative_total / 100000000000)) <= (10 ** -18):
-            compound_unit_list.append("a")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -18) ** units_exponents_totals[i][2])
-        elif (10 ** -24) < (relative_total - (relative_total / 100000000000)) <= (10 ** -21):
-            compound_unit_list.append("z")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -21) ** units_exponents_totals[i][2])
-        elif (10 ** -27) < (relative_total - (relative_total / 100000000000)) <= (10 ** -24):
-            compound_unit_list.append("y")
-            leftover_value = units_exponents_totals[i][3] / ((10 ** -24) ** units_exponents_totals[i][2])
-        else: # True if units_exponents_totals[i][3] is in the interval (10², 10⁻²).
-            compound_unit_list.append("")
-            leftover_value = units_exponents_totals[i][3]
-        if len(str(leftover_value)) > 12:
-            if str(leftover_value)[10] == "9" and str(leftover_value)[11] == "9":
-                leftover_value += (leftover_value / 100000000000)
-        if "⁻" in units_exponents_totals[i][0]: # Updates the global value for a negative exponent.
-            current_value /= leftover_value
-        else: # Updates the global value for a positive exponent.
-            current_value *= leftover_value # Sometimes results in unnecessarily long floating decimal values.
-        compound_units_list.append(compound_unit_list) # Adds the current unit data to compound_units_list.
-        #print(f"original value: {units_exponents_totals[i][3]}\nleftover_value: {leftover_value}\ncurrent_value: {current_value}") # Optional.
-    #print(f"compound_units_list: {compound_units_list}\n") # Optional.
-    print() # Optional.
-
-def current_unit_custom_to_significand_order_units():
-    """ Looks at compound_units_list and current_value to output significand_order_units. """
-    print("current_unit_custom_to_significand_order_units():") # Optional.
-    global significand_order_units, compound_units_list, current_value
-    significand, order = 1, 1 # Initializes values.
-    if len(str(current_value)) > 12: # Accounts for rounding errors.
-            if str(current_value)[10] == "9" and str(current_value)[11] == "9":
-                current_value += (current_value / 100000000000)
-    if 0.99999 <= current_value <= 1.00001: # True if the value is approximately 1.
-        for i in range(40): # Increase this range for larger exponents/orders.
-            next = current_value * (10 ** (i + 1))
-            if next >= 10:
-                order = 10 ** (-i)
-                break
-        significand = current_value / order
-    elif current_value < 0.99999:
-        for i in range(40):
-            next = current_value * (10 ** (i + 1))
-            if next > 0.99999:
-                order = 10 ** (-(i + 1))
-                break
-            else:
-                continue
-        significand = current_value / order
-    else:
-        for i in range(40):
-            next = current_value / (10 ** i)
-            if next < 10:
-                order = 10 ** i
-                break
-            else:
-                continue
-        significand = current_value / order
-    if len(str(significand)) < 5:
-        significand += 0.001
-    elif str(significand)[4] == "5" or str(significand)[4] == "6" or str(significand)[4] == "7" or str(significand)[4] == "8" or str(significand)[4] == "9":
-        significand += 0.01 # Rounds up to the nearest hundredth.
-    significand = str(significand)[0] + str(significand)[1] + str(significand)[2] + str(significand)[3]
-    if significand == "1" or significand == "1.0" or significand == "1.00": # True for unity and approximate unity.
-        significand = ""
-    significand_order_units = [significand, order, compound_units_list]
-    #print(f"significand_order_units: {significand_order_units}") # Optional.
-    print()  # Optional.
-
-def significand_order_units_to_current_display():
-    """ Writes the current value in scientific notation and attaches current prefixes to their respective units. """
-    print("significand_order_units_to_current_display():") # Optional.
-    global significand_order_units, current_display
-    current_display.clear()
-    print(f"significand_order_units: {significand_order_units}")
-    significand, order, units = significand_order_units[0], significand_order_units[1], significand_order_units[2]
-    total_value = "" # Initializes a temporary value for current_display[0].
-    if significand != "": # True when the significand is not 1.
-        #print(f"significand: {significand}") # Optional.
-        if significand[2] == "0" and significand[3] == "0": # Simplifies integer significands.
-            total_value += significand[0]
-        else:
-            total_value += significand # Adds the significand to the temporary string.
-    if order >= 1: # Calculates a positive exponent.
-        order = str(int(order))
-        exponent = order.count("0")
-        populate_exponent_codes()
-        print(f"order: {order}")
-        if exponent == 0: # True if the order is 1.
-            total_value += "" # Adds nothing to the temporary string.
-        else: # Continues looking for the proper exponent.
-            if total_value: # True if the significand is not 1.
-                total_value += "×" # Adds the order to the temporary string.
-            if 2 <= exponent <= 9:
-                for i in range(8):
-                    if exponent == (i+2):
-                        magnitude = "10" + exponent_codes[i+2]
-                        total_value += magnitude
-            elif 10 <= exponent <= 19:
-                for i in range(10):
-                    if exponent == (i+10):
-                        magnitude = "10" + exponent_codes[1] + exponent_codes[i]
-                        total_value += magnitude
-            elif 20 <= exponent <= 29:
-                for i in range(10):
-                    if exponent == (i+20):
-                        magnitude = "10" + exponent_codes[2] + exponent_codes[i]
-                        total_value += magnitude
-            elif 30 <= exponent <= 39:
-                for i in range(10):
-                    if exponent ==  (i+30):
-                        magnitude = "10" + exponent_codes[3] + exponent_codes[i]
-                        total_value += magnitude
-            elif 40 <= exponent <= 49: # Include another elif to increase exponent limit.
-                for i in range(10):
-                    if exponent ==  (i+40):
-                        magnitude = "10" + exponent_codes[4] + exponent_codes[i]
-                        total_value += magnitude
-            else:
-                total_value += "10"
-    else: # Calculates a negative exponent.
-        order = str(order)
-        if "e" in order: # Accounts for "#e-#" notation.
-            if order[-2] == "0":
-                exponent = int(order[-1])
-            else:
-                exponent = int(order[-2] + order[-1])
-        else:
-            exponent = order.count("0")
-        #print(f"exponent: {exponent}") # Optional.
-        exponent_ranges = {
-            range(2, 10): "10⁻{}",
-            range(10, 20): "10⁻{}{}",
-            range(20, 30): "10⁻{}{}",
-            range(30, 40): "10⁻{}{}",
-            range(40, 50): "10⁻{}{}"}
-        for exponent_range, magnitude_template in exponent_ranges.items():
-            if exponent in exponent_range:
-                if total_value and exponent_range.start > 2:
-                    total_value += "×"
-                if exponent_range.start > 10:
-                    magnitude = magnitude_template.format(exponent_codes[1], exponent_codes[exponent-exponent_range.start])
-                else:
-                    magnitude = magnitude_template.format(exponent_codes[exponent-exponent_range.start])
-                total_value += magnitude
-                break
-        else:
-            if exponent == 0:
-                total_value += ""
-            else:
-                total_value += "10⁻¹"
-    #print(f"total_value: {total_value}") # Optional.
-    current_display.append(total_value) # Adds the current numerical value in scientific notation.
-    for i in range(len(units)):
-        unit = units[i][1] + units[i][0]
-        current_display.append(unit) # Adds each unit to the list.
-    print() # Optional.
-
 def set_current_display():
     """ Sets the main unit display using nonzero values from current_display. """
-    print("set_current_display():") # Optional.
-    global current_display, display_list
+    units_log.debug("set_current_display()") # Optional.
+    global display_list
+    current_display = engine.current_display
     nonzero_current_display, nonzero_unit_display = [], [] # Initializes lists of nonzero elements of current_display and unit_display.
     display_list, temporary_list = [], [] # Initializes the final display list and a temporary display list.
     if len(current_display) == 0: # Allows for values_button to be toggled at startup.
@@ -887,27 +337,26 @@ def set_current_display():
         else:
             temporary_list = nonzero_current_display
     else: # Hides numerical values.
-        if not current_unit_list:
+        if not engine.exponents:
             temporary_list = ["1"]
         else:
             temporary_list = nonzero_unit_display
     #print(f"temporary_list: {temporary_list}") # Optional.
     for i in range(len(temporary_list)): # Organizes the display.
-        if temporary_list[i][0].isdigit(): # Places numbers first.
+        if is_value(temporary_list[i]): # Places numbers first, including negative values.
             display_list.append(temporary_list[i])
         else:
             if "⁻" not in temporary_list[i]: # Places units with positive exponents second.
                 display_list.append(temporary_list[i])
     for i in range(len(temporary_list)):
-        if not temporary_list[i][0].isdigit(): # Places units with negative exponents third.
+        if not is_value(temporary_list[i]): # Places units with negative exponents third.
             if "⁻" in temporary_list[i]:
                 display_list.append(temporary_list[i])
     display.set(display_list)
-    print() # Optional.
 
 def display_trigger(event):
     """ Sends the units in the current display to the textbox in the lower subframe. Called by clicking inside the display frame. """
-    print("display_trigger():\n") # Optional.
+    units_log.debug("display_trigger()") # Optional.
     global textbox_index
     if textbox_index == 1:
         textbox = textbox_1
@@ -926,19 +375,26 @@ def display_trigger(event):
 
 def conversions_trigger():
     """ Called when conversions_button is pressed. Copies data from the current unit to the textbox. """
-    print("conversions_trigger():\n") # Optional.
+    units_log.debug("conversions_trigger()") # Optional.
     if conversions_text.get().strip():
-        unit_data_finder(current_unit_name[0], 1)
+        unit_data_finder(engine.current_unit_name[0], 1)
 
 def quantities_trigger():
-    """ Called when quantities_button is pressed. Copies data from the current unit to the textbox. """
-    print("quantities_trigger():\n") # Optional.
-    if quantities_text.get().strip():
-        unit_data_finder(current_unit_name[0], 2)
+    """ Called when quantities_button is pressed. Copies the Symbol Manager entries with the same dimensions as the current unit to the textbox,
+        or the saved Related Quantities text if there are none. Ex="energy (E), work (W), heat (Q)" """
+    units_log.debug("quantities_trigger()") # Optional.
+    related = dimension_index.related_to_current() if engine.exponents else [] # Ex=['energy', 'work', 'heat']
+    if related:
+        textbox = (textbox_1, textbox_2, textbox_3)[textbox_index-1]
+        if textbox.get('-1.0', 'end') != "\n":
+            textbox.insert('end', "\n")
+        textbox.insert('end', ", ".join(name if notation_database_dictionary[name][0] == "0" else f"{name} ({notation_database_dictionary[name][0]})" for name in related))
+    elif quantities_text.get().strip():
+        unit_data_finder(engine.current_unit_name[0], 2)
 
 def values_toggle():
     """ Called when values_button is pressed. Shows numerical data from current_display. """
-    print("values_toggle():\n") # Optional.
+    units_log.debug("values_toggle()") # Optional.
     if values_button.config('relief')[-1] == 'sunken':
         values_button.config(relief="raised")
     else:
@@ -946,97 +402,29 @@ def values_toggle():
     set_current_display()
 
 def invert():
-    """ Sets current_unit_list to its multiplicative inverse. """
-    print("invert():\n") # Optional.
-    global current_value
-    invert_current_unit_list = []
-    for i in range(len(negative_numerator_symbols)):
-        for j in range(len(current_unit_list)):
-            if current_unit_list[j] == negative_numerator_symbols[i]:
-                invert_current_unit_list.append(positive_numerator_symbols[i])
-    for i in range(len(positive_numerator_symbols)):
-        for j in range(len(current_unit_list)):
-            if current_unit_list[j] == positive_numerator_symbols[i]:
-                invert_current_unit_list.append(negative_numerator_symbols[i])
-    for i in range(len(current_unit_list)):
-        if current_unit_list[i][0] == "_":
-            invert_current_unit_list.append(current_unit_list[i])
-            positive_unit, negative_unit = current_unit_list[i].replace("_", ""), current_unit_list[i].replace("-", "")
-            if (positive_unit not in current_unit_list) and (negative_unit not in current_unit_list):
-                invert_current_unit_list.append(negative_unit)
-    current_unit_list.clear()
-    current_unit_list.extend(invert_current_unit_list)
-    current_value = current_value ** -1
+    """ Sets the current set of units to its multiplicative inverse. """
+    units_log.debug("invert()") # Optional.
+    engine.invert()
     main_units()
 
 def clear():
-    """ Clears current_unit_list, current_display, numerator_value_list, denominator_value_list, and current_value. """
-    print("clear():\n") # Optional.    
-    global current_value
-    current_unit_list.clear()
-    current_display.clear()
-    for i in range(len(numerator_value_list)):
-        numerator_value_list[i] *= 0
-    for i in range(len(denominator_value_list)):
-        denominator_value_list[i] *= 0
-    current_value = 1
+    """ Clears the current set of units, current_display, prefix values, and current_value. """
+    units_log.debug("clear()") # Optional.
+    engine.clear()
     fraction_set(True)
     prefix_toggle()
     main_units()
 
 def favorites_trigger(csv_units):
-    """ Called whenever a saved favorite is toggled. Updates current_unit_list, positive_numerator_symbols, negative_numerator_symbols, numerator_value_list, and 
-        denominator_value_list and increments entry_unit_index. Ex_csv_units=['m⁻¹', '-mi', '0;0;0;0;0;0;0;0;1;0', '0;0;0;0;0;0;0;0;0;0', '1.0']"""
-    print("favorites_trigger():") # Optional.
-    #print(f"old positive_numerator_symbols: {positive_numerator_symbols}\nold negative_numerator_symbols: {negative_numerator_symbols}") # Optional.
-    global entry_unit_index, current_value, numerator_value_list, denominator_value_list
-    del csv_units[0] # Removes the string of combined units.
-    for i in range(len(csv_units)-3):# Adds non-base units to the global list of units.
-        if (csv_units[i] not in positive_numerator_symbols) and (csv_units[i] not in negative_numerator_symbols) and (csv_units[i] not in positive_denominator_symbols):
-            if csv_units[i][0] == "-": # Removes the negative symbol and adds the new unit positive_numerator_symbols and negative_numerator_symbols.
-                temporary_positive_numerator_symbol = csv_units[i].replace("-", "")
-                temporary_negative_numerator_symbol = csv_units[i]
-                temporary_positive_denominator_symbol = "_" + temporary_positive_numerator_symbol
-            else: # Adds the new unit to positive_numerator_symbols and negative_numerator_symbols.
-                temporary_positive_numerator_symbol = csv_units[i]
-                temporary_negative_numerator_symbol = "-" + temporary_positive_numerator_symbol
-                temporary_positive_denominator_symbol = "_" + temporary_positive_numerator_symbol
-            positive_numerator_symbols.append(temporary_positive_numerator_symbol)
-            negative_numerator_symbols.append(temporary_negative_numerator_symbol)
-            positive_denominator_symbols.append(temporary_positive_denominator_symbol)
-            numerator_value_list.append(0) # Lengthens numerator_value_list by one element.
-            denominator_value_list.append(0) # Lengthens denominator_value_list by one element.
-            entry_unit_index += 1 # Keeps track of the index of non-base units.
-    current_value = float(csv_units[-1]) # Loads the saved numerical value.
-    del csv_units[-1] # Removes the numerical value from the saved list.
-    numerator_value_list.clear() # Initializes the numerator prefix values for loading.
-    new_numerator_list = csv_units[-1].split(';') # Generates a list of strings that correspond to each  prefix value in the numerator.
-    for i in range(len(new_numerator_list)):
-        if 0 <= float(new_numerator_list[i]) < 1 and float(new_numerator_list[i]) != 0.0:
-            numerator_value_list.append(float(new_numerator_list[i]))
-        else:
-            numerator_value_list.append(int(new_numerator_list[i]))
-    del csv_units[-1]
-    denominator_value_list.clear() # Initializes the denominator prefix values for loading.
-    new_denominator_list = csv_units[-1].split(';')
-    for i in range(len(new_denominator_list)):
-        if 0 <= float(new_denominator_list[i]) < 1 and float(new_denominator_list[i]) != 0.0:
-            denominator_value_list.append(float(new_denominator_list[i]))
-        else:
-            denominator_value_list.append(int(new_denominator_list[i]))
-    del csv_units[-1]
-    while len(numerator_value_list) < len(positive_numerator_symbols):
-        numerator_value_list.append(0)
-        denominator_value_list.append(0)
-    current_unit_list.clear() # Initializes the curent unit list for updating.
-    current_unit_list.extend(csv_units) # Adds each saved unit to the current list.
-    #print(f"new positive_numerator_symbols: {positive_numerator_symbols}\nnew negative_numerator_symbols: {negative_numerator_symbols}") # Optional.
-    print() # Optional.
+    """ Called whenever a saved favorite is toggled. Loads the saved units, prefix values, and value into engine.
+        Ex_csv_units=['m⁻¹', '-mi', '0;0;0;0;0;0;0;0;1;0', '0;0;0;0;0;0;0;0;0;0', '1.0']"""
+    units_log.debug("favorites_trigger()") # Optional.
+    engine.load_favorite(csv_units)
     main_units()
 
 def favorites_update():
     """ Converts an existing text file to a global list of saved favorites, loads saved favorites, and calls favorites_buttons. """
-    print("favorites_update():") # Optional.
+    io_log.debug("favorites_update()") # Optional.
     favorites_read = open('database_favorites.txt', 'r', encoding='utf-8') # Loads previous favorites from a text file.
     favorites_saved = favorites_read.readlines() # Produces a list of previous favorites.
     favorites_read = open('database_favorites.txt', 'w', encoding='utf-8') # Loads previous favorites for updating.
@@ -1044,43 +432,27 @@ def favorites_update():
     for save in favorites_saved: # Adds previous favorites to the global list as comma-separated values.
         units_saved = save.strip()
         favorites_list.append(units_saved)
-    unit_consolidated = "⸱".join(current_unit_consolidated) # Converts the current unit for display.
-    while len(numerator_value_list) < 15:
-        numerator_value_list.append(0)
-    while len(denominator_value_list) < 15:
-        denominator_value_list.append(0)
-    numerator_prefixes = ";".join([str(int) for int in numerator_value_list]) # Initializes the prefix values for saving.
-    denominator_prefixes = ";".join([str(int) for int in denominator_value_list]) # Initializes the prefix values for saving.
-    if current_unit_list: # True if the current unit is not one.
-        if not unit_consolidated: # Produces a list of comma-separated values to be saved.
-            unit_consolidated = "1"
-            csv_unit_saved = f"{unit_consolidated}, {current_unit_list[0]}, {denominator_prefixes}, {numerator_prefixes}, {float(current_value)}"
-        else: # Produces a list of comma-separated values to be saved.
-            csv_unit_list = ", ".join(current_unit_list)
-            csv_unit_saved = f"{unit_consolidated}, {csv_unit_list}, {denominator_prefixes}, {numerator_prefixes}, {float(current_value)}"
-    if not current_unit_list: # True if the current unit is one.
-        if not current_display: # True at startup.
-            csv_unit_saved = ""
-        else:
-            csv_unit_saved = f"1, {denominator_prefixes}, {numerator_prefixes}, {float(current_value)}"
-    if csv_unit_saved in favorites_list: # Checks if the current unit is already in favorites.
-        favorites_list.remove(csv_unit_saved) # Removes current unit from the global list.
-        print(f"Favorite removed: {unit_consolidated}") # Optional.
+    unit_consolidated = "⸱".join(engine.current_unit_consolidated) # Converts the current unit for display.
+    csv_unit_saved = engine.favorite_string() # Produces a list of comma-separated values to be saved. Empty at startup.
+    saved_key = favorite_key(csv_unit_saved)
+    saved_matches = [save for save in favorites_list if favorite_key(save) == saved_key] # Ignores the order of the saved unit symbols.
+    if saved_matches: # Checks if the current unit is already in favorites.
+        favorites_list.remove(saved_matches[0]) # Removes current unit from the global list.
+        io_log.info("Favorite removed: %s", unit_consolidated) # Optional.
     else: # Adds current unit to the global list.
         if csv_unit_saved: # False at startup.
             favorites_list.append(csv_unit_saved)
-            print(f"Favorite added: {unit_consolidated}") # Optional.
+            io_log.info("Favorite added: %s", unit_consolidated) # Optional.
     for save in favorites_list: # Updates the text file.
         print(save, file=favorites_read)
     favorites_read.close() # Closes the updated text file.
     favorites.delete('1.0', 'end') # Prepares the favorites frame for updating.
     #favorites.insert('end', favorites_list) # Adds text to the favorites frame.
-    print() # Optional.
     favorites_buttons() # Updates the favorites frame.
 
 def favorites_buttons():
     """ Populates a horizontal list of buttons that correspond to saved units. """
-    print(f"favorites_buttons():") # Optional.
+    units_log.debug("favorites_buttons()") # Optional.
     for button in favorites.place_slaves(): # Prepares the favorites display for updating.
         button.place_forget() # Removes all prior buttons.
     button_0, button_1, button_2, button_3 = tk.StringVar(), tk.StringVar(), tk.StringVar(), tk.StringVar() # Initializes button labels.
@@ -1136,7 +508,7 @@ def favorites_buttons():
     favorite_button_15.bind('<Enter>', partial(font_config, favorite_button_15, f'Cambria {small_text} bold')) # Optional font automation.
     favorite_button_15.bind('<Leave>', partial(font_config, favorite_button_15, f'Cambria {small_text}')) # Optional font automation.
     if len(favorites_list) == 0:
-        print("No favorites saved.") # Optional.
+        units_log.debug("No favorites saved.") # Optional.
     if len(favorites_list) >= 1:
         csv_units = favorites_list[0].split(", ") # Specifies button_0 for labelling.
         button_0.set(csv_units[0]) # Sets unit_consolidated as the label of button_0.
@@ -1218,14 +590,11 @@ def favorites_buttons():
         favorite_button_15.place(relx=0, rely=0, relwidth=0.15, relheight=0.3) # Places a defined button in favorites_frame.
         favorites.window_create('end', window=favorite_button_15) # Places the button in the favorites Text module.
     if len(favorites_list) > 17:
-        print("Favorites full! Implement more memory to continue.") # Optional.
-    print() # Optional.
-    if current_database_list: # False at startup.
-        print("-"*98) # Optional.
+        units_log.warning("Favorites full! Implement more memory to continue.") # Optional.
 
 def prefix_toggle(prefix=""):
     """ Toggles the selected prefix and unselects all others. """
-    print("prefix_toggle():\n") # Optional.
+    units_log.debug("prefix_toggle()") # Optional.
     prefix_button_dict = {
         "Y": prefix_Y_button,
         "Z": prefix_Z_button,
@@ -1254,85 +623,45 @@ def prefix_toggle(prefix=""):
         else:
             button.config(relief="raised")
 
+def selected_prefix():
+    """ Returns the symbol of the prefix button in the "on" position, or an empty string if none is on. Ex="k" """
+    for symbol, button in (("Y", prefix_Y_button), ("Z", prefix_Z_button), ("E", prefix_E_button), ("P", prefix_P_button), ("T", prefix_T_button), ("G", prefix_G_button),
+            ("M", prefix_M_button), ("k", prefix_k_button), ("h", prefix_h_button), ("da", prefix_da_button), ("d", prefix_d_button), ("c", prefix_c_button), ("m", prefix_m_button),
+            ("μ", prefix_u_button), ("n", prefix_n_button), ("p", prefix_p_button), ("f", prefix_f_button), ("a", prefix_a_button), ("z", prefix_z_button), ("y", prefix_y_button)):
+        if button.config('relief')[-1] == 'sunken':
+            return symbol
+    return ""
+
 def prefix_value_tuple(button_index):
-    """ Checks the state of each prefix button and returns the symbol and associated value that corresponds to the button in the "on" position. """
+    """ Checks the state of each prefix button and returns the value of the button in the "on" position. The value is an exact power of ten in exact mode, and grams in the
+        SI/ISO database carry a further factor of 1000, as kilograms are the base unit of mass. Ex=1000000, or Fraction(1, 1000000) for "μ" in exact mode """
     #print("prefix_value_tuple():\n") # Optional.
+    symbol = selected_prefix()
+    power = prefix_powers[symbol] if symbol else 0 # Ex=-6 for "μ"
     if button_index == 2 and current_database_file == "database_iso.txt":
-        kilogram_toggle = 1000
-    else:
-        kilogram_toggle = 1
-    if prefix_Y_button.config('relief')[-1] == 'sunken':
-        return (1000000000000000000000000*kilogram_toggle) # "Y"
-    elif prefix_Z_button.config('relief')[-1] == 'sunken':
-        return (1000000000000000000000*kilogram_toggle) # "Z"
-    elif prefix_E_button.config('relief')[-1] == 'sunken':
-        return (1000000000000000000*kilogram_toggle) # "E"
-    elif prefix_P_button.config('relief')[-1] == 'sunken':
-        return (1000000000000000*kilogram_toggle) # "P"
-    elif prefix_T_button.config('relief')[-1] == 'sunken':
-        return (1000000000000*kilogram_toggle) # "T"
-    elif prefix_G_button.config('relief')[-1] == 'sunken':
-        return (1000000000*kilogram_toggle) # "G"
-    elif prefix_M_button.config('relief')[-1] == 'sunken':
-        return (1000000*kilogram_toggle) # "M"
-    elif prefix_k_button.config('relief')[-1] == 'sunken':
-        return (1000*kilogram_toggle) # "k"
-    elif prefix_h_button.config('relief')[-1] == 'sunken':
-        return (100*kilogram_toggle) # "h"
-    elif prefix_da_button.config('relief')[-1] == 'sunken':
-        return (10*kilogram_toggle) # "da"
-    elif prefix_d_button.config('relief')[-1] == 'sunken':
-        return (0.1*kilogram_toggle) # "d"
-    elif prefix_c_button.config('relief')[-1] == 'sunken':
-        return (0.01*kilogram_toggle) # "c"
-    elif prefix_m_button.config('relief')[-1] == 'sunken':
-        return (0.001*kilogram_toggle) # "m"
-    elif prefix_u_button.config('relief')[-1] == 'sunken':
-        return (0.000001*kilogram_toggle) # "μ"
-    elif prefix_n_button.config('relief')[-1] == 'sunken':
-        return (0.000000001*kilogram_toggle) # "n 
-    elif prefix_p_button.config('relief')[-1] == 'sunken':
-        return (0.000000000001*kilogram_toggle) # "p"
-    elif prefix_f_button.config('relief')[-1] == 'sunken':
-        return (0.000000000000001*kilogram_toggle) # "f"
-    elif prefix_a_button.config('relief')[-1] == 'sunken':
-        return (0.000000000000000001*kilogram_toggle) # "a"
-    elif prefix_z_button.config('relief')[-1] == 'sunken':
-        return (0.000000000000000000001*kilogram_toggle) # "z"
-    elif prefix_y_button.config('relief')[-1] == 'sunken':
-        return (0.000000000000000000000001*kilogram_toggle) # "y"
-    else:
-        return (kilogram_toggle)
-
-def entry_data_finder(unit_symbol):
-    """ Searches for data corresponding to the current non-base unit and sends that data to consolidate_current_unit_list. Ex=["cd", "-m", "-m"] """
-    global conversion_database
-    if unit_symbol in conversion_database: # Returns a list of equivalent base units.
-        return conversion_database[unit_symbol][0]
-    else: # Returns zero if no data is found.
-        print(f"No data found for {unit_symbol}.\n") # Optional.
-        return 0
+        power += 3 # Kilograms.
+    return power_of_ten(power, engine.exact)
 
 def unit_data_finder(unit_name, x=0):
     """ Searches for data corresponding to the current unit and sends that data to the quantities and conversions frames. """
-    global unit_database
     if textbox_index == 1:
         textbox = textbox_1
     elif textbox_index == 2:
         textbox = textbox_2
     elif textbox_index == 3:
         textbox = textbox_3
-    if unit_name in unit_database: # Updates conversions and quantities display.
+    unit_data = engine.unit_data(unit_name) # Ex=['<conversions>', '<quantities>']
+    if unit_data is not None: # Updates conversions and quantities display.
         conversions.delete(0, 'end')
-        conversions.insert(0, unit_database[unit_name][0])
+        conversions.insert(0, unit_data[0])
         quantities.delete(0, 'end')
-        quantities.insert(0, unit_database[unit_name][1])
+        quantities.insert(0, unit_data[1])
         if x != 0 and textbox.get('-1.0', 'end') != "\n":
             textbox.insert('end', "\n")
         if x == 1: # True when triggered by conversions_button.
-            textbox.insert('end', unit_database[unit_name][0])
+            textbox.insert('end', unit_data[0])
         elif x == 2: # True when triggered by quantities_button.
-            textbox.insert('end', unit_database[unit_name][1])
+            textbox.insert('end', unit_data[1])
     else: # True if no unit data is found.
         conversions.delete(0, 'end')
         quantities.delete(0, 'end')
@@ -1397,82 +726,15 @@ def window_size(resize=False):
 def prefix_to_value(convert_to_base=False):
     """ Converts all prefixes to their numerical equivalent and multiplies the current value by each, then removes the prefixes from the numerator and denominator lists. 
         Called by convert_to_base() or convert_button. units_exponents_totals=[['s²', 's', 2, 2], ['eV', 'eV', 1, 1000000]] """
-    print("prefix_to_value():") # Optional.
-    global current_value
-    for i in range(len(units_exponents_totals)):
-        if units_exponents_totals[i][1] == "g" and current_database_file == "database_iso.txt":
-            value = 1000 ** units_exponents_totals[i][2]
-            current_value *= (units_exponents_totals[i][-1] / value)
-        elif units_exponents_totals[i][1] == "-g" and current_database_file == "database_iso.txt":
-            value = 1000 ** -(units_exponents_totals[i][2])
-            current_value /= (units_exponents_totals[i][-1] / value)
-        else:
-            if "⁻" not in units_exponents_totals[i][0]: # Handles numerators.
-                current_value *= units_exponents_totals[i][-1]
-            else: # Handles denominators.
-                current_value /= units_exponents_totals[i][-1]
-    for i in range(len(numerator_value_list)):
-        if i == 2 and current_database_file == "database_iso.txt" and numerator_value_list[i]:
-            numerator_value_list[i] = value
-        elif i == 2 and current_database_file == "database_iso.txt" and denominator_value_list[i]:
-            denominator_value_list[i] = value
-        else:
-            if numerator_value_list[i]:
-                numerator_value_list[i] = 1
-            if denominator_value_list[i]:
-                denominator_value_list[i] = 1
+    units_log.debug("prefix_to_value()") # Optional.
+    engine.prefix_to_value(current_database_file == "database_iso.txt")
     if not convert_to_base:
-        print() # Optional.
         main_units()
     
 def convert_to_base():
     """ Converts any non-base units to base units. Calls prefix_to_value before converting non-base units. current_unit_list=['m', 'm', '-s', '-s'] """
-    print("convert_to_base():\n") #  Optional.
-    global current_value, current_unit_list, numerator_value_list, denominator_value_list
-    prefix_to_value(True) # Merges all prefixes with the current value.
-    temp_unit_list = current_unit_list[:] # Creates a copy of the current base and non-base units.
-    convert = False
-    for i in range(len(current_unit_list)):
-        if current_unit_list[i] in conversion_database: # Converts non-base units in the current unit list to base units.
-            if current_unit_list[i] == "A" and current_database_file == "database_iso.txt":
-                continue
-            else:
-                convert = True
-                temp_unit_list.remove(current_unit_list[i]) # Removes the non-base unit from the global list.
-                temp_unit_list.extend(conversion_database[current_unit_list[i]][0]) # Adds the equivalent base units to the global list.
-                for j in range(len(positive_numerator_symbols)): # Simplifies the global list.
-                    while positive_numerator_symbols[j] in temp_unit_list and negative_numerator_symbols[j] in temp_unit_list:
-                        temp_unit_list.remove(positive_numerator_symbols[j])
-                        temp_unit_list.remove(negative_numerator_symbols[j])
-                current_value *= conversion_database[current_unit_list[i]][1]
-    current_unit_list = temp_unit_list 
-    if current_database_file == "database_iso.txt" and convert: # convert_to_si()
-        print() # Optional.
-        main_units()
-        print(f"convert_to_base():") # Optional.
-        numerator_value_list[2] += (1000 ** current_unit_list.count("g"))
-        denominator_value_list[2] += (1000 ** current_unit_list.count("-g"))
-        current_value /= (1000 ** current_unit_list.count("g"))
-        current_value *= (1000 ** current_unit_list.count("-g"))
-        temp_unit_list = current_unit_list[:]
-        for i in range(len(temp_unit_list)):
-            if temp_unit_list[i] == "X": # Change to "C" for ISO variant.
-                temp_unit_list.remove("C")
-                if "-s" in temp_unit_list:
-                    temp_unit_list.remove("-s")
-                else:
-                    temp_unit_list.append("s")
-                temp_unit_list.append("A")
-            elif temp_unit_list[i] == "-X": # Change to "C" for ISO variant.
-                temp_unit_list.remove("-C")
-                if "-s" in temp_unit_list:
-                    temp_unit_list.remove("s")
-                else:
-                    temp_unit_list.append("-s")
-                temp_unit_list.append("-A")
-        current_unit_list = temp_unit_list 
-        #print(f"current_unit_list: {current_unit_list}") # Optional.
-    print() # Optional.
+    units_log.debug("convert_to_base()") # Optional.
+    engine.convert_to_base(current_database_file == "database_iso.txt")
     main_units()
 
 def font_config(widget, fontslant, event):
@@ -1500,6 +762,7 @@ def raise_frame():
         application = "Symbol Manager"
         application_index += 1
     else:
+        load_graphing() # Waits for matplotlib, if it is still being imported.
         graphing_calculator_entry.tkraise()
         graphing_calculator.tkraise()
         application = "Graphing Calculator"
@@ -1511,66 +774,189 @@ def raise_frame():
     root.title(f"Coalexicon | {application} | {database}")
     sleep(0.01) # Optional.
 
-def main_symbols():
-    """ Called to update the Symbol Manager entry cells. """
-    print(f"main_symbols():\n") # Optional.
+def main_symbols(keep_position=False):
+    """ Called to update the Symbol Manager entry cells. Setting keep_position keeps the current rows in view, as after saving. """
+    symbols_log.debug("main_symbols()") # Optional.
     set_current_database_list()
-    populate_cells()
-    print() # Optional.
-    print("-"*98) # Optional.
-
-def load_symbols(database='database_clx.txt'):
-    """ Converts an existing text file to a global dictionary of saved values. ={"} """
-    print("load_symbols():") # Optional.
-    global notation_database_dictionary, notation_database_list, notation_database_quantities, notation_database_constants, notation_database_modifiers, notation_database_other
+    populate_cells(keep_position)
+
+def read_symbols(database='database_clx.txt'):
+    """ Reads a symbol database without changing the global dictionary. Safe to call from a background thread unless the SQLite backend is on. """
+    with stage_timer.stage("load_symbols"):
+        if storage:
+            return storage.load_symbols(database)
+        return load_symbol_database(database) # Reads the binary snapshot of the file if it has not changed. Ex={"distance": ['d', '0', 'l;s;r', 'm', '0', 'quantity']}
+
+def install_symbols(symbols, names=None, database=None):
+    """ Replaces the global symbol database and rebuilds its indexes. Called on the Tk thread. A search index built in the background may be given as names.
+        database names the file that was read, which may be saved again if it could not be read before. """
+    global search_index
+    failed_loads.discard(database)
     notation_database_dictionary.clear() # Prepares the global list for updating.
-    notation_database_list.clear() # Prepares the global list for updating.
-    notation_database_quantities.clear() # Prepares the global list for updating.
-    notation_database_constants.clear() # Prepares the global list for updating.
-    notation_database_modifiers.clear() # Prepares the global list for updating.
-    notation_database_other.clear() # Prepares the global list for updating.
-    with open(database, encoding='utf-8') as file:
-        column_list = list(zip(*(line.strip().split('\t') for line in file)))
-    column_names_list = list(column_list[0]) # Produces a list of names from the specified text file.
-    column_data_list = [] # Initializes a list of lists from the specified text file.
-    for i in range(len(column_list)-1): # Produces a list of lists from the specified text file.
-        column_data_list.append(list(column_list[i+1]))
-    for i in range(len(column_names_list)):
-        column_data = [] # Ex=['d', '0', 'l;s;r', 'm']
-        for j in range(len(column_data_list)):
-            column_data.append(column_data_list[j][i])
-        notation_database_dictionary[column_names_list[i]] = column_data
-    notation_database_list = list(notation_database_dictionary.items()) # Produces a list variant of notation_database_dictionary.
-    for i in range(len(notation_database_list)): # Populates notation_database_quantities, notation_database_modifiers, and notation_database_other.
-        if notation_database_list[i][-1][-1] == "quantity": # Produces a list of quantities from notation_database_dictionary.
-            notation_database_quantities.append(notation_database_list[i])
-        elif notation_database_list[i][-1][-1] == "constant": # Produces a list of constants from notation_database_dictionary.
-            notation_database_constants.append(notation_database_list[i])
-        elif notation_database_list[i][-1][-1] == "modifier": # Produces a list of modifiers from notation_database_dictionary.
-            notation_database_modifiers.append(notation_database_list[i])
-        elif notation_database_list[i][-1][-1] == "general": # Produces a list of uncategorized entries from notation_database_dictionary.
-            notation_database_other.append(notation_database_list[i])
+    notation_database_dictionary.update(symbols)
+    with stage_timer.stage("load_symbols: indexes"):
+        symbol_views.build(notation_database_dictionary) # Discards the views of the previous database. Each view is sorted when it is first shown.
+        if names is None:
+            search_index.build(notation_database_dictionary)
+        else:
+            search_index = names
+        dimension_index.build(notation_database_dictionary) # Reads units with engine, so it is built here rather than in the background.
+        if fuzzy_search:
+            build_fuzzy_index()
     #print(f"notation_database_dictionary: {notation_database_dictionary}") # Optional.
-    print() # Optional.
+
+def load_symbols(database='database_clx.txt'):
+    """ Converts an existing text file to a global dictionary of saved values. Ex={"distance": ['d', '0', 'l;s;r', 'm', '0', 'quantity']} """
+    io_log.debug("load_symbols()") # Optional.
+    load_generations["symbols"] += 1 # Discards symbols still being read in the background.
+    try:
+        symbols = read_symbols(database)
+    except Exception as error: # Keeps the previous database, and stops it from being saved over the file.
+        report_load_error(database, error)
+        return
+    install_symbols(symbols, database=database)
+
+def read_databases(database, generations):
+    """ Reads the unit and symbol databases on a background thread and hands them to poll_loading() through load_queue. Units are sent first, so that Unit Manager is ready
+        before the larger symbol database. Nothing here touches Tk or engine. """
+    try:
+        try:
+            load_queue.put(("units", generations["units"], read_units()))
+        except Exception as error: # Reported by poll_loading(). The symbols are still read.
+            load_queue.put(("error", "database_units.txt", error))
+        try:
+            symbols = read_symbols(database)
+            names = TrigramIndex()
+            names.build(symbols)
+            load_queue.put(("symbols", generations["symbols"], (symbols, names, database)))
+        except Exception as error:
+            load_queue.put(("error", database, error))
+    finally:
+        load_queue.put(("done", "read_databases", None))
+
+def read_fuzzy_index(symbols, generation):
+    """ Builds a fuzzy index of a copy of the symbol database on a background thread and hands it to poll_loading() through load_queue. """
+    try:
+        load_queue.put(("fuzzy", generation, FuzzyIndex(symbols)))
+    except Exception as error: # Reported by poll_loading().
+        load_queue.put(("error", "fuzzy index", error))
+    finally:
+        load_queue.put(("done", "read_fuzzy_index", None))
+
+def start_background(target, *args):
+    """ Runs target on a background thread, which reports to load_queue and ends with a "done" report, and starts poll_loading() if it is not already running. """
+    global background_threads, polling
+    threading.Thread(target=target, args=args, name=target.__name__, daemon=True).start()
+    background_threads += 1
+    if not polling:
+        polling = True
+        root.after(poll_interval, poll_loading)
+
+def load_databases():
+    """ Starts reading the databases in the background, so that the window opens without waiting for them. Called at startup.
+        SQLite connections can only be used by the thread that opened them, so the SQLite backend is read here instead. """
+    global databases_loading
+    io_log.debug("load_databases()") # Optional.
+    if storage:
+        load_units()
+        load_symbols(current_database_file)
+        main_symbols()
+        return
+    databases_loading = True
+    start_background(read_databases, current_database_file, dict(load_generations))
+
+def poll_loading():
+    """ Installs the databases read by read_databases() and the fuzzy index built by read_fuzzy_index(), and fills in Symbol Manager once its database has arrived.
+        Runs on the Tk thread until every background thread is done. Errors are received as ("error", <what failed>, error). """
+    global databases_loading, fuzzy_index, fuzzy_building, background_threads, polling
+    while True:
+        try:
+            kind, generation, result = load_queue.get_nowait()
+        except queue.Empty:
+            break
+        if kind == "done":
+            background_threads -= 1
+            if generation == "read_databases":
+                databases_loading = False
+        elif kind == "error":
+            if generation == "fuzzy index":
+                io_log.warning("Cannot build the fuzzy index: %s", result) # Optional.
+                fuzzy_building = False
+            else:
+                report_load_error(generation, result)
+        elif kind == "fuzzy":
+            fuzzy_building = False
+            if generation != load_generations["fuzzy"]: # The database was edited or loaded again while the index was being built.
+                if fuzzy_search:
+                    build_fuzzy_index()
+            elif fuzzy_search:
+                fuzzy_index = result
+                if current_category == "Search": # Repeats the current search, which only matched names.
+                    search_names('', search_text)
+        elif generation != load_generations[kind]: # The database was loaded again while it was being read.
+            io_log.debug("poll_loading(): discarded %s", kind) # Optional.
+        elif kind == "units":
+            install_units(*result)
+            failed_loads.discard("database_units.txt")
+        else:
+            install_symbols(*result)
+            main_symbols()
+    if background_threads:
+        root.after(poll_interval, poll_loading)
+    else:
+        polling = False
+
+def report_load_error(database, error):
+    """ Shows a database file that cannot be read, which is then not saved until it has been loaded. Called on the Tk thread. """
+    io_log.warning("Cannot load %s: %s", database, error) # Optional.
+    failed_loads.add(database)
+    messagebox.showerror("Coalexicon", f"Cannot load {database}: {error}\n\nIt will not be saved until it has been loaded.")
 
 def save_symbols():
-    """ Saves data within the Symbol Manager application. """
-    global current_database_file
-    print("save_symbols():") # Optional.
+    """ Saves data within the Symbol Manager application. The indexes are kept up to date by cell_return(), so the database is not read again. """
+    io_log.debug("save_symbols()") # Optional.
     #print(f"current_database_file: {current_database_file}") # Optional.
-    with open(current_database_file, 'w', encoding='utf-8') as database:
-        for name in notation_database_dictionary: # Assumes notation_database_dictionary.
-            name_and_symbols = f"{name}"
-            for symbol in notation_database_dictionary[name]: # Assumes notation_database_dictionary.
-                name_and_symbols = f"{name_and_symbols}\t{symbol}"
-            print(name_and_symbols, file=database)
-    sleep(0.5) # Optional.
-    print() # Optional.
+    if current_database_file in failed_loads: # Reported as not saved by poll_saving().
+        save_errors.append(current_database_file)
+        return
+    if storage: # Edits have already been written by cell_return().
+        storage.commit()
+        return
+    save_writer.save(current_database_file, {name: list(data) for name, data in notation_database_dictionary.items()}, format_table) # Copies each row, as later edits change the rows in place.
+
+def open_storage():
+    """ Opens storage_file and imports each text file that has not been imported yet or has been changed since storage_file was last written. Called by set_storage() and at startup. """
+    io_log.debug("open_storage()") # Optional.
+    global storage
+    written = os.path.getmtime(storage_file) if os.path.exists(storage_file) else 0 # Read before opening, which may write to the file.
+    storage = SQLiteStorage(storage_file)
+    for database in symbol_files:
+        if os.path.exists(database) and (not storage.has_symbols(database) or os.path.getmtime(database) > written):
+            storage.import_symbols(database)
+    if os.path.exists("database_units.txt") and (not storage.has_units() or os.path.getmtime("database_units.txt") > written):
+        storage.import_units("database_units.txt")
+
+def set_storage(enable):
+    """ Moves the symbol and unit databases into SQLite, or exports them back to the text files and removes storage_file. Called when "sqlite" is entered into the unit entry cell. """
+    io_log.debug("set_storage(%s)", enable) # Optional.
+    global storage
+    if enable and not storage:
+        open_storage()
+    elif not enable and storage:
+        storage.commit() # Keeps edits that have not been saved yet, as the text files would.
+        for database in symbol_files:
+            if storage.has_symbols(database):
+                storage.export_symbols(database)
+        storage.export_units("database_units.txt")
+        storage.close()
+        storage = None
+        os.remove(storage_file) # The text files now hold every edit, and the backend stays off at the next launch.
+    load_units()
     load_symbols(current_database_file)
 
 def change_preset_text(*args):
     """ Loads the specified database and updates related labels and functions. """
-    print(f"change_preset_text():\n") # Optional.
+    symbols_log.debug("change_preset_text()") # Optional.
     global current_database_file
     if preset_text.get() == "CLX":
         current_database_file = "database_clx.txt"
@@ -1597,131 +983,44 @@ def change_preset_text(*args):
 
 def set_current_database_list():
     """ Updates Unit Manager to show entries of the specified category. Ex=[('<Name>', ['<Primary>', '<Secondary>', '<Other>', '<Units>', '<Index>', '<Category>'])]
-        Allows changing the Symbol sorting method from Primary to Index. """
-    print("set_current_database_list():") # Optional.
+        Allows changing the Symbol sorting method from Primary to Index. Each combination of category and sorting method is sorted once and kept until an edit changes its order. """
+    symbols_log.debug("set_current_database_list()") # Optional.
     global current_database_list
-    if current_category == "All" or current_category == "All *":
-        current_database_list = notation_database_list
-    elif current_category == "Quantities":
-        current_database_list = notation_database_quantities
-    elif current_category == "Constants":
-        current_database_list = notation_database_constants
-    elif current_category == "Modifiers":
-        current_database_list = notation_database_modifiers
-    elif current_category == "Other":
-        current_database_list = notation_database_other
-    elif current_category == "Search":
-        current_database_list = notation_database_search
-    if current_sort == "Name" or current_sort == "Name *":
-        current_database_list.sort()
-    elif current_sort == "Symbol":
-        if index_type == "Primary":
-            current_database_list.sort(key=lambda x: x[1][0])
-        elif index_type == "Secondary":
-            current_database_list.sort(key=lambda x: x[1][1])
-        else:
-            current_database_list.sort(key=lambda x: x[1][0]) # Use x[1][-2] for Index or x[1][0] for Primary.
-            symbol_database_list, null_database_list = [], [] # Initializes temporary lists.
-            for row in range(len(current_database_list)): # Places entries with non-base units after those with base units.
-                if current_database_list[row][1][0] == "0": # Use x[1][-2] for Index or x[1][0] for Primary.
-                    null_database_list.append(current_database_list[row])
-                else:
-                    symbol_database_list.append(current_database_list[row])
-            current_database_list = symbol_database_list + null_database_list
-    elif current_sort == "Units":
-        current_database_list.sort(key=lambda x: x[1][-3]) # Remove the following lines for legacy sorting.
-        unit_database_list, nonunit_database_list = [], [] # Initializes temporary lists.
-        for row in range(len(current_database_list)): # Places entries with non-base units after those with base units.
-            if current_database_list[row][1][-3][0] == "1" or current_database_list[row][1][-3][0] == "<":
-                nonunit_database_list.append(current_database_list[row])
-            else:
-                unit_database_list.append(current_database_list[row])
-        current_database_list = unit_database_list + nonunit_database_list
-    print() # Optional.
+    with stage_timer.stage("set_current_database_list"):
+        current_database_list = symbol_views.view(current_category, current_sort, index_type) # See coalexicon/views.py.
 
 def change_category_text(*args):
     """ Handles minor tasks related to set_current_database_list() and change_preset_text(). Possible options are ["All", "Quantities", "Modifiers", "Other"]. """
-    print("change_category_text():") # Optional.
+    symbols_log.debug("change_category_text()") # Optional.
     #print(f"category: {category_text.get()}") # Optional.
     global current_category
     current_category = category_text.get()
-    print() # Optional.
     main_symbols()
     
 def change_sort_text(*args):
     """ Handles minor tasks related to set_current_database_list() and change_preset_text(). Possible options are ["Name", "Symbol", "Units"]. """
-    print("change_sort_text():") # Optional.
+    symbols_log.debug("change_sort_text()") # Optional.
     #print(f"sorting: {sort_text.get()}") # Optional.
     global current_sort
     current_sort = sort_text.get()
-    print() # Optional.
     main_symbols()
 
-def populate_cells():
-    """ Removes previous cells from Symbol Manager, creates row and column labels, and creates entry cells for Symbol Manager. """
-    print(f"populate_cells():") # Optional.
-    #print(f"cell_frame.winfo_children(): {cell_frame.winfo_children()}\n") # Optional.
-    global current_database_list
-    cell_frame.grid_forget() # Prepares the cells for updating.
-    for widget in cell_frame.winfo_children(): # Prepares the cells for updating.
-        widget.destroy() # Removes all previous cells.
-    cell_dictionary.clear() # Prepares the cells for updating.
-    cell_labels = ["", "Name", "Primary", "Secondary", "Other", "Units"] # Assists in creating column labels.
-    for column in range(6): # Creates column labels.
-        if column == 0:  # Sets blank space in the top left corner.
-            label = tk.Label(cell_frame, width=2, text=cell_labels[column], font=f'Cambria {micro_text} bold italic', bg=cell_frame_color)
-        else:
-            label = tk.Label(cell_frame, width=10, text=cell_labels[column], font=f'Cambria {mini_text} bold italic', bg=cell_frame_color)
-        label.grid(row=0, column=column, padx=0, pady=0)
-    for row in range(len(current_database_list)): # Generates a row of cells for each entry in the current database.
-        for column in range(6):
-            if column == 0: # Creates row labels.
-                label = tk.Label(cell_frame, width=0, text=str(row+1), font=f'Cambria {micro_text}', bg=cell_frame_color)
-                label.grid(row=row+1, column=column, padx=0, pady=0)
-            else: # Creates cells.
-                entry_text = tk.StringVar() # Optional.
-                if column == 1: # Creates a wide entry cell in the Name column.
-                    entry = tk.Entry(cell_frame, textvariable=entry_text, width=30, justify='left') # width=25
-                    entry.insert(0, current_database_list[row][0]) # Places a name in the cell.
-                elif column == 5: # Creates a wide entry cell in the Units column.
-                    entry = tk.Entry(cell_frame, textvariable=entry_text, width=19, justify='center') # width=24
-                    entry.insert(0, current_database_list[row][1][column-2]) # Places a name in the cell.
-                else: # Creates a slim entry cell in the Primary, Secondary, Other, and Units columns.
-                    entry = tk.Entry(cell_frame, textvariable=entry_text, width=10, justify='center', background='#0d151c') # width=10
-                    if current_database_list[row][1][column-2] != 0 and current_database_list[row][1][column-2] != "0": # Ignores absent data.
-                        entry.insert(0, current_database_list[row][1][column-2]) # Places data in a cell.
-                entry.configure({"background": "white"})
-                entry.grid(row=row+1, column=column)  # Places the entry cell.
-                cell = f"{cell_labels[column]}{row+1}"
-                cell_dictionary[cell] = [entry] # Adds a key-value pair to the global cell_dictionaryionary. Ex[B1] = .!entry2
-                entry.bind('<Return>', lambda event, cell=cell: cell_return(event, cell))
-    try: # Accounts for an error with the search function.
-        final_row = row+2
-    except:
-        final_row = 1
-    finally: # Creates an empty row for new data entry.
-        for column in range(6):
-            if column == 0: # Creates row labels.
-                label = tk.Label(cell_frame, width=0, text=str(final_row), font=f'Cambria {micro_text}', bg=cell_frame_color)
-                label.grid(row=final_row, column=0, padx=0, pady=0)
-            else: # Creates cells.
-                entry_text = tk.StringVar() # Optional. entry_text.get()
-                if column == 1: # Creates a wide entry cell in the Name column.
-                    entry = tk.Entry(cell_frame, textvariable=entry_text, width=30, justify='left') # width=25
-                elif column == 5: # Creates a wide entry cell in the Units column.
-                    entry = tk.Entry(cell_frame, textvariable=entry_text, width=19, justify='center') # width=24
-                else: # Creates a slim entry cell in the Primary, Secondary, Other, and Units columns.
-                    entry = tk.Entry(cell_frame, textvariable=entry_text, width=10, justify='center', background='#0d151c') # width=10
-                entry.configure({"background": "white"})
-                entry.grid(row=final_row, column=column)  # Places the entry cell.
-                cell = f"{cell_labels[column]}{final_row}"
-                cell_dictionary[cell] = [entry] # Adds a key-value pair to the global cell_dictionaryionary. Ex[B1] = .!entry2
-                entry.bind('<Return>', lambda event, cell=cell: cell_return(event, cell))
+def populate_cells(keep_position=False):
+    """ Shows current_database_list in the Symbol Manager entry cells. Only the visible rows have widgets, which are refilled as the cells scroll.
+        Cells that already show the right text are left alone. See coalexicon/grid.py. """
+    symbols_log.debug("populate_cells()") # Optional.
+    with stage_timer.stage("populate_cells"):
+        symbol_grid.set_rows(current_database_list, keep_position)
     #print() # Optional.
 
+def cell_values(row):
+    """ Returns the text of each cell in a row of Symbol Manager. Absent symbols are left empty. Ex=cell_values(("distance", ['d', '0', 'l;s;r', 'm', '0', 'quantity'])) → ['distance', 'd', '', 'l;s;r', 'm'] """
+    name, data = row[0], row[1]
+    return [name] + [symbol if symbol != 0 and symbol != "0" else "" for symbol in data[:3]] + [data[3]]
+
 def cell_return(event, cell):
     """ Called when return/enter has been pressed. """
-    print(f"cell_return():") # Optional.
+    symbols_log.debug("cell_return()") # Optional.
     global current_database_list
     data = cell_dictionary[cell][0].get()  # Gets text/data from the specified cell.
     row, column = "", ""
@@ -1743,8 +1042,42 @@ def cell_return(event, cell):
     append_list, counter = [], 1 # Initializes temporary data.
     try: # True for a row of pre-existing data.
         name = current_database_list[int(row)-1][0] # Finds the name that corresponds to the current row.
-        if column == 0:
+    except IndexError: # True for a new row.
+        name = None
+    try: # Errors from the indexes or storage are raised rather than treated as a new row.
+        if name is None:
+            if current_category == "Quantities":
+                category = "quantity"
+            elif current_category == "Constants":
+                category = "constant"
+            elif current_category == "Modifiers":
+                category = "modifier"
+            else:
+                category = "general"
+            if column == 0 and data.strip() != "":
+                new_data = (data, ["0", "0", "0", "0", "0", category])
+                current_database_list.append(new_data)
+                notation_database_dictionary[data] = ["0", "0", "0", "0", "0", category]
+                search_index.add(data)
+                symbol_views.add(data)
+                if fuzzy_index:
+                    fuzzy_index.add(data, notation_database_dictionary[data])
+                elif fuzzy_search:
+                    build_fuzzy_index()
+                if storage:
+                    storage.upsert_symbol(current_database_file, data, notation_database_dictionary[data])
+        elif column == 0:
             notation_database_dictionary[data] = notation_database_dictionary.pop(name)
+            search_index.rename(name, data)
+            symbol_views.update(data, column, old_name=name)
+            dimension_index.rename(name, data, notation_database_dictionary[data])
+            if fuzzy_index:
+                fuzzy_index.rename(name, data, notation_database_dictionary[data])
+            elif fuzzy_search: # Rebuilds the index, which is still being built from the previous names.
+                build_fuzzy_index()
+            current_database_list[int(row)-1] = (data, notation_database_dictionary[data]) # Keeps the new name when the row scrolls out of view and back.
+            if storage:
+                storage.rename_symbol(current_database_file, name, data)
         else:
             if data.strip() == "": # Sets empty cells to zero.
                 data = "0"
@@ -1755,54 +1088,94 @@ def cell_return(event, cell):
                     append_list.append(item)
                 counter += 1
             notation_database_dictionary[name] = append_list
-    except: # True for a new row.
-        if current_category == "Quantities":
-            category = "quantity"
-        elif current_category == "Constants":
-            category = "constant"
-        elif current_category == "Modifiers":
-            category = "modifier"
-        else:
-            category = "general"
-        if column == 0 and data.strip() != "":
-            new_data = (data, ["0", "0", "0", "0", "0", category])
-            current_database_list.append(new_data)
-            notation_database_dictionary[data] = ["0", "0", "0", "0", "0", category]
+            current_database_list[int(row)-1] = (name, append_list)
+            symbol_views.update(name, column)
+            dimension_index.add(name, append_list)
+            if fuzzy_index:
+                fuzzy_index.add(name, append_list)
+            elif fuzzy_search:
+                build_fuzzy_index()
+            if storage: # Writes only the current row. Saved with the "Save" button.
+                storage.upsert_symbol(current_database_file, name, append_list)
     finally:
-        try: # Optional.
-            print(f"Selected entry: ['{name}': {append_list}]") # Optional.
-        except: # Optional.
-            print(f"Selected entry: ['{data}': {append_list}]") # Optional.
+        symbol_grid.render() # Updates the edited row, or adds an empty row below a new entry, without touching the other rows.
+        symbols_log.debug("Selected entry: ['%s': %s]", data if name is None else name, append_list) # Optional.
         #print(f"Cell ID: {cell}; Cell data: {data}") # Optional.
-        print() # Optional.
 
 def configure_cell_canvas(cell_canvas):
     """ Resets the scroll region to encompass the inner frame. """
     cell_canvas.configure(scrollregion=cell_canvas.bbox('all'))
 
 def search_names(event, widget):
-    """ Looks through the current database to find names that include the search term(s). """
-    print(f"search_names():") # Optional.
+    """ Finds names in the current database that include the search term(s), using search_index instead of reading every name. Called as the search entry is typed in. """
+    symbols_log.debug("search_names()") # Optional.
     global current_database_list, current_category
     current_category = "Search"
     search_term = widget.get()
-    search_list = []
-    for key in notation_database_dictionary: # Searches names in the database for the specified entry.
-        if search_term in key:
-            row = [key]
-            row.append(notation_database_dictionary[key])
-            search_list.append(row)
-    if not search_list: # Accounts for capitalized names.
-        for key in notation_database_dictionary:
-            if search_term.lower() in key.lower():
-                row = [key]
-                row.append(notation_database_dictionary[key])
-                search_list.append(row)
+    with stage_timer.stage("search_names"):
+        names = search_index.search(search_term) # Ranked from best to worst, regardless of case.
+        if fuzzy_index: # Adds matches of symbols and units, and matches with typos, after the names that contain the term. Only names are searched while the index is being built.
+            found = set(names)
+            names = names + [key for key in fuzzy_index.search(search_term) if key not in found]
+        search_list = [[key, notation_database_dictionary[key]] for key in names]
     notation_database_search.clear()
     notation_database_search.extend(search_list)
-    print() # Optional.
+    symbol_views.set_search(notation_database_search)
     main_symbols()
 
+def set_fuzzy_search(enable):
+    """ Extends searches of names to every Symbol Manager column with tolerance for typos, or returns to searching names only. Called when "fuzzy" is entered into the unit entry cell. """
+    symbols_log.debug("set_fuzzy_search(%s)", enable) # Optional.
+    global fuzzy_search, fuzzy_index
+    fuzzy_search = enable
+    if enable:
+        build_fuzzy_index()
+    else:
+        fuzzy_index = None
+
+def build_fuzzy_index():
+    """ Starts building the fuzzy index of the current database in the background, so that large databases do not freeze the GUI. Searches match names until it is ready.
+        An index that is already being built is discarded when it arrives, and poll_loading() then starts this one. """
+    global fuzzy_index, fuzzy_building
+    fuzzy_index = None
+    load_generations["fuzzy"] += 1
+    if fuzzy_building:
+        return
+    fuzzy_building = True
+    start_background(read_fuzzy_index, {name: list(data) for name, data in notation_database_dictionary.items()}, load_generations["fuzzy"]) # Copies each row, as later edits change the rows in place.
+
+def set_timing(enable):
+    """ Starts timing the Unit Manager pipeline and Symbol Manager loaders and opens a window with the results, or stops timing and writes the results to timing_file.
+        Called when "timing" is entered into the unit entry cell. See coalexicon/timing.py. """
+    units_log.debug("set_timing(%s)", enable) # Optional.
+    global timing_panel
+    stage_timer.set_enabled(enable)
+    if enable:
+        if timing_panel is None:
+            timing_panel = tk.Toplevel(root)
+            timing_panel.title("Coalexicon | Timing")
+            timing_panel.protocol("WM_DELETE_WINDOW", lambda: set_timing(False))
+            timing_text = tk.Text(timing_panel, font=('Courier', mini_text), width=86, height=20, wrap='none')
+            timing_text.pack(fill='both', expand=True)
+            tk.Button(timing_panel, text="Save JSON", command=lambda: stage_timer.dump(timing_file)).pack(side='left')
+            tk.Button(timing_panel, text="Reset", command=stage_timer.clear).pack(side='left')
+            refresh_timing(timing_text)
+    else:
+        if stage_timer.times:
+            stage_timer.dump(timing_file)
+            io_log.info("Timing saved to %s", timing_file) # Optional.
+        if timing_panel is not None:
+            timing_panel.destroy()
+            timing_panel = None
+
+def refresh_timing(timing_text):
+    """ Rewrites the timing window once a second while it is open. """
+    if timing_panel is None or not timing_text.winfo_exists():
+        return
+    timing_text.delete('1.0', 'end')
+    timing_text.insert('end', stage_timer.report())
+    root.after(1000, refresh_timing, timing_text)
+
 def font_config(widget, fontslant, event):
     """ Alters font properties when the cursor hovers over the respective widget. """
     if str(widget) == ".!frame.!button3" and str(event)[1] == 'E' and current_window_size[0] > 675: # Corrects for a font preference.
@@ -1831,7 +1204,7 @@ def set_scroll(event, unset=False):
 
 def scroll_frame(event):
     """ Allows mousewheel scrolling within the cell frame in Symbol Manager. Something may be wrong here. """
-    cell_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+    symbol_grid.yview("scroll", int(-1*(event.delta/120)), "units")
 
 def set_theme(operator):
     """ Changes the background and foreground images. Called when "theme" is entered into the unit entry cell. """
@@ -1901,24 +1274,52 @@ def notes_toggle(direction=""):
         textbox_3.tkraise()
         textbox_3.focus()
 
+def import_graphing():
+    """ Imports NumPy and matplotlib for the Graphing Calculator. Runs on a background thread, so that Unit Manager and Symbol Manager do not wait for it. """
+    try:
+        from coalexicon import graphing
+    except ImportError as error:
+        graphing_modules["error"] = error
+    else:
+        graphing_modules["graphing"] = graphing
+
+def load_graphing(wait=True):
+    """ Starts importing matplotlib in the background, and waits for it to finish unless wait is False. Returns True if the Graphing Calculator can be used. """
+    global graphing_loader
+    if graphing_loader is None:
+        graphing_loader = threading.Thread(target=import_graphing, name="import_graphing", daemon=True)
+        graphing_loader.start()
+    if not wait:
+        return False
+    graphing_loader.join()
+    if "error" in graphing_modules and not graphing_calculator.winfo_children(): # Explains the empty frame once.
+        tk.Label(graphing_calculator, text=f"The Graphing Calculator requires NumPy and matplotlib.\n{graphing_modules['error']}", font=('Cambria', small_text)).pack()
+    return "graphing" in graphing_modules
+
 def plot():
-    equation = eval('lambda x: ' + equation_entry.get())
+    """ Plots the equation in equation_entry from the first to the last x value, using the given number of points. Ex="sin(x)/x"
+        The equation is evaluated over all points at once, and the same figure is reused for every plot. In adaptive mode, the number of points is a budget,
+        spent where the curve bends, and the line is broken at singularities. Ex="tan(x)"
+        Equations may end with units, which label the y-axis with a suitable prefix. Ex="x**2 * 3 MeV" is plotted in GeV for x up to 100. """
+    graphing_log.debug("plot()") # Optional.
+    global graphing_canvas
+    if not load_graphing():
+        return
+    graphing = graphing_modules["graphing"]
     try:
-        y_values = [equation(x) for x in range(101)]
-    except:
-        range_except = [n+1 for n in range(100)]
-        range_except.insert(0, 1e-100)
-        y_values = [equation(x) for x in range_except]
-    fig = Figure(figsize = (5, 5), dpi = 100) # the figure that will contain the plot
-    #y = [i**2 for i in range(101)] # list of squares
-    plot1 = fig.add_subplot(111) # adding the subplot
-    plot1.plot(y_values) # plotting the graph
-    canvas = FigureCanvasTkAgg(fig, master = graphing_calculator) # creating the Tkinter canvas containing the Matplotlib figure
-    canvas.draw()
-    canvas.get_tk_widget().pack() # placing the canvas on the Tkinter window
-    toolbar = NavigationToolbar2Tk(canvas, graphing_calculator) # creating the Matplotlib toolbar
-    toolbar.update()
-    canvas.get_tk_widget().pack() # placing the toolbar on the Tkinter window
+        equation, factor, units = graphing.compile_quantity(equation_entry.get(), plot_engine, dimension_index.parser) # The parser knows every unit in conversion_database.
+        if adaptive_plot.get():
+            x_values, y_values = graphing.adaptive_sample(equation, float(x_start_entry.get()), float(x_stop_entry.get()), int(points_entry.get()))
+        else:
+            x_values, y_values = graphing.sample(equation, float(x_start_entry.get()), float(x_stop_entry.get()), int(points_entry.get()))
+    except Exception as error: # True for invalid equations or settings. The previous plot is kept.
+        graphing_log.warning("Cannot plot %r: %s", equation_entry.get(), error) # Optional.
+        return
+    y_values *= factor # Converts the values to unprefixed units.
+    prefix_scale, ylabel = graphing.axis_units(y_values, units, plot_engine.symbol_indexes)
+    if graphing_canvas is None:
+        graphing_canvas = graphing.GraphingCanvas(graphing_calculator)
+    graphing_canvas.update(x_values, y_values / prefix_scale, ylabel)
 
 #############################################################################################################################################################################################
 ## Classes
@@ -2132,6 +1533,7 @@ search_frame = tk.Frame(upper_subframe_B) # Configures the search bar.
 search_text = tk.StringVar()
 search_entry = tk.Entry(search_frame, textvariable=search_text, width=16)
 search_entry.bind('<Return>', lambda event, search_text=search_text: search_names(event, search_text)) # Optional font automation.
+search_text.trace('w', lambda *args: search_names('', search_text)) # Searches as the entry is typed in.
 search_button = tk.Button(search_frame, text='🔍', font=(f'Cambria {micro_text} bold'), bg=blue, command=lambda: search_names('', search_text))
 search_label = tk.Label(search_frame, text="Search:")
 search_button.pack(side='right', padx=2)
@@ -2333,13 +1735,14 @@ middle_subframe_background_label_B.place(relx=-0.4, rely=-0.4, relwidth=2, relhe
 cell_canvas = tk.Canvas(middle_subframe_B, borderwidth=0, bg=cell_frame_color) # Creates a canvas to hold the entry cells and a scrollbar.
 cell_canvas.bind('<Enter>', set_scroll)
 cell_canvas.bind('<Leave>', lambda event, unset=True: set_scroll(unset))
-cell_frame = tk.Frame(cell_canvas, bg=cell_frame_color) # Creates a frame for the entry cells.
-cell_scrollbar_A = ttk.Scrollbar(cell_canvas, orient='vertical', style="Dark.Vertical.TScrollbar", command=cell_canvas.yview)
+cell_scrollbar_A = ttk.Scrollbar(cell_canvas, orient='vertical', style="Dark.Vertical.TScrollbar") # Scrolls rows through the visible cells. See symbol_grid.
 cell_scrollbar_B = ttk.Scrollbar(cell_canvas, orient='horizontal', style="Light.Horizontal.TScrollbar", command=cell_canvas.xview)
-cell_canvas.config(yscrollcommand=cell_scrollbar_A.set, xscrollcommand=cell_scrollbar_B.set)
+cell_canvas.config(xscrollcommand=cell_scrollbar_B.set)
 cell_scrollbar_A.pack(side='right', fill='y') # Sets the scrollbar.
 cell_canvas.pack(side='left', fill='both', expand=True)
-cell_canvas.create_window((0,0), window=cell_frame, anchor='nw')
+symbol_grid = VirtualGrid(cell_canvas, cell_scrollbar_A, [("Name", 30, 'left'), ("Primary", 10, 'center'), ("Secondary", 10, 'center'), ("Other", 10, 'center'), ("Units", 19, 'center')],
+    cell_values, cell_return, cell_dictionary, header_font=f'Cambria {mini_text} bold italic', label_font=f'Cambria {micro_text}', background=cell_frame_color) # Creates the entry cells.
+cell_frame = symbol_grid.frame # Holds the entry cells.
 cell_frame.bind('<Configure>', lambda event, canvas=cell_canvas: configure_cell_canvas(cell_canvas))
 
 #############################################################################################################################################################################################
@@ -2360,7 +1763,32 @@ graphing_calculator.place(relx=0.5, rely=0.35, relwidth=0.88, relheight=0.500, a
 
 equation_entry = tk.Entry(graphing_calculator_entry, font=('Cambria', small_text), bg=light_gray, justify='center') # Configures user-entry buttons.
 equation_entry.place(relx=0.9, rely=0, relwidth=0.1, relheight=0.15)
-#equation_entry.bind('<Return>', lambda event: plot(event))
+equation_entry.bind('<Return>', lambda event: plot())
+
+x_start_label = tk.Label(graphing_calculator_entry, text="x from", font=('Cambria', mini_text)) # Configures the domain and resolution of the plot.
+x_start_label.place(relx=0.8, rely=0.2, relwidth=0.1, relheight=0.15)
+x_start_entry = tk.Entry(graphing_calculator_entry, font=('Cambria', small_text), bg=light_gray, justify='center')
+x_start_entry.insert(0, "0")
+x_start_entry.place(relx=0.9, rely=0.2, relwidth=0.1, relheight=0.15)
+x_start_entry.bind('<Return>', lambda event: plot())
+
+x_stop_label = tk.Label(graphing_calculator_entry, text="to", font=('Cambria', mini_text))
+x_stop_label.place(relx=0.8, rely=0.4, relwidth=0.1, relheight=0.15)
+x_stop_entry = tk.Entry(graphing_calculator_entry, font=('Cambria', small_text), bg=light_gray, justify='center')
+x_stop_entry.insert(0, "100")
+x_stop_entry.place(relx=0.9, rely=0.4, relwidth=0.1, relheight=0.15)
+x_stop_entry.bind('<Return>', lambda event: plot())
+
+points_label = tk.Label(graphing_calculator_entry, text="points", font=('Cambria', mini_text))
+points_label.place(relx=0.8, rely=0.6, relwidth=0.1, relheight=0.15)
+points_entry = tk.Entry(graphing_calculator_entry, font=('Cambria', small_text), bg=light_gray, justify='center')
+points_entry.insert(0, "101")
+points_entry.place(relx=0.9, rely=0.6, relwidth=0.1, relheight=0.15)
+points_entry.bind('<Return>', lambda event: plot())
+
+adaptive_plot = tk.BooleanVar(value=False) # Treats the number of points as a budget for adaptive sampling.
+adaptive_check = tk.Checkbutton(graphing_calculator_entry, text="adaptive", variable=adaptive_plot, command=plot, font=('Cambria', mini_text))
+adaptive_check.place(relx=0.8, rely=0.8, relwidth=0.2, relheight=0.15)
 
 plot_button = tk.Button(master = graphing_calculator_entry, command=plot, height=2, width=10, text="Plot")
 plot_button.pack()
@@ -2423,14 +1851,16 @@ close_button.bind('<Leave>', partial(font_config, close_button, f'Cambria {small
 
 #############################################################################################################################################################################################
 ## Startup Commands
-print(f"{'-'*98}\n{'-'*98}\nCoalexicon [CLX] Startup\nWelcome!\n\n{'-'*98}") # Optional.
+setup_tracing() # Switches on the subsystems named by CLX_TRACE.
+io_log.debug("Coalexicon [CLX] Startup") # Optional.
 favorites_update() # Loads saved favorites.
 load_notes() # Loads notes.
-load_units()  # Loads units for Unit Manager.
-load_symbols() # Loads default symbol database for Symbol Manager.
-main_symbols() # Creates cells and updates the display for Symbol Manager.
+if os.path.exists(storage_file): # Keeps the SQLite backend on until it is turned off.
+    open_storage()
+load_databases() # Reads units for Unit Manager and the default symbol database for Symbol Manager in the background, then creates cells for Symbol Manager.
 raise_frame() # Triggers the default application, as set by application_index.
-print(f"{'-'*98}") # Optional.
+root.after_idle(load_graphing, False) # Imports matplotlib while the user works in Unit Manager.
 root.mainloop() # Starts the GUI.
+save_writer.flush() # Finishes writing any saves still waiting when the window closes.
 
 #############################################################################################################################################################################################
\ No newline at end of file
@@ -0,0 +1,233 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Benchmarks
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Times the Unit Manager engine and the Symbol Manager loaders, views, searches, and table over synthetic databases of 1k to 100k rows, writes the results as JSON, and compares
+## them with benchmarks/baseline.json. The exit status is 1 if any benchmark is slower than its baseline by more than the tolerance, so the script may be used as a build step.
+## Benchmarks that appear slower are measured again before they are reported, so that a regression must persist to fail the run. Benchmarks faster than a millisecond are compared
+## by their median rather than their fastest run, as single runs that short vary too much. The table of populate_cells() needs a display, and is skipped without one; skipped
+## benchmarks are listed in the results with the reason. Ex=xvfb-run python benchmarks/run_benchmarks.py
+## Baselines depend on the machine, so they should be written on the machine that compares against them. Ex=python benchmarks/run_benchmarks.py --update-baseline
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import argparse
+import gc # Switched off while timing, as in timeit.
+import json
+import os
+import platform
+import random # Used with a fixed seed, so that every run builds the same databases.
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Allows running the script from any folder.
+from coalexicon import UnitEngine, load_conversion_database, load_symbol_database, load_unit_database
+from coalexicon.dimensions import DimensionIndex
+from coalexicon.search import FuzzyIndex, TrigramIndex
+from coalexicon.views import SortedViews, category_codes
+
+#############################################################################################################################################################################################
+## Global datasets
+data_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # The folder that holds the database_*.txt files. Ex='.../CLX_Beta'
+baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+default_sizes = (1000, 10000, 100000) # Rows in each synthetic symbol database.
+words = ("angular", "magnetic", "electric", "thermal", "kinetic", "potential", "specific", "molar", "surface", "volume", "linear", "mean", "reduced", "effective", "total",
+    "energy", "momentum", "flux", "density", "charge", "field", "current", "pressure", "velocity", "acceleration", "frequency", "capacity", "conductivity", "impedance", "length")
+symbols = ("E", "p", "Φ", "ρ", "q", "B", "I", "P", "v", "a", "f", "C", "σ", "Z", "l", "ℏ", "𝔸", "λ", "μ", "ε", "ω", "τ", "κ", "θ")
+search_terms = ("energy", "mag", "ity", "flux dens", "xyz", "e") # Searched in turn by search_names.
+fuzzy_terms = ("enrgy", "magnetc field", "ℏ", "m²", "pressure") # Searched in turn by fuzzy_search.
+unit_presses = (("m", 1), ("s", -1), ("g", 1), ("s", -1), ("m", 1), ("C", -1), ("K", 1), ("mol", -1)) # Unit and exponent of each press in update_units_and_values.
+
+#############################################################################################################################################################################################
+## Functions
+def measure(function, repeat, number=1):
+    """ Calls a function number times in each of repeat runs, and returns the fastest and median time of one call in milliseconds. Garbage collection is paused during each run. """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = perf_counter()
+            for _ in range(number):
+                function()
+            times.append((perf_counter() - start) / number * 1000)
+        finally:
+            gc.enable()
+    return {"min_ms": min(times), "median_ms": statistics.median(times), "runs": repeat, "calls": number}
+
+def synthetic_database(path, size, seed=0):
+    """ Writes a symbol database of the given size in the format of database_clx.txt. Units are drawn from database_clx.txt, so that their dimensions can be read. """
+    generator = random.Random(seed)
+    units = [data[3] for data in load_symbol_database(os.path.join(data_directory, "database_clx.txt"), cache=False).values()]
+    categories = [code for code in category_codes.values() if code]
+    with open(path, 'w', encoding='utf-8') as database:
+        for i in range(size):
+            name = f"{generator.choice(words)} {generator.choice(words)} {i}"
+            primary, secondary = generator.choice(symbols), generator.choice(symbols + ("0",))
+            print(f"{name}\t{primary}\t{secondary}\t0\t{generator.choice(units)}\t{primary}\t{generator.choice(categories)}", file=database)
+
+def engine_benchmarks():
+    """ Returns the Unit Manager operations that follow a button press, each followed by reduce() as in main_units(), and the number of calls in each run. """
+    conversion_database = load_conversion_database(os.path.join(data_directory, "database_conversions.txt"), cache=False)
+    unit_database = load_unit_database(os.path.join(data_directory, "database_units.txt"), cache=False)
+    engine = UnitEngine(conversion_database, unit_database)
+    with open(os.path.join(data_directory, "database_favorites.txt"), 'r', encoding='utf-8') as favorites:
+        favorites_list = [line.strip().split(", ") for line in favorites if line.strip()]
+    def update_units_and_values():
+        engine.clear()
+        for unit, exponent in unit_presses:
+            engine.update_units_and_values(engine.add_symbol(unit), "×" if exponent > 0 else "÷", 1000)
+            engine.reduce()
+    def convert_to_base():
+        engine.clear()
+        engine.multiply_units("eV", 1, 1000000)
+        engine.multiply_units("h", -1)
+        engine.convert_to_base()
+        engine.reduce()
+    def invert():
+        engine.invert()
+        engine.reduce()
+    def favorites_trigger():
+        for csv_units in favorites_list:
+            engine.clear()
+            engine.load_favorite(csv_units)
+            engine.reduce()
+    benchmarks = {}
+    for name, function in (("update_units_and_values", update_units_and_values), ("convert_to_base", convert_to_base), ("invert", invert),
+        ("favorites_trigger", favorites_trigger)):
+        benchmarks[f"engine.{name}"] = (function, 200)
+    return benchmarks
+
+def symbol_benchmarks(size, directory, cleanup, skipped):
+    """ Returns the Symbol Manager work of loading a database of the given size, sorting each view, searching it, and showing it in the table. Benchmarks that cannot run are
+        added to skipped with the reason. """
+    path = os.path.join(directory, f"database_{size}.txt")
+    synthetic_database(path, size)
+    conversion_database = load_conversion_database(os.path.join(data_directory, "database_conversions.txt"), cache=False)
+    database = load_symbol_database(path, cache=False)
+    views, search_index, dimension_index = SortedViews(), TrigramIndex(), DimensionIndex(UnitEngine(conversion_database))
+    def load_symbols(): # Matches load_symbols() in CLX_2.6.2.py without the optional fuzzy index.
+        loaded = load_symbol_database(path, cache=False)
+        views.build(loaded)
+        search_index.build(loaded)
+        dimension_index.build(loaded)
+    def set_current_database_list(): # Sorts every view once, as if each were selected in turn.
+        views.build(database)
+        for category in category_codes:
+            for sort in ("Name", "Symbol", "Units"):
+                views.view(category, sort, "Index")
+    def search_names():
+        for term in search_terms:
+            views.set_search([(name, database[name]) for name in search_index.search(term)])
+            views.view("Search", "Name")
+    load_symbols()
+    fuzzy_index = FuzzyIndex(database)
+    def fuzzy_search():
+        for term in fuzzy_terms:
+            fuzzy_index.search(term)
+    benchmarks = {}
+    for name, function in (("load_symbols", load_symbols), ("set_current_database_list", set_current_database_list), ("search_names", search_names),
+        ("fuzzy_search", fuzzy_search), ("populate_cells", grid_benchmark(database, cleanup))):
+        if function is not None:
+            benchmarks[f"symbols.{name}[{size}]"] = (function, 1)
+        else:
+            skipped[f"symbols.{name}[{size}]"] = "no display"
+    return benchmarks
+
+def grid_benchmark(database, cleanup):
+    """ Returns a function that shows a database in the Symbol Manager table and pages through its first hundred screens, or None if no display is available.
+        The window is closed by the function added to cleanup. """
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception: # True without a display.
+        return None
+    from coalexicon.grid import VirtualGrid
+    root.geometry("900x600")
+    canvas = tk.Canvas(root)
+    scrollbar = tk.Scrollbar(root, orient='vertical')
+    canvas.pack(side='left', fill='both', expand=True)
+    scrollbar.pack(side='right', fill='y')
+    root.update()
+    columns = [("Name", 30, 'left'), ("Primary", 8, 'center'), ("Secondary", 8, 'center'), ("Other", 8, 'center'), ("Units", 19, 'center')]
+    grid = VirtualGrid(canvas, scrollbar, columns, lambda row: [row[0], row[1][0], row[1][1], row[1][2], row[1][3]], lambda event, cell: None, {})
+    grid.resize()
+    rows = list(database.items())
+    def populate_cells():
+        grid.set_rows(rows)
+        for _ in range(100):
+            grid.yview("scroll", 1, "pages")
+        root.update_idletasks()
+    cleanup.append(root.destroy)
+    return populate_cells
+
+def compared_time(result):
+    """ Returns the time that is compared with the baseline: the fastest run, or the median run for benchmarks faster than a millisecond. """
+    return result["median_ms"] if result["min_ms"] < 1 else result["min_ms"]
+
+def compare(results, baseline, tolerance, floor):
+    """ Returns the names of the benchmarks that are slower than their baseline by more than the tolerance and by more than floor milliseconds. """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        measured, expected = compared_time(result), compared_time(baseline[name])
+        if measured > expected * (1 + tolerance) and measured - expected > floor:
+            regressions.append(name)
+    return regressions
+
+def main(argv=None):
+    """ Runs the benchmarks, writes the results, and compares them with the baseline. Returns the exit status. """
+    parser = argparse.ArgumentParser(description="Coalexicon benchmarks.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in default_sizes), help="rows in each synthetic database, separated by commas (default: 1000,10000,100000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each benchmark; the fastest is compared, or the median below a millisecond (default: 5)")
+    parser.add_argument("--output", help="file that receives the results as JSON; written to stdout if omitted")
+    parser.add_argument("--baseline", default=baseline_path, help="results to compare against (default: benchmarks/baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown as a fraction of the baseline; lower it on quiet machines (default: 0.5)")
+    parser.add_argument("--floor", type=float, default=0.05, help="slowdowns of fewer milliseconds than this are ignored (default: 0.05)")
+    parser.add_argument("--retries", type=int, default=2, help="times a slower benchmark is measured again before it is reported (default: 2)")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to the baseline instead of comparing against it")
+    arguments = parser.parse_args(argv)
+    baseline_results = None
+    if not arguments.update_baseline and os.path.exists(arguments.baseline):
+        with open(arguments.baseline, 'r', encoding='utf-8') as baseline:
+            baseline_results = json.load(baseline)["results"]
+    regressions, cleanup, skipped = [], [], {}
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = engine_benchmarks()
+        for size in [int(size) for size in arguments.sizes.split(",")]:
+            benchmarks.update(symbol_benchmarks(size, directory, cleanup, skipped))
+        results = {name: measure(function, arguments.repeat, number) for name, (function, number) in benchmarks.items()}
+        if baseline_results is not None:
+            regressions = compare(results, baseline_results, arguments.tolerance, arguments.floor)
+            for _ in range(arguments.retries):
+                for name in regressions: # Keeps the faster of the two measurements.
+                    result = measure(benchmarks[name][0], arguments.repeat, benchmarks[name][1])
+                    if compared_time(result) < compared_time(results[name]):
+                        results[name] = result
+                regressions = compare({name: results[name] for name in regressions}, baseline_results, arguments.tolerance, arguments.floor)
+        for close in cleanup:
+            close()
+    report = {"python": platform.python_version(), "platform": platform.platform(), "results": results, "skipped": skipped}
+    text = json.dumps(report, indent=4, ensure_ascii=False)
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    if arguments.update_baseline:
+        with open(arguments.baseline, 'w', encoding='utf-8') as baseline:
+            baseline.write(text + "\n")
+        return 0
+    if baseline_results is None:
+        print(f"No baseline at {arguments.baseline}; run with --update-baseline to write one.", file=sys.stderr)
+        return 0
+    for name in regressions:
+        print(f"REGRESSION {name}: {compared_time(results[name]):.3f} ms against a baseline of {compared_time(baseline_results[name]):.3f} ms", file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
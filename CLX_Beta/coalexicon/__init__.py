@@ -0,0 +1,13 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Headless Components
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Importable parts of the Coalexicon that run without tkinter. The GUI in CLX_2.6.2.py is built on top of these modules.
+#############################################################################################################################################################################################
+from .databases import load_conversion_database, load_symbol_database, load_unit_database, read_table
+from .engine import UnitEngine, favorite_key
+from .exponents import ExponentVector
+from .formatting import scientific_notation, significand_exponent
+from .prefixes import prefix_value, select_prefix
+from .superscripts import exponent_string, split_exponent, superscript
@@ -0,0 +1,76 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Command Line
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Runs Unit Manager without the GUI. Each line of input holds one quantity, and each line of output holds its value, base units, and unit_database name, separated by tabs.
+## Ex=echo "3.2 MeV/s" | python -m coalexicon convert
+##    5.12640000000000e-10	g⸱m²⸱s⁻³	gram_meter_squared_per_second_cubed
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import argparse
+import os
+import sys
+from .databases import load_conversion_database, load_unit_database
+from .engine import UnitEngine, base_symbols
+from .expressions import ExpressionParser, convert_expression
+
+#############################################################################################################################################################################################
+## Global datasets
+default_data_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # The folder that holds the database_*.txt files. Ex='.../CLX_Beta'
+
+#############################################################################################################################################################################################
+## Functions
+def read_lines(paths):
+    """ Yields each line of the given files in turn, or of stdin if no files are given, along with its source and line number. """
+    if not paths:
+        paths = ["-"]
+    for path in paths:
+        if path == "-":
+            source, lines = "<stdin>", sys.stdin
+            for line_number, line in enumerate(lines, 1):
+                yield source, line_number, line
+        else:
+            with open(path, 'r', encoding='utf-8') as lines:
+                for line_number, line in enumerate(lines, 1):
+                    yield path, line_number, line
+
+def convert(arguments):
+    """ Converts each quantity to base units and writes the results to stdout. Lines that cannot be read are reported to stderr. Returns the exit status. """
+    conversion_database = load_conversion_database(os.path.join(arguments.data, "database_conversions.txt"))
+    unit_database = load_unit_database(os.path.join(arguments.data, "database_units.txt"))
+    engine = UnitEngine(conversion_database, unit_database, exact=arguments.exact)
+    parser = ExpressionParser(base_symbols[:-1] + [symbol for symbol in conversion_database if not symbol.startswith("-")])
+    output, errors = sys.stdout, 0
+    for source, line_number, line in read_lines(arguments.files):
+        line = line.strip()
+        if not line or line.startswith("#"): # Skips blank lines and comments.
+            continue
+        try:
+            value, units, unit_name = convert_expression(engine, parser, line, arguments.iso)
+        except (ArithmeticError, KeyError, ValueError) as error:
+            errors += 1
+            print(f"{source}:{line_number}: {line!r}: {error}", file=sys.stderr)
+            continue
+        output.write(f"{float(value):.{arguments.digits}e}\t{units}\t{unit_name}\n")
+    output.flush()
+    return 1 if errors else 0
+
+def main(argv=None):
+    """ Reads the command line and runs the requested command. """
+    parser = argparse.ArgumentParser(prog="python -m coalexicon", description="Coalexicon without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert_parser = commands.add_parser("convert", help="convert quantities such as '3.2 MeV/s' to base units")
+    convert_parser.add_argument("files", nargs="*", help="files with one quantity per line; reads stdin if omitted or '-'")
+    convert_parser.add_argument("--iso", action="store_true", help="use kilograms instead of grams")
+    convert_parser.add_argument("--exact", action="store_true", help="keep values as exact fractions until they are written")
+    convert_parser.add_argument("--digits", type=int, default=14, help="decimals written in each value (default: 14)")
+    convert_parser.add_argument("--data", default=default_data_directory, help="folder that holds database_conversions.txt and database_units.txt")
+    arguments = parser.parse_args(argv)
+    if arguments.command == "convert":
+        return convert(arguments)
+
+if __name__ == "__main__":
+    sys.exit(main())
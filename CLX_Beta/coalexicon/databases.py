@@ -0,0 +1,100 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Databases
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## This module reads the tab-separated database_*.txt files into the dictionaries used by Unit Manager. It does not depend on tkinter, so the same data may be loaded by the GUI
+## and by batch jobs. Each parsed file is kept as a pickle in the user's own cache folder, so the text is only parsed again when the file's modification time or size changes.
+## Snapshots are not kept beside the databases, as anyone who can write to a shared folder could otherwise replace a pickle with one that runs their own code.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import hashlib # Names each snapshot after the full path of its database.
+import os
+import pickle # Used for the binary snapshots of parsed databases.
+import sys
+import tempfile
+
+#############################################################################################################################################################################################
+## Global datasets
+cache_version = 1 # Increase whenever the format of a parsed database changes, so that older snapshots are ignored.
+if os.environ.get("CLX_CACHE"): # Holds the snapshots. Ex='~/.cache/coalexicon' on Linux, '%LOCALAPPDATA%\coalexicon' on Windows, '~/Library/Caches/coalexicon' on macOS
+    cache_folder = os.environ["CLX_CACHE"]
+elif sys.platform == "win32":
+    cache_folder = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "coalexicon")
+elif sys.platform == "darwin":
+    cache_folder = os.path.expanduser("~/Library/Caches/coalexicon")
+else:
+    cache_folder = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "coalexicon")
+
+#############################################################################################################################################################################################
+## Functions
+def cache_path(path):
+    """ Returns the location of the binary snapshot of a database file. Databases with the same name in different folders have different snapshots.
+        Ex='~/.cache/coalexicon/database_units.txt-3f2a9c1d5e7b8a64.pickle' """
+    full_path = os.path.realpath(path)
+    digest = hashlib.sha256(full_path.encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+    return os.path.join(cache_folder, f"{os.path.basename(full_path)}-{digest}.pickle")
+
+def load_cached(path, kind, parse):
+    """ Returns the parsed contents of a database file, reading them from its binary snapshot if the file has not changed since the snapshot was written.
+        The kind distinguishes parsers of the same file, and parse is called with the path when the text needs to be read. """
+    status = os.stat(path)
+    header = (cache_version, kind, os.path.realpath(path), status.st_mtime_ns, status.st_size) # Identifies the file and format that a snapshot was made from.
+    snapshot = cache_path(path)
+    try:
+        with open(snapshot, 'rb') as cache:
+            if pickle.load(cache) == header:
+                return pickle.load(cache)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError): # True for missing or damaged snapshots.
+        pass
+    data = parse(path)
+    temporary = None
+    try: # Writes the new snapshot to a temporary file of its own first, so that a partial snapshot is never read, even if several processes write at once.
+        os.makedirs(cache_folder, mode=0o700, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_folder, prefix=os.path.basename(snapshot), suffix=".tmp", delete=False) as cache:
+            temporary = cache.name
+            pickle.dump(header, cache, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, cache, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, snapshot)
+    except OSError: # Snapshots are optional, such as without a writable home folder.
+        if temporary and os.path.exists(temporary):
+            os.remove(temporary)
+    return data
+
+def read_table(path):
+    """ Reads a tab-separated text file and returns a dictionary keyed by the first column. Rows are truncated to the length of the shortest row. Ex={"distance": ['d', '0', 'l;s;r', 'm']} """
+    with open(path, 'r', encoding='utf-8') as database:
+        rows = [line.strip().split('\t') for line in database]
+    width = min(len(row) for row in rows) # Matches the former zip(*...) transposition.
+    table = {}
+    for row in rows:
+        table[row[0]] = row[1:width]
+    return table
+
+def load_unit_database(path="database_units.txt", cache=True):
+    """ Returns the saved conversions and quantities for particular combinations of base units. Ex={"per_second": ['<conversions>', '<quantities>']} """
+    if cache:
+        return load_cached(path, "table", read_table)
+    return read_table(path)
+
+def load_symbol_database(path="database_clx.txt", cache=True):
+    """ Returns the saved symbols of each entry in Symbol Manager. Ex={"distance": ['d', '0', 'l;s;r', 'm', '0', 'quantity']} """
+    if cache:
+        return load_cached(path, "table", read_table)
+    return read_table(path)
+
+def load_conversion_database(path="database_conversions.txt", cache=True):
+    """ Returns the base equivalent and value of each non-base unit. Ex={"eV": [['g', 'm', 'm', '-s', '-s'], 1.602e-16]} """
+    if cache:
+        return load_cached(path, "conversions", read_conversions)
+    return read_conversions(path)
+
+def read_conversions(path):
+    """ Reads database_conversions.txt. See load_conversion_database(). """
+    conversion_database = {}
+    for name, data in read_table(path).items():
+        convert_list = data[0].replace("'", "").strip("[]").split(", ")
+        conversion_database[name] = [convert_list, float(data[1])]
+    return conversion_database
@@ -0,0 +1,104 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Dimensions
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Indexes Symbol Manager entries by the dimensions of their Units column, so that every quantity with the same dimensions as the current set of units in Unit Manager can be
+## found with a single dictionary lookup. Units are reduced to base units, so that "J", "kg⸱m²⸱s⁻²", and "g⸱m²⸱s⁻²" share one dimension signature.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction
+from .engine import base_symbols
+from .expressions import ExpressionParser
+
+#############################################################################################################################################################################################
+## Global datasets
+dimension_count = len(base_symbols) - 1 # Number of base dimensions. The final base symbol, "1", is dimensionless.
+
+#############################################################################################################################################################################################
+## Classes
+class DimensionIndex(object):
+    """ Maps dimension signatures to the Symbol Manager entries that have them. A signature is the tuple of base unit exponents in the order of base_symbols.
+        Ex=DimensionIndex(engine, notation_database_dictionary).related_to_current() → ['energy', 'heat', 'work', ...] """
+    def __init__(self, engine, database=None):
+        self.engine = engine # Provides the base equivalents of non-base units.
+        self.parser = None # Reads the Units column. Rebuilt with the conversion database in build().
+        self.signatures = {} # Holds the signature of each Units string, or None if it cannot be read. Ex={'g⸱m²⸱s⁻²': (0, 0, 1, 0, 2, 0, -2)}
+        self.entries = {} # Holds the signature of each entry. Ex={'energy': (0, 0, 1, 0, 2, 0, -2)}
+        self.index = {} # Holds the entries with each signature, in the order they were added. Ex={(0, 0, 1, 0, 2, 0, -2): {'energy': None, 'work': None}}
+        if database is not None:
+            self.build(database)
+
+    def build(self, database):
+        """ Replaces the contents of the index with a symbol database. Also used after the conversion database changes. Ex=build({"distance": ['d', '0', 'l;s;r', 'm', '0', 'quantity']}) """
+        self.parser = ExpressionParser(base_symbols[:-1] + [symbol for symbol in self.engine.conversion_database if not symbol.startswith("-")])
+        self.signatures.clear()
+        self.entries.clear()
+        self.index.clear()
+        for name, data in database.items():
+            self.add(name, data)
+
+    def signature(self, units):
+        """ Returns the dimension signature of a Units string, or None for text such as "<none>" that cannot be read as units. Ex=signature("kg⸱m²⸱s⁻²") → (0, 0, 1, 0, 2, 0, -2) """
+        if units in self.signatures:
+            return self.signatures[units]
+        if units.strip() in ("", "0"): # True for absent units.
+            return None
+        try:
+            value, unit_list = self.parser.parse(units)
+        except ValueError:
+            unit_list = None
+        exponents = [Fraction(0)] * dimension_count
+        for prefix, symbol, exponent in unit_list or ():
+            if symbol in base_symbols[:-1]:
+                exponents[base_symbols.index(symbol)] += exponent
+                continue
+            equivalent = self.engine.conversion_vector(symbol)
+            if equivalent is None: # True for unknown units.
+                unit_list = None
+                break
+            for i in range(min(dimension_count, len(equivalent))):
+                exponents[i] += equivalent.exponent(i) * exponent
+        signature = tuple(exponents) if unit_list is not None else None
+        self.signatures[units] = signature
+        return signature
+
+    def add(self, name, data):
+        """ Adds or updates a single entry. Ex=add("distance", ['d', '0', 'l;s;r', 'm', '0', 'quantity']) """
+        self.remove(name)
+        signature = self.signature(data[3])
+        if signature is not None:
+            self.entries[name] = signature
+            self.index.setdefault(signature, {})[name] = None
+
+    def remove(self, name):
+        """ Removes a single entry, if present. """
+        signature = self.entries.pop(name, None)
+        if signature is not None:
+            del self.index[signature][name]
+            if not self.index[signature]:
+                del self.index[signature]
+
+    def rename(self, old_name, new_name, data):
+        """ Replaces an entry with the same data under another name. """
+        self.remove(old_name)
+        self.add(new_name, data)
+
+    def related(self, signature):
+        """ Returns the entries with a dimension signature. """
+        return list(self.index.get(signature, ()))
+
+    def current_signature(self):
+        """ Returns the dimension signature of the current set of units in the engine, or None if it holds a user-defined unit without a base equivalent. """
+        exponents, value = self.engine.base_exponents()
+        for i in range(len(base_symbols), len(exponents)):
+            if exponents.numerators[i]:
+                return None
+        return tuple(exponents.exponent(i) for i in range(dimension_count))
+
+    def related_to_current(self):
+        """ Returns the entries with the same dimensions as the current set of units in the engine. """
+        signature = self.current_signature()
+        return self.related(signature) if signature is not None else []
@@ -0,0 +1,532 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Unit Engine
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## This module holds the dimensional analysis pipeline of Unit Manager without any reference to tkinter. The GUI in CLX_2.6.2.py owns a single UnitEngine and forwards each button
+## press to it, while batch jobs may create as many engines as they need. All of the data that Unit Manager previously kept in module-level globals is held as attributes of the
+## engine, and the attribute names match the former globals so that the comments and examples throughout the project still apply.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from collections import OrderedDict # Used as a least recently used cache of unit names.
+from fractions import Fraction # Used in simplifying fractional exponents.
+from .exponents import ExponentVector, power
+from .formatting import join_significand, significand_exponent
+from .superscripts import exponent_string, split_exponent
+from .prefixes import prefix_value, select_prefix
+from .timing import StageTimer
+
+#############################################################################################################################################################################################
+## Global datasets
+unit_names = ["candela", "coulomb", "gram", "kelvin", "meter", "mole", "second", "1"] # Indexed, immutable list of names of base units.
+base_symbols = ["cd", "C", "g", "K", "m", "mol", "s", "1"] # Indexed, immutable list of base unit symbols.
+name_cache_size = 256 # Maximum number of units held by each engine's name_cache.
+
+#############################################################################################################################################################################################
+## Functions
+def favorite_key(csv_unit_saved):
+    """ Returns a comparable form of a line of database_favorites.txt in which the order of the unit symbols does not matter. Older favorites list their symbols in the
+        order that the buttons were pressed. Ex=('m⁻¹', ('-mi',), '0;0;0;0;0;0;0;0;1;0', '0;0;0;0;0;0;0;0;0;0', '1.0') """
+    csv_units = csv_unit_saved.split(", ")
+    if len(csv_units) < 4: # True for empty or malformed lines.
+        return tuple(csv_units)
+    return (csv_units[0], tuple(sorted(csv_units[1:-3]))) + tuple(csv_units[-3:])
+
+def saved_number(value):
+    """ Writes a prefix value in the format of database_favorites.txt. Fractions from exact mode are written as integers or decimals. Ex=saved_number(Fraction(1, 1000)) → '0.001' """
+    if isinstance(value, Fraction):
+        if value.denominator == 1:
+            return str(value.numerator)
+        return str(float(value))
+    return str(value)
+
+#############################################################################################################################################################################################
+## Classes
+class UnitEngine(object):
+    """ Holds the current set of units and runs the Unit Manager pipeline. Ex=UnitEngine(conversion_database, unit_database).reduce() """
+    def __init__(self, conversion_database=None, unit_database=None, exact=False, timer=None):
+        self.conversion_database = conversion_database if conversion_database is not None else {} # Holds a selection of non-base units for conversion to base units.
+        self.unit_database = unit_database if unit_database is not None else {} # Holds information about particular combinations of base units.
+        self.positive_numerator_symbols = base_symbols[:] # Indexed, mutable list of positive unit symbols.
+        self.negative_numerator_symbols = ["-" + symbol if symbol != "1" else symbol for symbol in base_symbols] # Indexed, mutable list of negative unit symbols.
+        self.positive_denominator_symbols = ["_" + symbol if symbol != "1" else symbol for symbol in base_symbols] # Indexed, mutable list of fractional unit symbols.
+        self.numerator_value_list = [0, 0, 0, 0, 0, 0, 0, 0] # Prefix value of all units in the numerator.
+        self.denominator_value_list = [0, 0, 0, 0, 0, 0, 0, 0] # Prefix value of all units in the denominator.
+        self.positive_numerator_custom_array = [] # Positive exponents of base and user-defined units. Ex=[0, 0, 0, 0, 0, 0, 0, 0, 2]
+        self.negative_numerator_custom_array = [] # Negative exponents of base and user-defined units. Ex=[0, 0, 0, 0, 0, 0, 0, 0, 0]
+        self.exponent_tuple_array = [] # Simplified [numerator, denominator] exponent of each unit. Ex=[[0, 1], [0, 1], [0, 1], [0, 1], [3, 2], [0, 1], [0, 1], [0, 1]]
+        self.exponent_tuple_array_custom = [] # Unsimplified [numerator, denominator] exponent of each unit.
+        self.symbol_indexes = {} # Maps each unit symbol to its index and sign. Ex={"m": (4, 1), "-m": (4, -1), "_m": (4, 0)}
+        for i in range(len(base_symbols)-1): # Excludes "1".
+            self.index_symbol(i)
+        self.exponents = ExponentVector(len(base_symbols)) # Exponents of the current base and user-defined units.
+        self.conversion_vectors = {} # Caches the base exponents of non-base units. Ex={"eV": (['g', 'm', 'm', '-s', '-s'], ExponentVector(...))}
+        self.name_cache = OrderedDict() # Maps exponents.key() to the output of consolidate_current_unit_list() and name_creator(), most recently used last.
+        self.current_unit_name = [] # Ex=['meter_squared_per_second_squared']
+        self.current_unit_data = None # The unit_database row of current_unit_name. Ex=['<conversions>', '<quantities>']
+        self.current_unit_consolidated = [] # Ex=["m²", "s⁻²"]
+        self.current_unit_custom = [] # Ex=["eV", "s⁻¹"]
+        self.current_unit_reduced = [] # Ex=["eV", "s"]
+        self.units_exponents_totals = [] # Ex=[["s²", "s", 2, 2], ["eV", "eV", 1, 1000000]]
+        self.compound_units_list = [] # Ex=[["eV", "M", 1], ["s⁻¹", "k", 100]]
+        self.significand_order_units = [] # Ex=["1.23", 3, ["eV", "s⁻¹"]]
+        self.current_display = [] # Ex=["1.23×10⁻¹", "MeV", "s⁻¹"]
+        self.exact = exact # Keeps every value as a Fraction until it is displayed. Set with set_exact().
+        self.binary = False # Describes values of at least 1024 with binary prefixes (Ki, Mi, Gi, etc.) instead of SI prefixes.
+        self.current_value = self.number(1) # Total numerical value of the current units, not including current prefixes.
+        self.reduced_value = 1 # Total numerical value after the leftover prefix values have been absorbed. Only used for display.
+        self.timer = timer if timer is not None else StageTimer() # Records the time of each stage of reduce() once it is enabled. See coalexicon/timing.py.
+
+    def reduce(self):
+        """ Runs consolidate_current_unit_list() through significand_order_units_to_current_display() and returns current_display. Ex=["1.23×10⁻¹", "MeV", "s⁻¹"]
+            Unlike the former main_units(), this does not write leftover prefix values back into current_value, so repeated calls give the same result. """
+        timer = self.timer
+        with timer.stage("resolve_name"):
+            self.resolve_name()
+        with timer.stage("prefix_finder"):
+            self.prefix_finder()
+        with timer.stage("prefix_ladder"): # Chooses a prefix for each unit.
+            self.reduced_value = self.units_exponents_totals_to_compound_units_list()
+        with timer.stage("formatter"):
+            self.current_unit_custom_to_significand_order_units()
+            self.significand_order_units_to_current_display()
+        return self.current_display
+
+    def unit_data(self, unit_name=None):
+        """ Returns the unit_database row of the current unit, or None if no data is found. Ex=['<conversions>', '<quantities>'] """
+        if unit_name is None or unit_name == self.current_unit_name[0]:
+            return self.current_unit_data
+        return self.unit_database.get(unit_name)
+
+    def resolve_name(self):
+        """ Updates the exponent arrays, current_unit_custom, current_unit_consolidated, current_unit_name, and current_unit_data. Units that have been seen recently are
+            copied from name_cache instead of being rebuilt by consolidate_current_unit_list() and name_creator(). """
+        key = self.exponents.key()
+        cached = self.name_cache.get(key)
+        if cached is None:
+            with self.timer.stage("consolidate_current_unit_list"):
+                self.consolidate_current_unit_list()
+            with self.timer.stage("name_creator"):
+                unit_name = self.name_creator()
+            cached = (self.exponent_tuple_array, self.exponent_tuple_array_custom, self.positive_numerator_custom_array[:], self.negative_numerator_custom_array[:],
+                self.current_unit_custom[:], self.current_unit_consolidated[:], unit_name, self.unit_database.get(unit_name))
+            self.name_cache[key] = cached
+            if len(self.name_cache) > name_cache_size: # Removes the least recently used unit.
+                self.name_cache.popitem(last=False)
+        else:
+            self.name_cache.move_to_end(key)
+            self.exponent_tuple_array, self.exponent_tuple_array_custom = cached[0], cached[1]
+            self.positive_numerator_custom_array[:], self.negative_numerator_custom_array[:] = cached[2], cached[3]
+            self.current_unit_custom[:], self.current_unit_consolidated[:] = cached[4], cached[5]
+            self.current_unit_name[:] = [cached[6]]
+        self.current_unit_data = cached[7]
+        return cached[6]
+
+    def clear_name_cache(self):
+        """ Empties name_cache. Called whenever unit_database or conversion_database is edited or reloaded. """
+        self.name_cache.clear()
+        if self.current_unit_name:
+            self.current_unit_data = self.unit_database.get(self.current_unit_name[0])
+
+    def entry_data_finder(self, unit_symbol):
+        """ Searches for data corresponding to a non-base unit and returns its base equivalent. Ex=["cd", "-m", "-m"] """
+        if unit_symbol in self.conversion_database: # Returns a list of equivalent base units.
+            return self.conversion_database[unit_symbol][0]
+        else: # Returns zero if no data is found.
+            return 0
+
+    def number(self, value):
+        """ Converts a value for use in current_value, numerator_value_list, or denominator_value_list. In exact mode, floats and strings are read by their decimal
+            representation, so 0.001 becomes Fraction(1, 1000) instead of the nearest binary float. Ex=number("3.2") → Fraction(16, 5) """
+        if self.exact:
+            if isinstance(value, Fraction):
+                return value
+            if isinstance(value, float):
+                return Fraction(repr(value))
+            return Fraction(value)
+        if isinstance(value, str):
+            return float(value)
+        if isinstance(value, Fraction):
+            return float(value)
+        return value
+
+    def set_exact(self, exact=True):
+        """ Switches exact mode on or off and converts current_value and the prefix values to match. """
+        self.exact = exact
+        self.current_value = self.number(self.current_value)
+        self.numerator_value_list[:] = [self.number(value) for value in self.numerator_value_list]
+        self.denominator_value_list[:] = [self.number(value) for value in self.denominator_value_list]
+
+    @property
+    def current_unit_list(self):
+        """ Returns the current units as a list of symbols. Ex=["m", "m", "-s", "-s"] """
+        return self.exponents.to_symbols(self.positive_numerator_symbols, self.negative_numerator_symbols, self.positive_denominator_symbols)
+
+    def index_symbol(self, index):
+        """ Adds the positive, negative, and fractional symbols of a unit to symbol_indexes. """
+        self.symbol_indexes[self.positive_numerator_symbols[index]] = (index, 1)
+        self.symbol_indexes[self.negative_numerator_symbols[index]] = (index, -1)
+        self.symbol_indexes[self.positive_denominator_symbols[index]] = (index, 0)
+
+    def conversion_vector(self, unit_symbol):
+        """ Returns the base equivalent of a non-base unit as an ExponentVector, or None if no data is found. """
+        equivalent = self.entry_data_finder(unit_symbol) # Ex=["cd", "-m", "-m"]
+        if not equivalent:
+            return None
+        cached = self.conversion_vectors.get(unit_symbol)
+        if cached is None or cached[0] is not equivalent: # Rebuilds the vector if the database has been reloaded.
+            cached = (equivalent, ExponentVector.from_symbols(equivalent, self.symbol_indexes))
+            self.conversion_vectors[unit_symbol] = cached
+        return cached[1]
+
+    def base_exponents(self, iso=False):
+        """ Returns a copy of the current exponents with each non-base unit replaced by its base equivalent, and the product of their conversion values.
+            Fractional exponents apply to the whole equivalent. Setting iso keeps amperes.
+            Ex=(ExponentVector([0, 0, 1, 0, 2, 0, -2, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0, 0]), 1.602e-16), or for eV¹ᐟ², g¹ᐟ²⸱m⸱s⁻¹ and 1.602e-16 ** 0.5 """
+        exponents, value = self.exponents.copy(), 1
+        for i in range(len(base_symbols), len(self.positive_numerator_symbols)): # Iterates over each non-base unit.
+            exponent = exponents.exponent(i) # Ex=Fraction(-1, 2)
+            if exponent > 0:
+                unit_symbol = self.positive_numerator_symbols[i]
+            elif exponent < 0:
+                unit_symbol = self.negative_numerator_symbols[i]
+            else:
+                continue
+            if unit_symbol == "A" and iso:
+                continue
+            equivalent = self.conversion_vector(unit_symbol)
+            if equivalent is not None: # Replaces the non-base unit with its base equivalent.
+                exponents.set_exponent(i, 0)
+                exponents *= equivalent ** abs(exponent)
+                value *= power(self.number(self.conversion_database[unit_symbol][1]), abs(exponent))
+        return exponents, value
+
+    #########################################################################################################################################################################################
+    ## Operations
+    def add_symbol(self, unit):
+        """ Adds a user-defined unit to positive_numerator_symbols, negative_numerator_symbols, and positive_denominator_symbols and returns its index. """
+        if unit in self.positive_numerator_symbols:
+            return self.positive_numerator_symbols.index(unit)
+        self.positive_numerator_symbols.append(unit)
+        self.negative_numerator_symbols.append("-" + unit)
+        self.positive_denominator_symbols.append("_" + unit)
+        self.index_symbol(len(self.positive_numerator_symbols) - 1)
+        self.exponents.resize(len(self.positive_numerator_symbols))
+        while len(self.numerator_value_list) < len(self.positive_numerator_symbols): # The value lists may already be padded by favorite_string().
+            self.numerator_value_list.append(0)
+            self.denominator_value_list.append(0)
+        return len(self.positive_numerator_symbols) - 1
+
+    def update_units_and_values(self, button_index, operator, prefix_value=1, fractional=False):
+        """ Updates exponents, numerator_value_list, denominator_value_list, and current_value. For the operator variable, "×" corresponds to multiplication,
+            and "÷" corresponds to division. Setting fractional adds or removes a denominator from the exponent of the specified unit. """
+        numerators, roots = self.exponents.numerators, self.exponents.roots
+        prefix_value = self.number(prefix_value)
+        if not fractional: # Adds or removes a numerator from the exponent of the specified unit.
+            if operator == "×":
+                if self.numerator_value_list[button_index] == 0: # Updates the prefix value of the numerator for a previous value of zero.
+                    self.numerator_value_list[button_index] = prefix_value
+                else:
+                    self.numerator_value_list[button_index] *= prefix_value
+                numerators[button_index] += 1
+                if numerators[button_index] == 0: # Only true when a negative exponent reaches zero. Moves leftover value to current_value.
+                    self.absorb_prefix_values(button_index)
+            else: # True for "÷".
+                if self.denominator_value_list[button_index] == 0:
+                    self.denominator_value_list[button_index] = prefix_value
+                else:
+                    self.denominator_value_list[button_index] *= prefix_value
+                numerators[button_index] -= 1
+                if numerators[button_index] == 0: # Only true when a positive exponent reaches zero. Moves leftover value to current_value.
+                    self.absorb_prefix_values(button_index)
+        else:
+            if operator == "×":
+                roots[button_index] += 1
+                if numerators[button_index] == 0:
+                    numerators[button_index] = 1
+            else: # True for "÷".
+                if roots[button_index]: # Removes a denominator element from the exponent.
+                    if roots[button_index] == 1 and abs(numerators[button_index]) == 1:
+                        numerators[button_index] = 0
+                    roots[button_index] -= 1
+
+    def multiply_units(self, unit, exponent=1, prefix_value=1):
+        """ Multiplies the current units by a unit raised to an integer or fractional exponent, as if its buttons were pressed. Each press carries the prefix.
+            Presses are counted, so a unit should only be multiplied once. Use load_quantity() for units that repeat. Ex=multiply_units("eV", Fraction(-3, 2), 1000000) """
+        index = self.add_symbol(unit)
+        exponent = Fraction(exponent)
+        operator = "×" if exponent > 0 else "÷"
+        for _ in range(abs(exponent.numerator)):
+            self.update_units_and_values(index, operator, prefix_value)
+        for _ in range(exponent.denominator - 1):
+            self.update_units_and_values(index, "×", fractional=True)
+
+    def load_quantity(self, value, units):
+        """ Replaces the current units and value with a quantity read by ExpressionParser. The exponents of repeated units are added as fractions, and each prefix is
+            multiplied into the value instead of being kept as a prefix. Ex=load_quantity("4", [["k", "m", Fraction(1, 2)], ["", "m", 1]]) → 126.5 m³ᐟ² """
+        self.clear()
+        value = self.number(value)
+        for prefix, symbol, exponent in units: # Ex=["M", "eV", Fraction(-1, 2)]
+            index = self.add_symbol(symbol)
+            self.exponents.set_exponent(index, self.exponents.exponent(index) + exponent)
+            value *= power(self.number(prefix_value(prefix, self.exact)), exponent)
+        self.current_value = value
+
+    def absorb_prefix_values(self, button_index):
+        """ Moves the prefix values of a unit with an exponent of zero to current_value and resets its prefix counters. """
+        if self.numerator_value_list[button_index] == 0: # Initializes the value lists for computation.
+            self.numerator_value_list[button_index] = 1
+        if self.denominator_value_list[button_index] == 0:
+            self.denominator_value_list[button_index] = 1
+        self.current_value *= self.number(self.numerator_value_list[button_index]) / self.denominator_value_list[button_index]
+        self.numerator_value_list[button_index] *= 0
+        self.denominator_value_list[button_index] *= 0
+
+    def invert(self):
+        """ Sets the current units to their multiplicative inverse. """
+        self.exponents.invert()
+        self.current_value = self.current_value ** -1
+
+    def clear(self):
+        """ Clears exponents, current_display, numerator_value_list, denominator_value_list, and current_value. """
+        self.exponents.clear()
+        self.current_display.clear()
+        for i in range(len(self.numerator_value_list)):
+            self.numerator_value_list[i] *= 0
+        for i in range(len(self.denominator_value_list)):
+            self.denominator_value_list[i] *= 0
+        self.current_value = self.number(1)
+
+    def prefix_to_value(self, iso=False):
+        """ Converts all prefixes to their numerical equivalent and multiplies the current value by each, then removes the prefixes from the numerator and denominator lists.
+            Setting iso keeps the kilogram as the base unit of mass. """
+        self.reduce() # Ensures that units_exponents_totals reflects the current units.
+        value = 1
+        for i in range(len(self.units_exponents_totals)):
+            root = Fraction(1, self.exponents.roots[self.symbol_indexes[self.units_exponents_totals[i][1]][0]] + 1) # Ex=½ for km¹ᐟ², whose prefix is multiplied once for (km)¹ᐟ².
+            if self.units_exponents_totals[i][1] == "g" and iso:
+                value = 1000 ** self.units_exponents_totals[i][2]
+                if "⁻" not in self.units_exponents_totals[i][0]:
+                    self.current_value *= power(self.number(self.units_exponents_totals[i][-1]) / value, root)
+                else: # Ex=g⁻¹ is 1000 kg⁻¹.
+                    self.current_value /= power(self.number(self.units_exponents_totals[i][-1]) / value, root)
+            else:
+                if "⁻" not in self.units_exponents_totals[i][0]: # Handles numerators.
+                    self.current_value *= power(self.units_exponents_totals[i][-1], root)
+                else: # Handles denominators.
+                    self.current_value /= power(self.units_exponents_totals[i][-1], root)
+        for i in range(len(self.numerator_value_list)):
+            if i == 2 and iso and self.exponents.numerators[i]: # Keeps the kilogram as a prefix, also for grams loaded without prefix values by load_quantity().
+                self.numerator_value_list[i], self.denominator_value_list[i] = (value, 0) if self.exponents.numerators[i] > 0 else (0, value)
+            else:
+                if self.numerator_value_list[i]:
+                    self.numerator_value_list[i] = 1
+                if self.denominator_value_list[i]:
+                    self.denominator_value_list[i] = 1
+
+    def convert_to_base(self, iso=False):
+        """ Converts any non-base units to base units after merging all prefixes with the current value. Setting iso keeps kilograms and amperes. """
+        self.prefix_to_value(iso)
+        exponents, value = self.base_exponents(iso)
+        convert = exponents.numerators != self.exponents.numerators # True if any non-base units were replaced.
+        self.current_value *= value
+        if iso and convert: # Converts the grams of the replaced units to kilograms. Grams that were already present were converted by prefix_to_value().
+            self.current_value /= power(1000, exponents.exponent(2) - self.exponents.exponent(2)) # Ex=1000 ** 0.5 for eV¹ᐟ².
+            grams = exponents.numerators[2] # Count of the prefix, which prefix_finder() reads.
+            self.numerator_value_list[2], self.denominator_value_list[2] = (1000 ** grams, 0) if grams > 0 else (0, 1000 ** -grams) if grams < 0 else (0, 0)
+        self.exponents = exponents
+
+    def load_favorite(self, csv_units):
+        """ Loads a saved favorite. Ex_csv_units=['m⁻¹', '-mi', '0;0;0;0;0;0;0;0;1;0', '0;0;0;0;0;0;0;0;0;0', '1.0'] """
+        csv_units = csv_units[1:] # Removes the string of combined units.
+        for i in range(len(csv_units)-3): # Adds non-base units to the list of units.
+            if csv_units[i] not in self.symbol_indexes:
+                if csv_units[i][0] in "-_":
+                    self.add_symbol(csv_units[i][1:])
+                else:
+                    self.add_symbol(csv_units[i])
+        self.current_value = self.number(float(csv_units[-1])) # Loads the saved numerical value.
+        self.numerator_value_list[:] = [self.prefix_from_string(value) for value in csv_units[-2].split(';')]
+        self.denominator_value_list[:] = [self.prefix_from_string(value) for value in csv_units[-3].split(';')]
+        while len(self.numerator_value_list) < len(self.positive_numerator_symbols):
+            self.numerator_value_list.append(0)
+            self.denominator_value_list.append(0)
+        self.exponents = ExponentVector.from_symbols(csv_units[:-3], self.symbol_indexes, len(self.positive_numerator_symbols))
+
+    def prefix_from_string(self, value):
+        """ Converts a saved prefix value to a number. Ex='0.001' """
+        if self.exact:
+            return self.number(value)
+        if 0 <= float(value) < 1 and float(value) != 0.0:
+            return float(value)
+        else:
+            return int(value)
+
+    def favorite_string(self):
+        """ Returns the current set of units as a line of database_favorites.txt, or an empty string if no units have been processed.
+            Ex='m⁻¹, -mi, 0;0;0;0;0;0;0;0;1;0, 0;0;0;0;0;0;0;0;0;0, 1.0' """
+        unit_consolidated = "⸱".join(self.current_unit_consolidated) # Converts the current unit for display.
+        while len(self.numerator_value_list) < 15:
+            self.numerator_value_list.append(0)
+        while len(self.denominator_value_list) < 15:
+            self.denominator_value_list.append(0)
+        numerator_prefixes = ";".join([saved_number(value) for value in self.numerator_value_list])
+        denominator_prefixes = ";".join([saved_number(value) for value in self.denominator_value_list])
+        if self.exponents: # True if the current unit is not one.
+            csv_unit_list = ", ".join(self.current_unit_list)
+            return f"{unit_consolidated or '1'}, {csv_unit_list}, {denominator_prefixes}, {numerator_prefixes}, {float(self.current_value)}"
+        elif self.current_display: # True if the current unit is one.
+            return f"1, {denominator_prefixes}, {numerator_prefixes}, {float(self.current_value)}"
+        else: # True at startup.
+            return ""
+
+    #########################################################################################################################################################################################
+    ## Pipeline
+    def consolidate_current_unit_list(self):
+        """ Uses exponents to build exponent_tuple_array, exponent_tuple_array_custom, positive_numerator_custom_array, and negative_numerator_custom_array.
+            It converts ("simplifies") user-defined units to their base equivalent for naming and data recollection. """
+        base_exponents, _ = self.base_exponents() # Ex=ExponentVector([0, 0, 1, 0, 2, 0, -2, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0, 0])
+        numerators, roots = self.exponents.numerators, self.exponents.roots
+        self.exponent_tuple_array = [[exponent.numerator, exponent.denominator] for exponent in base_exponents.exponents()]
+        self.exponent_tuple_array_custom = [[exponent.numerator, exponent.denominator] for exponent in self.exponents.exponents()]
+        self.positive_numerator_custom_array[:] = [max(numerator, 0) for numerator in numerators]
+        self.negative_numerator_custom_array[:] = [max(-numerator, 0) for numerator in numerators]
+
+    def name_creator(self):
+        """ Generates a name for the current unit that may correspond to a unit_database entry, and updates current_unit_custom, current_unit_consolidated, and
+            current_unit_name. Ex='meter_squared_per_second_squared' """
+        positive_numerator_symbols = self.positive_numerator_symbols
+        units_display, counter = [], 0
+        unit_name = "one" # Sets the default value to unity.
+        for i in range(len(self.exponent_tuple_array_custom)): # Cycles through each base and non-base unit in the current list.
+            if len(positive_numerator_symbols) > 8: # Moves non-base units in front of base units.
+                if i + 8 >= len(positive_numerator_symbols):
+                    i = counter
+                    counter += 1
+                else:
+                    i += 8
+            numerator, denominator = self.exponent_tuple_array_custom[i]
+            if numerator != 0: # Specifies nonzero exponents. Ex=-2
+                units_display.append(positive_numerator_symbols[i] + exponent_string(numerator, denominator)) # Ex="m⁻³ᐟ²"
+        if any(exponent[0] for exponent in self.exponent_tuple_array): # False for unity.
+            positive_name_list, negative_name_list = [], []
+            for i in range(len(self.exponent_tuple_array)):
+                numerator, denominator = self.exponent_tuple_array[i]
+                if numerator == 0:
+                    continue
+                if i < 8: # Specifies base units.
+                    database = unit_names
+                else: # Specifies non-base units.
+                    database = positive_numerator_symbols
+                name_list = positive_name_list if numerator > 0 else negative_name_list
+                name_list.append(self.exponent_name(database[i], abs(numerator), denominator))
+                name_list.append("_")
+            name_list = []
+            if negative_name_list:
+                positive_name_list.append("per_")
+                del negative_name_list[-1] # Removes the trailing underscore.
+            elif positive_name_list:
+                del positive_name_list[-1]
+            name_list.extend(positive_name_list)
+            name_list.extend(negative_name_list)
+            unit_name = "".join(name_list)
+        positive_units_display = [unit for unit in units_display if "⁻" not in unit] # Places units with positive exponents first.
+        negative_units_display = [unit for unit in units_display if "⁻" in unit]
+        self.current_unit_custom[:] = positive_units_display + negative_units_display
+        if self.current_unit_custom: # Verifies that the current unit is not one.
+            self.current_unit_consolidated[:] = self.current_unit_custom
+        else:
+            self.current_unit_consolidated[:] = ["1"]
+        self.current_unit_name[:] = [unit_name]
+        return unit_name
+
+    def exponent_name(self, name, numerator, denominator):
+        """ Returns the name of a unit with a positive exponent. Ex='meter_squared' """
+        if denominator == 1:
+            if numerator == 1:
+                return name
+            elif numerator == 2:
+                return f"{name}_squared"
+            elif numerator == 3:
+                return f"{name}_cubed"
+            else:
+                return f"{name}_{numerator}"
+        elif denominator == 2:
+            if numerator == 2:
+                return name
+            elif numerator == 4:
+                return f"{name}_squared"
+            elif numerator == 6:
+                return f"{name}_cubed"
+        elif denominator == 3:
+            if numerator == 3:
+                return name
+            elif numerator == 6:
+                return f"{name}_squared"
+        return f"{name}_{numerator}/{denominator}"
+
+    def prefix_finder(self):
+        """ Updates units_exponents_totals and current_unit_reduced. Ex=[["s²", "s", 2, 2], ["eV", "eV", 1, 1000000]] """
+        positive_numerator_symbols = self.positive_numerator_symbols
+        self.units_exponents_totals.clear()
+        self.current_unit_reduced[:] = self.current_unit_custom
+        symbols_indexes_exponents, counter = {}, 0
+        for i in range(len(self.current_unit_custom)): # Removes numerical exponents and produces a list of their values. Ex=["m²", "s⁻²"]
+            symbol, exponent = split_exponent(self.current_unit_custom[i], self.symbol_indexes) # Ex=("s", Fraction(-2, 1))
+            self.current_unit_reduced[i] = symbol
+            index = self.symbol_indexes[symbol][0]
+            if exponent < 0:
+                symbols_indexes_exponents[index] = [self.current_unit_custom[i], self.negative_numerator_custom_array[index]]
+            else:
+                symbols_indexes_exponents[index] = [self.current_unit_custom[i], self.positive_numerator_custom_array[index]]
+        for i in range(len(positive_numerator_symbols)): # Finds optimal units with respect to the exponent of each current unit.
+            if len(positive_numerator_symbols) > 8: # Moves non-base units in front of base units.
+                if i + 8 >= len(positive_numerator_symbols):
+                    i = counter
+                    counter += 1
+                else:
+                    i += 8
+            if i in symbols_indexes_exponents: # Targets units with nonzero exponents.
+                unit_display, exponent = symbols_indexes_exponents[i]
+                units_exponent_total = [unit_display, positive_numerator_symbols[i], exponent] # Ex=['s⁻²', 's', 2]
+                if self.numerator_value_list[i] != 0 and self.denominator_value_list[i] != 0: # Calculates total value for each unit.
+                    if self.negative_numerator_custom_array[i] == 0:
+                        total_value = self.number(self.numerator_value_list[i]) / self.denominator_value_list[i]
+                    else:
+                        total_value = self.number(self.denominator_value_list[i]) / self.numerator_value_list[i]
+                elif self.numerator_value_list[i] != 0:
+                    total_value = self.numerator_value_list[i]
+                elif self.denominator_value_list[i] != 0:
+                    total_value = self.denominator_value_list[i]
+                else:
+                    total_value = 1
+                units_exponent_total.append(total_value) # Ex=['s⁻²', 's', 2, 1000000]
+                self.units_exponents_totals.append(units_exponent_total)
+
+    def units_exponents_totals_to_compound_units_list(self):
+        """ Looks at units_exponents_totals to determine compound prefixes and update compound_units_list. Returns current_value with all leftover prefix values included. """
+        value = self.current_value
+        self.compound_units_list.clear()
+        for units_exponent_total in self.units_exponents_totals: # Looks through all current units.
+            total, exponent = units_exponent_total[3], units_exponent_total[2]
+            prefix, leftover_value = select_prefix(total, exponent, self.binary) # Ex=("M", 1) for a total of 10¹² and an exponent of 2.
+            if "⁻" in units_exponent_total[0]: # Updates the value for a negative exponent.
+                value /= leftover_value
+            else: # Updates the value for a positive exponent.
+                value *= leftover_value
+            self.compound_units_list.append([units_exponent_total[0], prefix])
+        return value
+
+    def current_unit_custom_to_significand_order_units(self):
+        """ Looks at compound_units_list and reduced_value to output significand_order_units. Ex=["1.23", 3, [["eV", "M"], ["s⁻¹", ""]]] """
+        significand, exponent = significand_exponent(self.reduced_value) # Exact values are only rounded here, for display.
+        self.significand_order_units = [significand, exponent, self.compound_units_list]
+
+    def significand_order_units_to_current_display(self):
+        """ Writes the current value in scientific notation and attaches current prefixes to their respective units. Updates current_display. """
+        significand, exponent, units = self.significand_order_units
+        self.current_display[:] = [join_significand(significand, exponent)] # Adds the current numerical value in scientific notation. Ex="1.23×10⁻¹"
+        for unit in units:
+            self.current_display.append(unit[1] + unit[0]) # Adds each unit to the list.
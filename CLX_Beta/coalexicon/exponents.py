@@ -0,0 +1,158 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Exponent Vectors
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Unit Manager used to keep the current unit as a list of symbol strings, with one entry per multiplication. Every button press then counted and removed strings from that list,
+## which becomes slow for large exponents such as m²⁰. An ExponentVector instead keeps two integers for each base and user-defined unit, in the same order as
+## positive_numerator_symbols, so that multiplying, dividing, and inverting units only costs one pass over the units.
+## Button presses change the two integers one count at a time, as the list of strings did. Multiplying, dividing, and raising whole vectors to a power instead adds or scales the
+## exponents as fractions, and stores each result in lowest terms, since counts cannot be added directly. Ex=m¹ᐟ² × m¹ᐟ² is m, where adding the counts would give m²ᐟ³.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from array import array # Compact storage for the integer exponents.
+from fractions import Fraction # Used in simplifying fractional exponents.
+
+#############################################################################################################################################################################################
+## Functions
+def power(value, exponent):
+    """ Raises a value to a fractional exponent. Whole exponents keep integers and Fractions exact, while other exponents give floats. Ex=power(Fraction(1, 1000), Fraction(2)) → Fraction(1, 1000000) """
+    exponent = Fraction(exponent)
+    if exponent.denominator == 1:
+        return value ** exponent.numerator
+    return float(value) ** float(exponent)
+
+#############################################################################################################################################################################################
+## Classes
+class ExponentVector(object):
+    """ Holds the exponent of each base and user-defined unit as a pair of integers. The exponent of unit i is numerators[i] / (roots[i] + 1), where numerators[i] counts
+        multiplications (positive) or divisions (negative), and roots[i] counts fractional exponents added with the fraction button. Exponents combined by the operators
+        below are stored in lowest terms. Ex=m⁻³ᐟ² → numerators=[0, 0, 0, 0, -3, 0, 0, 0], roots=[0, 0, 0, 0, 1, 0, 0, 0] """
+    __slots__ = ("numerators", "roots")
+
+    def __init__(self, size=8):
+        self.numerators = array('l', [0]) * size # Ex=array('l', [0, 0, 0, 0, 2, 0, -2, 0])
+        self.roots = array('l', [0]) * size # Ex=array('l', [0, 0, 0, 0, 0, 0, 0, 0])
+
+    @classmethod
+    def from_symbols(cls, unit_list, symbol_indexes, size=8):
+        """ Builds a vector from a list of unit symbols. The symbol_indexes dictionary maps each symbol to its index and sign, where the sign is 1 for "m", -1 for "-m",
+            and 0 for "_m". Symbols that are not found, such as "1", are ignored. Ex_unit_list=["m", "m", "-s", "-s"] """
+        vector = cls(size)
+        for symbol in unit_list:
+            if symbol in symbol_indexes:
+                index, sign = symbol_indexes[symbol]
+                if index >= len(vector.numerators):
+                    vector.resize(index + 1)
+                if sign:
+                    vector.numerators[index] += sign
+                else:
+                    vector.roots[index] += 1
+        return vector
+
+    def to_symbols(self, positive_numerator_symbols, negative_numerator_symbols, positive_denominator_symbols):
+        """ Returns the vector as a list of unit symbols, which is the format saved in database_favorites.txt. Ex=["m", "m", "-s", "-s"] """
+        unit_list = []
+        for i in range(len(self.numerators)):
+            if self.numerators[i] > 0:
+                unit_list.extend([positive_numerator_symbols[i]] * self.numerators[i])
+            elif self.numerators[i] < 0:
+                unit_list.extend([negative_numerator_symbols[i]] * -self.numerators[i])
+            if self.roots[i]:
+                unit_list.extend([positive_denominator_symbols[i]] * self.roots[i])
+        return unit_list
+
+    def key(self):
+        """ Returns a hashable snapshot of the vector for use as a dictionary key. """
+        return self.numerators.tobytes() + self.roots.tobytes()
+
+    def copy(self):
+        """ Returns an independent copy of the vector. """
+        vector = ExponentVector(0)
+        vector.numerators = array('l', self.numerators)
+        vector.roots = array('l', self.roots)
+        return vector
+
+    def resize(self, size):
+        """ Lengthens the vector with zero exponents, such as when a user-defined unit is added. """
+        if size > len(self.numerators):
+            self.numerators.extend([0] * (size - len(self.numerators)))
+            self.roots.extend([0] * (size - len(self.roots)))
+
+    def clear(self):
+        """ Sets every exponent to zero without changing the size of the vector. """
+        for i in range(len(self.numerators)):
+            self.numerators[i] = 0
+            self.roots[i] = 0
+
+    def count(self):
+        """ Returns the number of symbols that the vector would have as a list. Ex=4 for ["m", "m", "-s", "-s"] """
+        return sum(abs(numerator) for numerator in self.numerators) + sum(self.roots)
+
+    def exponent(self, index):
+        """ Returns the simplified exponent of a single unit. Ex=Fraction(-3, 2) """
+        return Fraction(self.numerators[index], self.roots[index] + 1)
+
+    def exponents(self):
+        """ Returns the simplified exponent of every unit. """
+        return [Fraction(self.numerators[i], self.roots[i] + 1) for i in range(len(self.numerators))]
+
+    def set_exponent(self, index, exponent):
+        """ Sets the exponent of a single unit, stored in lowest terms. Ex=set_exponent(4, Fraction(-3, 2)) → numerators[4] = -3, roots[4] = 1 """
+        exponent = Fraction(exponent)
+        if index >= len(self.numerators):
+            self.resize(index + 1)
+        self.numerators[index] = exponent.numerator
+        self.roots[index] = exponent.denominator - 1
+
+    def invert(self):
+        """ Sets the vector to its multiplicative inverse. Fractional exponents keep their roots. """
+        for i in range(len(self.numerators)):
+            self.numerators[i] = -self.numerators[i]
+        return self
+
+    def inverse(self):
+        """ Returns the multiplicative inverse of the vector. """
+        return self.copy().invert()
+
+    def __imul__(self, other):
+        """ Multiplies the units of two vectors by adding their exponents. Ex=m¹ᐟ² × m¹ᐟ² → m """
+        self.resize(len(other.numerators))
+        for i in range(len(other.numerators)):
+            if other.numerators[i]: # Skips units that are absent from other.
+                self.set_exponent(i, self.exponent(i) + other.exponent(i))
+        return self
+
+    def __mul__(self, other):
+        return self.copy().__imul__(other)
+
+    def __itruediv__(self, other):
+        """ Divides the units of two vectors by subtracting their exponents. Ex=m³ᐟ² ÷ m¹ᐟ² → m """
+        self.resize(len(other.numerators))
+        for i in range(len(other.numerators)):
+            if other.numerators[i]:
+                self.set_exponent(i, self.exponent(i) - other.exponent(i))
+        return self
+
+    def __truediv__(self, other):
+        return self.copy().__itruediv__(other)
+
+    def __pow__(self, exponent):
+        """ Raises the units to an integer or fractional power. Ex=vector ** 2, vector ** Fraction(1, 2) """
+        vector, exponent = self.copy(), Fraction(exponent)
+        for i in range(len(vector.numerators)):
+            if vector.numerators[i]:
+                vector.set_exponent(i, vector.exponent(i) * exponent)
+        return vector
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __bool__(self):
+        """ False for unity. """
+        return any(self.numerators) or any(self.roots)
+
+    def __repr__(self):
+        return f"ExponentVector({list(self.numerators)}, {list(self.roots)})"
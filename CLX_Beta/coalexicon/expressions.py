@@ -0,0 +1,124 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Expressions
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Reads quantities written as text, such as "3.2 MeV/s" or "9.81 kg⸱m⸱s⁻²", into a value and a list of prefixed units with exponents. The units are resolved against the
+## symbols of base_symbols and conversion_database, so that symbols which contain a prefix or a slash themselves (Ex=mi, eV/c) are not split apart. Numbers between the
+## units are multiplied into the value. Ex="1 1/s", "2 m⋅3 s"
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import re # Used to read numbers and exponents.
+from fractions import Fraction # Used for fractional exponents.
+from .exponents import power
+from .prefixes import binary_powers, prefix_powers
+from .superscripts import exponent_characters, split_exponent
+
+#############################################################################################################################################################################################
+## Global datasets
+number_pattern = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)") # Ex="3.2", "1e-3"
+exponent_pattern = re.compile(r"(?:\^|\*\*)\(?([-+]?\d+)(?:/(\d+))?\)?") # Ex="^2", "**-1", "^(3/2)"
+separators = " *·⋅⸱/" # Characters that separate units. A slash divides the unit that follows it.
+prefix_symbols = sorted([*prefix_powers, *binary_powers], key=len, reverse=True) # Longer prefixes are tried first. Ex=["da", "Ki", ..., "k", "m"]
+
+#############################################################################################################################################################################################
+## Classes
+class ExpressionParser(object):
+    """ Reads quantities written as text using a fixed set of known unit symbols. Ex=ExpressionParser(symbols).parse("3.2 MeV/s") → ("3.2", [["M", "eV", 1], ["", "s", -1]]) """
+    def __init__(self, symbols):
+        self.symbols = frozenset(symbols) # Ex={"g", "m", "eV", "eV/c"}
+        self.slash_symbols = sorted([symbol for symbol in self.symbols if "/" in symbol], key=len, reverse=True) # Ex=["ℏc/eV", "eV/c"]
+
+    def split_prefix(self, unit):
+        """ Separates a prefix from a unit symbol. Known symbols are never split, and unknown symbols without a known prefix are returned unchanged.
+            Ex=split_prefix("MeV") → ("M", "eV"), split_prefix("mi") → ("", "mi"), split_prefix("kg") → ("k", "g") """
+        if unit in self.symbols:
+            return "", unit
+        for prefix in prefix_symbols:
+            if unit.startswith(prefix) and unit[len(prefix):] in self.symbols:
+                return prefix, unit[len(prefix):]
+        return "", unit
+
+    def slash_symbol_end(self, text, position):
+        """ Returns the end of a symbol that contains a slash, such as "eV/c" or "keV/c", if one begins at position. Otherwise returns position. """
+        for symbol in self.slash_symbols:
+            start = text.find(symbol, position)
+            if start == -1:
+                continue
+            if text[position:start] in prefix_symbols or start == position: # Allows a prefix in front of the symbol.
+                return start + len(symbol)
+        return position
+
+    def parse_units(self, text, factors=None):
+        """ Reads a product of units and returns a list of [prefix, symbol, exponent]. Exponents may be written in superscript or after "^" or "**".
+            Numbers are added to factors as (number, exponent), or rejected if factors is not given. Ex=parse_units("MeV/s") → [["M", "eV", Fraction(1, 1)], ["", "s", Fraction(-1, 1)]] """
+        units = []
+        position, sign = 0, 1
+        while position < len(text):
+            character = text[position]
+            if character in separators:
+                if character == "/":
+                    sign = -1
+                position += 1
+                continue
+            end = position
+            if self.slash_symbols and "/" in text[position:]:
+                end = self.slash_symbol_end(text, position)
+            while end < len(text) and (text[end] not in separators or text.startswith("**", end)):
+                if text[end] == "(" and ")" in text[end:]: # Keeps exponents such as "^(3/2)" together.
+                    end = text.index(")", end) + 1
+                else:
+                    end += 2 if text.startswith("**", end) else 1 # Skips the exponent operator.
+            token = text[position:end] # Ex="MeV", "m²", "s^-2"
+            exponent_match = exponent_pattern.search(token)
+            if exponent_match and exponent_match.end() == len(token):
+                unit = token[:exponent_match.start()]
+                exponent = Fraction(int(exponent_match.group(1)), int(exponent_match.group(2) or 1))
+            elif token[-1] in exponent_characters:
+                unit, exponent = split_exponent(token, self.symbols)
+                if unit not in self.symbols: # True for prefixed units. Ex="kg⁻¹"
+                    unit, exponent = split_exponent(token)
+            else:
+                unit, exponent = token, Fraction(1)
+            if not unit or "(" in unit or ")" in unit or (factors is None and number_pattern.fullmatch(unit)):
+                raise ValueError(f"Cannot read the unit {token!r}")
+            if number_pattern.fullmatch(unit): # Ex="1" in "1 1/s", "10³"
+                factors.append((unit, exponent * sign))
+                position, sign = end, 1
+                continue
+            prefix, symbol = self.split_prefix(unit)
+            units.append([prefix, symbol, exponent * sign])
+            position, sign = end, 1
+        return units
+
+    def parse(self, text):
+        """ Reads a number followed by units. The number defaults to one if it is omitted. Numbers between the units are multiplied into it, exactly unless they have
+            fractional exponents. Ex=parse("3.2 MeV/s") → ("3.2", [["M", "eV", 1], ["", "s", -1]]), parse("2 m 3 s") → (Fraction(6, 1), [["", "m", 1], ["", "s", 1]]) """
+        match = number_pattern.match(text)
+        if match and not exponent_pattern.match(text, match.end()) and text[match.end():match.end()+1] not in exponent_characters: # A number with an exponent is read as a factor. Ex="10³ m"
+            value, text = match.group(1), text[match.end():]
+        else:
+            value = "1"
+        factors = []
+        units = self.parse_units(text.strip(), factors)
+        if factors:
+            value = Fraction(value)
+            for number, exponent in factors:
+                value *= power(Fraction(number), exponent)
+        return value, units
+
+#############################################################################################################################################################################################
+## Functions
+def convert_expression(engine, parser, text, iso=False):
+    """ Loads a quantity into a UnitEngine, converts it to base units, and returns the value, the base units, and the unit_database name.
+        Setting iso keeps kilograms and amperes. Raises ValueError for units that are not known to the parser. Ex=convert_expression(engine, parser, "3.2 MeV/s") → (5.1264e-10, 'g⸱m²⸱s⁻³', 'gram_meter_squared_per_second_cubed') """
+    value, units = parser.parse(text)
+    for prefix, symbol, exponent in units:
+        if symbol not in parser.symbols: # Ex="foo", "MeVs"
+            raise ValueError(f"Unknown unit {prefix + symbol!r}")
+    engine.load_quantity(value, units) # Adds the exponents of repeated units as fractions. Ex="m^(1/2) m" → m³ᐟ²
+    engine.convert_to_base(iso)
+    engine.reduce()
+    return engine.reduced_value, "⸱".join(engine.current_display[1:]) or "1", engine.current_unit_name[0]
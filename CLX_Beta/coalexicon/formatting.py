@@ -0,0 +1,87 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Formatting
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Writes numerical values in the scientific notation used by the Unit Manager display. Ex=1.23×10⁻¹
+## The order of magnitude is found with a single logarithm instead of searching through powers of ten, so that any exponent, negative values, and zero are handled alike.
+## Infinite and undefined float values have no order of magnitude, and are written as "inf", "-inf", and "nan".
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction # Exact values are formatted without converting them to floats first.
+from math import floor, isfinite, log10
+from .superscripts import superscript
+
+#############################################################################################################################################################################################
+## Functions
+def order_of_magnitude(value):
+    """ Returns the exponent of the largest power of ten that does not exceed a positive value. Ex=order_of_magnitude(0.0123) → -2 """
+    if isinstance(value, Fraction): # Avoids float overflow for very large or very small exact values.
+        exponent = floor(log10(value.numerator) - log10(value.denominator))
+    else:
+        exponent = floor(log10(value))
+    if value < power_of(exponent): # Corrects rounding in the logarithm.
+        exponent -= 1
+    elif value >= power_of(exponent + 1):
+        exponent += 1
+    return exponent
+
+def power_of(exponent):
+    """ Returns 10 ** exponent exactly. Ex=power_of(-2) → Fraction(1, 100) """
+    if exponent >= 0:
+        return 10 ** exponent
+    return Fraction(1, 10 ** -exponent)
+
+def significand_exponent(value, digits=2):
+    """ Splits a value into its rounded significand and its exponent. The significand is empty for one and integer significands are written without decimals.
+        Ex=significand_exponent(0.123) → ('1.23', -1), significand_exponent(2000) → ('2', 3), significand_exponent(1000) → ('', 3) """
+    if value == 0:
+        return "0", 0
+    if isinstance(value, float) and not isfinite(value): # Ex=float('inf') after pressing large prefixes repeatedly in float mode.
+        return str(value), 0
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    exponent = order_of_magnitude(value)
+    if isinstance(value, (int, Fraction)) or abs(exponent) > 300: # Integer powers of ten beyond 10³⁰⁰ cannot be converted to floats.
+        significand = round(float(Fraction(value) / power_of(exponent)), digits)
+    elif exponent >= 0:
+        significand = round(value / 10 ** exponent, digits)
+    else:
+        significand = round(value * 10 ** -exponent, digits)
+    if significand >= 10: # True when rounding carries into the next order of magnitude. Ex=9.999 → 10.00
+        significand /= 10
+        exponent += 1
+    text = f"{significand:.{digits}f}" # Ex='1.23'
+    if text.rstrip("0").endswith("."): # Simplifies integer significands.
+        text = text.split(".")[0]
+    if text == "1" and (exponent != 0 or not sign): # True for unity.
+        text = ""
+    return sign + text, exponent
+
+def is_value(text):
+    """ True for a value written by scientific_notation(), as opposed to a unit. Ex=is_value('-1.23×10⁻¹') → True, is_value('m⁻¹') → False """
+    return text[:1].isdigit() or text[:1] == "-" or text in ("inf", "nan")
+
+def power_of_ten(exponent):
+    """ Returns a power of ten in superscript notation, or an empty string for 10⁰. Ex=power_of_ten(1) → '10', power_of_ten(-1) → '10⁻¹' """
+    if exponent == 0:
+        return ""
+    elif exponent == 1:
+        return "10"
+    return "10" + superscript(exponent)
+
+def scientific_notation(value, digits=2):
+    """ Writes a value in scientific notation with the given number of decimals in the significand. Ex=scientific_notation(-0.000123) → '-1.23×10⁻⁴' """
+    significand, exponent = significand_exponent(value, digits)
+    return join_significand(significand, exponent)
+
+def join_significand(significand, exponent):
+    """ Combines the output of significand_exponent() into a single string. Ex=join_significand('1.23', -1) → '1.23×10⁻¹' """
+    power = power_of_ten(exponent)
+    if significand and power:
+        if significand == "-":
+            return "-" + power
+        return f"{significand}×{power}"
+    return significand or power
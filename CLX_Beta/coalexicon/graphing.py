@@ -0,0 +1,180 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Graphing
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Evaluates and draws the equations of the Graphing Calculator. Each equation is compiled once and evaluated over a whole NumPy array of x values at a time, and a single figure
+## is kept for the life of the application, with its line updated in place for each new plot. Requires NumPy and matplotlib, so the GUI imports this module in the background.
+## In adaptive mode, intervals are split where a straight line between their ends would be visibly wrong on screen, so that points are spent where the curve bends, and the line
+## is broken at singularities such as x = 0 in 1/x instead of joining +∞ to -∞.
+## Equations may end with units, as in "x**2 * 3 MeV". The units are reduced by a UnitEngine once per equation, and the y-axis is labeled with the prefix that suits the plotted values.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from functools import lru_cache # Used to compile each equation once.
+from .prefixes import prefix_value, select_prefix
+from .superscripts import split_exponent
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+#############################################################################################################################################################################################
+## Global datasets
+math_names = {name: getattr(np, name) for name in ("sin", "cos", "tan", "arcsin", "arccos", "arctan", "sinh", "cosh", "tanh", "exp", "log", "log10", "log2", "sqrt", "abs", "pi", "e")}
+math_names.update(np=np, ln=np.log, asin=np.arcsin, acos=np.arccos, atan=np.arctan) # Names that may be used in equations, along with x. Ex="sin(x)/x", "np.exp(-x**2)"
+plot_pixels = (500, 500) # Approximate width and height of the plot in pixels, used to measure the error of adaptive sampling.
+pixel_tolerance = 0.5 # Largest distance in pixels between the curve and a straight line through its samples before an interval is split.
+initial_points = 65 # Evenly spaced points evaluated before adaptive refinement.
+
+#############################################################################################################################################################################################
+## Functions
+@lru_cache(maxsize=64)
+def compile_equation(text):
+    """ Compiles an equation in x into a function of a NumPy array. Raises SyntaxError for invalid equations. Ex=compile_equation("x**2")(np.arange(3)) → array([0, 1, 4]) """
+    code = compile(text.strip(), "<equation>", "eval")
+    def equation(x):
+        with np.errstate(all='ignore'): # Division by zero and similar errors give infinities or NaN instead.
+            y = eval(code, {"__builtins__": {}}, dict(math_names, x=x))
+        return np.broadcast_to(np.asarray(y, dtype=float), np.shape(x)) # Allows constant equations. Ex="3"
+    return equation
+
+def split_units(text, parser):
+    """ Separates an equation from the units written after it. Units are only read where they follow the equation without an operator, which is not valid as an equation,
+        and every unit must be known to the parser. Returns the equation and the units, which are empty if none are found.
+        Ex=split_units("x**2 * 3 MeV", parser) → ('x**2 * 3', 'MeV'), split_units("x * m", parser) → ('x * m', '') """
+    text = text.strip()
+    try:
+        compile(text, "<equation>", "eval")
+        return text, ""
+    except SyntaxError:
+        pass
+    words = text.split()
+    for i in range(1, len(words)): # Tries the longest run of units first.
+        equation, units = " ".join(words[:i]), " ".join(words[i:])
+        try:
+            unit_list = parser.parse_units(units)
+            compile(equation, "<equation>", "eval")
+        except (ValueError, SyntaxError):
+            continue
+        if all(symbol in parser.symbols for prefix, symbol, exponent in unit_list):
+            return equation, units
+    return text, "" # Left for compile_equation() to report.
+
+@lru_cache(maxsize=64)
+def compile_quantity(text, engine, parser):
+    """ Compiles an equation that may end with units. The units are reduced by the engine here, once, so that plotting only multiplies the values by a single factor.
+        Returns the equation, the factor, and the reduced units. Ex=compile_quantity("x**2 * 3 MeV", engine, parser) → (<function>, 1000000, ['eV']) """
+    equation, units = split_units(text, parser)
+    if not units:
+        return compile_equation(equation), 1, []
+    engine.load_quantity(1, parser.parse_units(units)) # Merges prefixes and repeated units. Ex="km m" → 1000 m²
+    engine.reduce() # Updates current_unit_custom.
+    return compile_equation(equation), float(engine.current_value), engine.current_unit_custom[:]
+
+def axis_units(y, units, symbol_indexes):
+    """ Chooses the prefix of the first unit that best describes the plotted values. Returns the value of the prefix and the label of the y-axis.
+        Ex=axis_units(y, ['eV'], engine.symbol_indexes) → (1000000000, 'GeV') for values up to 3×10¹⁰ eV """
+    if not units:
+        return 1, ""
+    symbol, exponent = split_exponent(units[0], symbol_indexes)
+    low, high = robust_range(y)
+    prefix, leftover = select_prefix(max(abs(low), abs(high)), exponent)
+    return prefix_value(prefix) ** exponent, "⸱".join([prefix + units[0]] + units[1:])
+
+def finite(y):
+    """ Returns a copy of the y values with infinities replaced by NaN, which matplotlib draws as a break in the line. """
+    y = np.array(y, dtype=float)
+    y[~np.isfinite(y)] = np.nan
+    return y
+
+def sample(equation, start=0, stop=100, count=101):
+    """ Evaluates an equation at evenly spaced x values and returns both arrays. Ex=sample(compile_equation("x**2"), 0, 100, 101) """
+    x = np.linspace(start, stop, max(int(count), 2))
+    return x, finite(equation(x))
+
+def robust_range(y):
+    """ Returns the range of the middle 98% of the finite y values, which ignores the huge values near singularities. Returns (0, 1) if no value is finite. """
+    finite_y = y[np.isfinite(y)]
+    if not finite_y.size:
+        return 0.0, 1.0
+    low, high = np.percentile(finite_y, [1, 99])
+    if high <= low: # True for constant equations.
+        low, high = low - 0.5, high + 0.5
+    return float(low), float(high)
+
+def adaptive_sample(equation, start=0, stop=100, budget=2000):
+    """ Evaluates an equation at up to budget x values, splitting intervals where the curve is not straight on screen or where it passes through a singularity.
+        Each round evaluates the midpoints of all intervals that need splitting at once. Returns x and y arrays, with NaN in y where the line should be broken.
+        Ex=adaptive_sample(compile_equation("1/x"), -1, 1) """
+    budget = max(int(budget), initial_points)
+    x = np.linspace(start, stop, initial_points)
+    y = finite(equation(x))
+    low, high = robust_range(y)
+    y_scale = plot_pixels[1] / (high - low) # Converts y values to pixels.
+    smallest = abs(stop - start) * 1e-9 # Intervals are not split below this width.
+    active = np.ones(len(x) - 1, dtype=bool) # Marks the intervals that may need splitting.
+    while active.any() and len(x) < budget:
+        left = np.flatnonzero(active)
+        x_middle = (x[left] + x[left + 1]) / 2
+        y_middle = finite(equation(x_middle))
+        y_line = (y[left] + y[left + 1]) / 2 # The straight line between the ends of each interval.
+        with np.errstate(invalid='ignore'):
+            error = np.abs(y_middle - y_line) * y_scale
+        undefined = np.isnan(y_middle)
+        split = (error > pixel_tolerance) | (undefined != np.isnan(y[left])) | (undefined != np.isnan(y[left + 1])) # Also splits intervals that hold the edge of an undefined region.
+        split &= (x[left + 1] - x[left]) > smallest # Stops at singularities that never become straight.
+        if len(x) + len(left) > budget: # Keeps the intervals with the largest errors when the budget runs out.
+            room = budget - len(x)
+            if room <= 0:
+                break
+            priority = np.where(split, np.where(np.isnan(error), -np.inf, -error), np.inf) # Intervals at undefined edges come first, and intervals that are already straight last.
+            ranked = np.argsort(priority)[:room]
+            keep = np.zeros(len(left), dtype=bool)
+            keep[ranked] = True
+            left, x_middle, y_middle, split = left[keep], x_middle[keep], y_middle[keep], split[keep]
+        x = np.insert(x, left + 1, x_middle)
+        y = np.insert(y, left + 1, y_middle)
+        positions = left + np.arange(len(left)) # Position of each left end after the insertion.
+        active = np.zeros(len(x) - 1, dtype=bool)
+        active[positions[split]] = True # Both halves of each split interval are checked again.
+        active[positions[split] + 1] = True
+    return break_singularities(x, y, y_scale)
+
+def break_singularities(x, y, y_scale):
+    """ Inserts NaN between neighboring samples where the curve changes sign with a jump larger than the height of the plot, such as across the pole of 1/x or tan(x).
+        Steep curves that keep their sign, such as exp(x), are left joined. """
+    with np.errstate(invalid='ignore'):
+        jumps = np.flatnonzero((np.abs(np.diff(y)) * y_scale > plot_pixels[1]) & (y[:-1] * y[1:] < 0))
+    if not jumps.size:
+        return x, y
+    x = np.insert(x, jumps + 1, (x[jumps] + x[jumps + 1]) / 2)
+    y = np.insert(y, jumps + 1, np.nan)
+    return x, y
+
+#############################################################################################################################################################################################
+## Classes
+class GraphingCanvas(object):
+    """ Holds the figure, canvas, and toolbar of the Graphing Calculator. They are created once, and each plot replaces the data of the same line. Ex=GraphingCanvas(frame).update(x, y) """
+    def __init__(self, master):
+        self.figure = Figure(figsize=(5, 5), dpi=100)
+        self.axes = self.figure.add_subplot(111)
+        self.line, = self.axes.plot([], [])
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, master)
+        self.toolbar.update()
+        self.canvas.get_tk_widget().pack(side='top', fill='both', expand=True)
+
+    def update(self, x, y, ylabel=""):
+        """ Replaces the plotted data, labels the y-axis with its units, and rescales the axes. Values near singularities are left outside the view, so they do not flatten the rest of the curve.
+            Drawing happens when Tk is idle, so repeated updates are combined. """
+        self.line.set_data(x, y)
+        self.axes.set_ylabel(ylabel)
+        self.axes.relim()
+        self.axes.autoscale_view()
+        low, high = robust_range(y)
+        finite_y = y[np.isfinite(y)]
+        if finite_y.size and (finite_y.max() - finite_y.min()) > 10 * (high - low): # True near singularities.
+            margin = (high - low) * 0.1
+            self.axes.set_ylim(low - margin, high + margin)
+        self.canvas.draw_idle()
@@ -0,0 +1,133 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Virtual Grid
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Shows the Symbol Manager table in a canvas. Widgets are only created for the rows that fit in the canvas, and the same widgets are refilled from the list of rows as the table
+## scrolls, so that sorting, filtering, or searching a database of any size only updates a screenful of cells. Each render compares the visible rows with what they already show
+## and only rewrites the cells that differ, so an edit to one row costs the same regardless of the size of the database.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import tkinter as tk
+
+#############################################################################################################################################################################################
+## Classes
+class VirtualGrid(object):
+    """ A scrolling table of entry cells with a numbered label on each row and an empty row at the end for new data. Cells are named by column and row, as in "Name12".
+        Ex=VirtualGrid(canvas, scrollbar, [("Name", 30, 'left'), ("Units", 19, 'center')], row_values, cell_return, cell_dictionary) """
+    def __init__(self, canvas, scrollbar, columns, row_values, on_return, cells, header_font=None, label_font=None, background=None):
+        self.canvas = canvas
+        self.scrollbar = scrollbar # Vertical scrollbar. Scrolling moves data through the widgets instead of moving the widgets.
+        self.columns = columns # Holds the header, width, and justification of each entry column. Ex=[("Name", 30, 'left')]
+        self.row_values = row_values # Returns the text of each cell in a row. Ex=row_values(("distance", ['d', '0', ...])) → ['distance', 'd', '', 'l;s;r', 'm']
+        self.on_return = on_return # Called with the event and the cell name when return/enter is pressed in a cell.
+        self.cells = cells # Holds the entry widgets of the visible cells by name. Ex={'Name12': [<tkinter.Entry object>]}
+        self.label_font = label_font
+        self.background = background
+        self.rows = [] # Holds the data shown in the table. Not copied, so changes to the list appear on the next render().
+        self.top = 0 # Index of the first visible row.
+        self.pool = [] # Holds the reusable widgets of each visible row. Ex=[(<tkinter.Label object>, [<tkinter.Entry object>, ...])]
+        self.shown = [] # Holds the row number and cell text currently shown by each pool row, or None if it is hidden. Ex=[(12, ['distance', 'd', '', 'l;s;r', 'm'])]
+        self.visible = 1 # Number of pool rows that fit in the canvas.
+        self.row_height = 0
+        self.frame = tk.Frame(canvas, bg=background)
+        canvas.create_window((0, 0), window=self.frame, anchor='nw')
+        tk.Label(self.frame, width=2, text="", font=header_font, bg=background).grid(row=0, column=0, padx=0, pady=0) # Sets blank space in the top left corner.
+        for column, (header, width, justify) in enumerate(columns, 1): # Creates column labels.
+            tk.Label(self.frame, width=10, text=header, font=header_font, bg=background).grid(row=0, column=column, padx=0, pady=0)
+        self.add_pool_row()
+        self.frame.update_idletasks()
+        self.row_height = max(self.pool[0][1][0].winfo_reqheight(), 1)
+        scrollbar.config(command=self.yview)
+        canvas.bind('<Configure>', self.resize, add='+')
+
+    def add_pool_row(self):
+        """ Creates the label and entry cells of one more visible row. """
+        index = len(self.pool)
+        label = tk.Label(self.frame, width=0, text="", font=self.label_font, bg=self.background)
+        label.grid(row=index+1, column=0, padx=0, pady=0)
+        label.grid_remove() # Shown by render(), which remembers the grid options.
+        entries = []
+        for column, (header, width, justify) in enumerate(self.columns):
+            entry = tk.Entry(self.frame, width=width, justify=justify, background='white')
+            entry.grid(row=index+1, column=column+1)
+            entry.grid_remove()
+            entry.bind('<Return>', lambda event, index=index, header=header: self.on_return(event, f"{header}{self.top+index+1}"))
+            entries.append(entry)
+        self.pool.append((label, entries))
+        self.shown.append(None) # Filled by the next render().
+
+    def resize(self, event=None):
+        """ Creates enough rows to fill the canvas. Rows are kept when the canvas shrinks and hidden instead. """
+        height = self.canvas.winfo_height() if event is None else event.height
+        self.visible = max(height // self.row_height, 1) # The header row takes the place of the partially visible row at the bottom.
+        while len(self.pool) < self.visible:
+            self.add_pool_row()
+        self.scroll_to(self.top)
+
+    def set_rows(self, rows, keep_position=False):
+        """ Shows a new list of rows, starting from the top unless keep_position is set. Ex=set_rows(current_database_list) """
+        self.rows = rows
+        self.scroll_to(self.top if keep_position else 0)
+
+    def scroll_to(self, top):
+        """ Makes a row the first visible row, within the limits of the table. """
+        self.top = max(min(top, len(self.rows) + 2 - self.visible), 0) # The last pool row may be cut off by the canvas, so the empty row is kept above it.
+        self.render()
+
+    def forget_cells(self, row, entries):
+        """ Removes the names of a row's cells from the dictionary of visible cells, unless another pool row has already taken them. """
+        for (header, width, justify), entry in zip(self.columns, entries):
+            cell = f"{header}{row+1}"
+            if self.cells.get(cell, [None])[0] is entry:
+                del self.cells[cell]
+
+    def yview(self, *args):
+        """ Handles scrollbar and mousewheel commands in the same form as tk.Canvas.yview(). Ex=yview("moveto", 0.5), yview("scroll", -1, "units") """
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * (len(self.rows) + 1)))
+        elif args[0] == "scroll":
+            steps = int(args[1])
+            if args[2] == "pages":
+                steps *= max(self.visible - 1, 1)
+            self.scroll_to(self.top + steps)
+
+    def render(self):
+        """ Fills the visible widgets with the rows that are currently in view. The final row is left empty for new data.
+            Rows that already show the right data are skipped, and only the cells whose data has changed are rewritten. Rows that move to a new row number are rewritten in full. """
+        for index, (label, entries) in enumerate(self.pool):
+            row = self.top + index
+            shown = self.shown[index]
+            if index >= self.visible or row > len(self.rows): # Hides rows below the empty row or beyond the canvas.
+                if shown is not None:
+                    self.forget_cells(shown[0], entries)
+                    label.grid_remove()
+                    for entry in entries:
+                        entry.grid_remove()
+                    self.shown[index] = None
+                continue
+            values = self.row_values(self.rows[row]) if row < len(self.rows) else [""] * len(self.columns)
+            if shown is not None and shown[0] == row and shown[1] == values: # True for unchanged rows.
+                continue
+            if shown is None:
+                label.grid()
+                for entry in entries:
+                    entry.grid()
+            if shown is not None and shown[0] == row: # Only the cells whose data has changed are rewritten. Text typed without pressing return is kept.
+                old_values = shown[1]
+            else: # Rewrites every cell of a row that now shows a different row number, which also discards text typed into the recycled cells.
+                old_values = [None] * len(self.columns)
+                if shown is not None:
+                    self.forget_cells(shown[0], entries)
+                label.config(text=str(row+1))
+                for (header, width, justify), entry in zip(self.columns, entries):
+                    self.cells[f"{header}{row+1}"] = [entry]
+            for entry, value, old_value in zip(entries, values, old_values):
+                if value != old_value:
+                    entry.delete(0, 'end')
+                    entry.insert(0, value)
+            self.shown[index] = (row, values)
+        total = len(self.rows) + 1
+        self.scrollbar.set(self.top / total, min((self.top + self.visible) / total, 1))
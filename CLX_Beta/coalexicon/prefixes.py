@@ -0,0 +1,85 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Prefixes
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Table-driven selection of SI and binary prefixes. Unit Manager used to compare each unit's value against every power of ten from 10²⁴ to 10⁻²⁴ in turn; select_prefix()
+## computes the logarithm once and looks up the matching prefix, then removes it from the value with exact integer powers.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction # Used for exact prefix values.
+from math import ceil, floor, log2, log10
+
+#############################################################################################################################################################################################
+## Global datasets
+si_prefixes = (("Q", 30), ("R", 27), ("Y", 24), ("Z", 21), ("E", 18), ("P", 15), ("T", 12), ("G", 9), ("M", 6), ("k", 3), ("h", 2), ("da", 1),
+    ("d", -1), ("c", -2), ("m", -3), ("μ", -6), ("n", -9), ("p", -12), ("f", -15), ("a", -18), ("z", -21), ("y", -24), ("r", -27), ("q", -30)) # Symbol and power of ten.
+binary_prefixes = (("Qi", 100), ("Ri", 90), ("Yi", 80), ("Zi", 70), ("Ei", 60), ("Pi", 50), ("Ti", 40), ("Gi", 30), ("Mi", 20), ("Ki", 10)) # Symbol and power of two.
+prefix_powers = dict(si_prefixes) # Ex={"k": 3, "m": -3}
+binary_powers = dict(binary_prefixes) # Ex={"Ki": 10, "Mi": 20}
+si_large = {power: symbol for symbol, power in si_prefixes if power > 0} # Ex={3: "k", 6: "M"}
+si_small = {power: symbol for symbol, power in si_prefixes if power < 0} # Ex={-3: "m", -6: "μ"}
+log_tolerance = 1e-9 # Logarithms this close to an integer are rounded to that integer. Accounts for values such as 0.001 ** 3.
+
+#############################################################################################################################################################################################
+## Functions
+def power_of_ten(power, exact=False):
+    """ Returns ten to an integer power. Negative powers are floats, or exact Fractions if exact is set. Ex=power_of_ten(-6) → 1e-06, power_of_ten(-6, True) → Fraction(1, 1000000) """
+    if power < 0 and exact:
+        return Fraction(1, 10 ** -power)
+    return 10 ** power
+
+def prefix_value(symbol, exact=False):
+    """ Returns the numerical value of a prefix. Setting exact returns Fractions for prefixes below one. Ex=prefix_value("k") → 1000, prefix_value("m") → 0.001, prefix_value("Ki") → 1024 """
+    if not symbol:
+        return 1
+    if symbol in binary_powers:
+        return 2 ** binary_powers[symbol]
+    return power_of_ten(prefix_powers[symbol], exact)
+
+def scale(value, base, power):
+    """ Returns value / base ** power. Fraction values stay exact, integer values stay integers when they are divisible, and float values are only divided or
+        multiplied by an exact integer. """
+    if power == 0:
+        return value
+    if power < 0:
+        return value * base ** -power
+    if isinstance(value, int) and value % (base ** power) == 0:
+        return value // (base ** power)
+    return value / base ** power
+
+def rounded_log(value, log):
+    """ Returns the logarithm of a value, rounded to the nearest integer if it is within log_tolerance. """
+    result = log(value)
+    nearest = round(result)
+    if abs(result - nearest) < log_tolerance:
+        return nearest
+    return result
+
+def select_prefix(total, exponent=1, binary=False):
+    """ Finds the prefix that best describes a unit raised to the given exponent, and returns the prefix and the leftover value once the prefix is removed.
+        Values of at least ten use the largest prefix that does not exceed them, values of at most a tenth use the smallest prefix that is not smaller than them,
+        and values in between use no prefix. Setting binary uses Ki, Mi, Gi, etc. for values of at least 1024.
+        Ex=select_prefix(1000000, 2) → ("k", 1), select_prefix(0.005) → ("c", 0.5), select_prefix(2048, binary=True) → ("Ki", 2) """
+    if exponent == 0 or not 0 < total < float('inf'): # Prevents math domain errors. Infinite and undefined float totals are left without a prefix.
+        return "", total
+    if binary:
+        log = rounded_log(total, log2) / exponent
+        for symbol, power in binary_prefixes:
+            if log >= power:
+                return symbol, scale(total, 2, power * exponent)
+        return "", total
+    log = rounded_log(total, log10) / exponent # Ex=3.0 for a total of 10⁶ m².
+    if log >= 1: # True for 10 and above.
+        power = min(floor(log + log_tolerance), 30)
+        while power not in si_large: # Finds the largest prefix that does not exceed the value.
+            power -= 1
+        return si_large[power], scale(total, 10, power * exponent)
+    elif log <= -1: # True for 0.1 and below.
+        power = max(ceil(log - log_tolerance), -30)
+        while power not in si_small: # Finds the smallest prefix that is not smaller than the value.
+            power += 1
+        return si_small[power], scale(total, 10, power * exponent)
+    return "", total
@@ -0,0 +1,94 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Saving
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Writes the notes and databases on a background thread, so that the Save button does not freeze the GUI. The GUI copies what it saves, and the copy is formatted and written here.
+## Saves of the same file are coalesced: a file that is saved again before it has been written is written once, with the latest copy. Each file is written to a temporary file
+## first and then moved into place, so a file is never left half-written. The result of each write is kept in a queue for the GUI to read on its own thread.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import os
+import queue # Hands the result of each write back to the GUI.
+import threading
+from time import monotonic
+
+#############################################################################################################################################################################################
+## Global datasets
+coalesce_delay = 0.2 # Seconds the writer waits after a save for further saves of the same files.
+
+#############################################################################################################################################################################################
+## Functions
+def format_table(table):
+    """ Returns a dictionary of rows as tab-separated text, which read_table() reads back. Ex=format_table({"distance": ['d', '0', 'l;s;r', 'm']}) → "distance\td\t0\tl;s;r\tm\n" """
+    return "".join("\t".join([name] + [str(value) for value in row]) + "\n" for name, row in table.items())
+
+def write_text(path, text):
+    """ Replaces the contents of a text file. The text is written to a temporary file first, so the file is never left half-written if writing fails. """
+    temporary = path + ".tmp"
+    with open(temporary, 'w', encoding='utf-8') as file:
+        file.write(text)
+    os.replace(temporary, path)
+
+#############################################################################################################################################################################################
+## Classes
+class SaveWriter(object):
+    """ Writes files on a background thread. The thread is started by the first save. Ex=writer.save("database_units.txt", dict(unit_database), format_table) """
+    def __init__(self, delay=coalesce_delay):
+        self.delay = delay
+        self.pending = {} # Holds the latest copy of each file that has not been written yet. Ex={"database_units.txt": (format_table, {...})}
+        self.results = queue.Queue() # Receives (path, None) for each written file, or (path, error).
+        self.condition = threading.Condition()
+        self.writing = False
+        self.flushing = False
+        self.last_save = 0.0 # Time of the most recent save, from which the coalescing delay is measured.
+        self.thread = None
+
+    def save(self, path, data, format=str):
+        """ Queues a copy of data to be written to path. format converts the copy to text on the background thread. Replaces any copy of the same file that is still waiting. """
+        with self.condition:
+            self.pending[path] = (format, data)
+            self.last_save = monotonic()
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="save_writer", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def busy(self):
+        """ Returns True while files are waiting or being written. """
+        with self.condition:
+            return bool(self.pending) or self.writing
+
+    def run(self):
+        """ Writes the waiting files. Runs on the background thread. """
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                remaining = self.last_save + self.delay - monotonic()
+                while remaining > 0 and not self.flushing: # Lets repeated saves replace the waiting copies before they are written.
+                    self.condition.wait(remaining)
+                    remaining = self.last_save + self.delay - monotonic()
+                pending, self.pending = self.pending, {}
+                self.writing = True
+            for path, (format, data) in pending.items():
+                try:
+                    write_text(path, format(data))
+                except Exception as error: # Reported by the GUI. The next save of the file tries again.
+                    self.results.put((path, error))
+                else:
+                    self.results.put((path, None))
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+
+    def flush(self, timeout=None):
+        """ Waits until every waiting file has been written. Called before the GUI exits, as the background thread does not keep the program open. Returns False on timeout. """
+        with self.condition:
+            self.flushing = True # Skips the coalescing delay.
+            self.condition.notify_all()
+            finished = self.condition.wait_for(lambda: not self.pending and not self.writing, timeout)
+            self.flushing = False
+            return finished
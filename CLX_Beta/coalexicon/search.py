@@ -0,0 +1,302 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Search
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Finds Symbol Manager entries whose names contain a search term, without reading every name. Each name is indexed by the lowercase substrings of up to three characters that it
+## contains, so that a search only checks the names that hold every trigram of the search term. The index is updated one name at a time as entries are added or renamed.
+## A second index covers the symbol and unit columns as well as the names, and tolerates typos. The start of each token is stored under every string that it becomes after
+## deleting up to two characters, so that tokens within two edits of a query are found by looking up the deletions of the query instead of comparing it with every token.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import bisect # Used for prefix searches.
+import heapq # Used to rank only the best few results when a limit is given.
+import re
+
+#############################################################################################################################################################################################
+## Global datasets
+gram_size = 3 # Longest substring held by the index. Shorter search terms are answered from the index alone.
+column_weights = (1.0, 1.0, 0.8, 0.6, 0.5) # Importance of a match in the Name, Primary, Secondary, Other, and Units columns.
+deletion_length = 7 # Characters at the start of each token that are used for typo-tolerant matching. Longer tokens are still compared in full. Limits the size of the index.
+prefix_limit = 200 # Most tokens that one query token may match by prefix. Keeps one-letter queries fast on large databases.
+word_pattern = re.compile(r"[^\s()\[\],;/]+") # Splits names into words and symbol lists into symbols. Ex="mass [dimension]" → ["mass", "dimension"]
+
+#############################################################################################################################################################################################
+## Functions
+def grams(text):
+    """ Returns every substring of one to three characters in a string. Ex=grams("mass") → {'m', 'a', 's', 'ma', 'as', 'ss', 'mas', 'ass'} """
+    return {text[start:start+size] for size in range(1, gram_size+1) for start in range(len(text)-size+1)}
+
+def entry_tokens(name, data):
+    """ Returns the lowercase tokens of a symbol database entry with the weight of the best column that holds each, and the tokens with their original case.
+        Absent symbols ("0") and placeholders such as "<none>" are skipped. Ex=entry_tokens("distance", ['d', '0', 'l; s; r', 'm', '0', 'quantity']) """
+    tokens, cased = {}, set()
+    columns = [name] + list(data[:4])
+    for column, (text, weight) in enumerate(zip(columns, column_weights)):
+        if text in ("", "0") or text.startswith("<"):
+            continue
+        words = word_pattern.findall(text)
+        if column == 4: # Allows each unit to match, as well as the whole product. Ex="g⸱m²" → ["g⸱m²", "g", "m²"]
+            words = [text] + text.split("⸱") if "⸱" in text else [text]
+        for word in words:
+            folded = word.casefold()
+            if weight > tokens.get(folded, 0):
+                tokens[folded] = weight
+            cased.add(word)
+    return tokens, cased
+
+def deletions(word, distance):
+    """ Returns every string made by deleting up to the given number of characters from a word, including the word itself. Ex=deletions("abc", 1) → {'abc', 'bc', 'ac', 'ab'} """
+    results, current = {word}, {word}
+    for _ in range(distance):
+        current = {text[:index] + text[index+1:] for text in current for index in range(len(text))}
+        results |= current
+    return results
+
+def edit_distance(first, second, limit):
+    """ Returns the number of insertions, deletions, substitutions, and swaps of neighboring characters that turn one string into another,
+        or limit + 1 if it exceeds limit. Ex=edit_distance("plank", "planck", 2) → 1 """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    previous_row, row = None, list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        previous_row, row = row, [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            cost = first[i-1] != second[j-1]
+            row[j] = min(previous_row[j] + 1, row[j-1] + 1, previous_row[j-1] + cost)
+            if i > 1 and j > 1 and first[i-1] == second[j-2] and first[i-2] == second[j-1]: # True for swapped neighbors.
+                row[j] = min(row[j], earlier_row[j-2] + 1)
+        if min(row) > limit:
+            return limit + 1
+        earlier_row = previous_row
+    return min(row[-1], limit + 1)
+
+#############################################################################################################################################################################################
+## Classes
+class TrigramIndex(object):
+    """ Answers case-insensitive substring searches over a set of names. Ex=TrigramIndex(notation_database_dictionary).search("mass") → ['mass', 'atomic mass', ...] """
+    def __init__(self, names=()):
+        self.names = {} # Holds each name in lowercase. Names are kept in the order they were added. Ex={'Atomic Mass': 'atomic mass'}
+        self.postings = {} # Holds the names that contain each substring. Ex={'mas': {'Atomic Mass', 'mass'}}
+        self.build(names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def build(self, names):
+        """ Replaces the contents of the index. """
+        self.names.clear()
+        self.postings.clear()
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        """ Adds a single name. """
+        if name in self.names:
+            return
+        lowered = name.lower()
+        self.names[name] = lowered
+        for gram in grams(lowered):
+            self.postings.setdefault(gram, set()).add(name)
+
+    def remove(self, name):
+        """ Removes a single name, if present. """
+        lowered = self.names.pop(name, None)
+        if lowered is None:
+            return
+        for gram in grams(lowered):
+            names = self.postings[gram]
+            names.discard(name)
+            if not names:
+                del self.postings[gram]
+
+    def rename(self, old_name, new_name):
+        """ Replaces a name with another. """
+        self.remove(old_name)
+        self.add(new_name)
+
+    def candidates(self, term):
+        """ Returns the names that contain every substring of a lowercase search term, which includes every match. """
+        if len(term) <= gram_size:
+            return self.postings.get(term, set())
+        postings = sorted((self.postings.get(term[start:start+gram_size], set()) for start in range(len(term)-gram_size+1)), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def search(self, term, limit=None):
+        """ Returns the names that contain a search term, regardless of case, ranked from best to worst. Exact matches come first, then names that begin with the term,
+            then names with a word that begins with the term, then all others. Matches with the same case as the term rank higher within each group. Ex=search("Mass")
+            Terms shorter than a trigram match most of a large database as the first letters are typed, so they are only grouped, without sorting. See short_search(). """
+        if not term:
+            return list(self.names)[:limit]
+        lowered = term.lower()
+        if len(lowered) < gram_size:
+            return self.short_search(lowered, limit)
+        if len(lowered) == gram_size:
+            matches = self.candidates(lowered)
+        else:
+            matches = [name for name in self.candidates(lowered) if lowered in self.names[name]]
+        if limit is not None and limit < len(matches):
+            return heapq.nsmallest(limit, matches, key=lambda name: self.rank(name, term, lowered))
+        return sorted(matches, key=lambda name: self.rank(name, term, lowered))
+
+    def short_search(self, lowered, limit=None):
+        """ Returns exact matches, then names that begin with a short term, then the other names that contain it, each group in the order of the database. Ex=short_search("e")
+            Uses list comprehensions over every name, which are faster than ranking each match once most names match. """
+        items, size = self.names.items(), len(lowered)
+        leading = [name for name, text in items if text[:size] == lowered] # Slices are compared faster than startswith() is called.
+        exact = [name for name in leading if self.names[name] == lowered]
+        if exact:
+            leading = exact + [name for name in leading if self.names[name] != lowered]
+        others = [name for name, text in items if lowered in text and text[:size] != lowered]
+        return (leading + others)[:limit]
+
+    def rank(self, name, term, lowered):
+        """ Returns a sorting key that places better matches first. """
+        text = self.names[name]
+        position = text.find(lowered)
+        if text == lowered:
+            group = 0
+        elif position == 0:
+            group = 1
+        elif text[position-1] in " _-([":
+            group = 2
+        else:
+            group = 3
+        return group, term not in name, position, len(name), name
+
+
+class FuzzyIndex(object):
+    """ Answers typo-tolerant searches over the names, symbols, and units of a symbol database. Query tokens match tokens exactly, by prefix, or within a small number of typos,
+        and entries must match every query token. Ex=FuzzyIndex(notation_database_dictionary).search("plank ℏ") → ['reduced Planck constant', ...] """
+    def __init__(self, database=None, max_distance=2):
+        self.max_distance = max_distance # Largest number of typos allowed in a query token. Short tokens allow fewer. See allowed_distance().
+        self.entries = {} # Holds the tokens of each entry with their weights, and the tokens with their original case. Ex={'distance': ({'distance': 1.0, 'd': 1.0, 'm': 0.5}, {'d', 'm'})}
+        self.postings = {} # Holds the entries that contain each lowercase token, with the weight of its column in each. Ex={'d': {'distance': 1.0, 'diameter': 1.0}}
+        self.cased = {} # Holds the entries that contain each token with its original case. Used to rank "E" above "e" when searching for "E".
+        self.deletes = {} # Holds the tokens whose first characters become each string after deleting up to max_distance of them. Ex={'planck': {'planck'}, 'plnck': {'planck'}}
+        self.sorted_tokens = [] # Holds every lowercase token in order, for prefix searches.
+        if database:
+            self.build(database)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def build(self, database):
+        """ Replaces the contents of the index with a symbol database. Ex=build({"distance": ['d', '0', 'l; s; r', 'm', '0', 'quantity']}) """
+        for collection in (self.entries, self.postings, self.cased, self.deletes):
+            collection.clear()
+        self.sorted_tokens = []
+        for name, data in database.items():
+            self.add(name, data, sort=False)
+        self.sorted_tokens = sorted(self.postings)
+
+    def add(self, name, data, sort=True):
+        """ Adds or replaces a single entry. """
+        self.remove(name)
+        tokens, cased = entry_tokens(name, data)
+        self.entries[name] = tokens, cased
+        for token in tokens:
+            if token not in self.postings:
+                self.postings[token] = {}
+                for deleted in deletions(token[:deletion_length], self.allowed_distance(token)):
+                    self.deletes.setdefault(deleted, set()).add(token)
+                if sort:
+                    bisect.insort(self.sorted_tokens, token)
+            self.postings[token][name] = tokens[token]
+        for token in cased:
+            self.cased.setdefault(token, set()).add(name)
+
+    def remove(self, name):
+        """ Removes a single entry, if present. """
+        if name not in self.entries:
+            return
+        tokens, cased = self.entries.pop(name)
+        for token in tokens:
+            names = self.postings[token]
+            del names[name]
+            if not names: # Forgets tokens that no longer appear in any entry.
+                del self.postings[token]
+                for deleted in deletions(token[:deletion_length], self.allowed_distance(token)):
+                    self.deletes[deleted].discard(token)
+                    if not self.deletes[deleted]:
+                        del self.deletes[deleted]
+                index = bisect.bisect_left(self.sorted_tokens, token)
+                if index < len(self.sorted_tokens) and self.sorted_tokens[index] == token:
+                    del self.sorted_tokens[index]
+        for token in cased:
+            self.cased[token].discard(name)
+            if not self.cased[token]:
+                del self.cased[token]
+
+    def rename(self, old_name, new_name, data):
+        """ Replaces an entry with the same data under another name. """
+        self.remove(old_name)
+        self.add(new_name, data)
+
+    def allowed_distance(self, token):
+        """ Returns the number of typos allowed in a token. Tokens of one or two characters, such as most symbols, must match exactly. """
+        if len(token) < 3:
+            return 0
+        if len(token) < 6:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    def token_scores(self, term):
+        """ Returns the score of each entry that matches a single query token. Exact matches score highest, then prefixes, then matches with fewer typos. """
+        folded = term.casefold()
+        scores = {name: 3 * weight for name, weight in self.postings.get(folded, {}).items()} # Scores exact matches first, while there is nothing to compare them with.
+        def score(token, value):
+            for name, weight in self.postings[token].items():
+                if value * weight > scores.get(name, 0):
+                    scores[name] = value * weight
+        if len(folded) > 1: # Single characters only match whole symbols.
+            start = bisect.bisect_left(self.sorted_tokens, folded)
+            for token in self.sorted_tokens[start:start+prefix_limit]:
+                if not token.startswith(folded):
+                    break
+                if token != folded:
+                    score(token, 2)
+        distance_limit = self.allowed_distance(folded)
+        if distance_limit:
+            candidates = set()
+            for deleted in deletions(folded[:deletion_length], distance_limit):
+                candidates.update(self.deletes.get(deleted, ()))
+            candidates.discard(folded)
+            for token in candidates:
+                distance = edit_distance(folded, token, distance_limit)
+                if distance <= min(distance_limit, self.allowed_distance(token)):
+                    score(token, 1 / distance)
+        for name in self.cased.get(term, set()).intersection(scores): # Prefers entries with the same case as the query.
+            scores[name] += 0.1
+        return scores
+
+    def search(self, query, limit=None):
+        """ Returns the entries that match every token of a query, ranked from best to worst. Ex=search("elctric fild") → ['electric field', ...] """
+        terms = query.split()
+        if not terms:
+            return list(self.entries)[:limit]
+        totals = None
+        for term in sorted(terms, key=len, reverse=True): # Longer terms usually match fewer entries, which keeps the intersections small.
+            scores = self.token_scores(term)
+            if totals is None:
+                totals = scores
+            else:
+                if len(scores) < len(totals): # Reads the smaller of the two.
+                    totals, scores = scores, totals
+                totals = {name: total + scores[name] for name, total in totals.items() if name in scores}
+            if not totals:
+                return []
+        if max(map(len, terms)) == 1: # Single characters match whole symbols, often in most entries, with only a few different scores. Groups the entries by score instead of sorting them.
+            groups = {}
+            for name, total in totals.items():
+                groups.setdefault(total, []).append(name)
+            return [name for total in sorted(groups, reverse=True) for name in groups[total]][:limit]
+        totals = {name: total - len(name) * 1e-6 for name, total in totals.items()} # Prefers shorter names among equal matches.
+        if limit is not None and limit < len(totals):
+            return heapq.nlargest(limit, totals, key=totals.get)
+        return sorted(totals, key=totals.get, reverse=True)
@@ -0,0 +1,117 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | SQLite Storage
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Optional storage of the symbol databases (database_clx.txt, database_iso.txt, database_custom.txt) and database_units.txt in a single SQLite file. Each edit in Symbol Manager
+## or Unit Manager is written as a single-row upsert instead of rewriting the whole text file, and the text files remain the format for importing and exporting data.
+## Edits are held in an open transaction until commit() is called, which matches the behavior of the "Save" button.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import sqlite3
+from .databases import read_table
+
+#############################################################################################################################################################################################
+## Global datasets
+symbol_columns = ("primary_symbol", "secondary_symbol", "other_symbol", "units", "sort_index", "category") # Matches the columns of database_clx.txt after the name.
+schema = """
+CREATE TABLE IF NOT EXISTS symbols (
+    database TEXT NOT NULL, name TEXT NOT NULL, position INTEGER NOT NULL,
+    primary_symbol TEXT, secondary_symbol TEXT, other_symbol TEXT, units TEXT, sort_index TEXT, category TEXT,
+    PRIMARY KEY (database, name));
+CREATE INDEX IF NOT EXISTS symbols_position ON symbols (database, position);
+CREATE INDEX IF NOT EXISTS symbols_primary ON symbols (database, primary_symbol);
+CREATE INDEX IF NOT EXISTS symbols_units ON symbols (database, units);
+CREATE INDEX IF NOT EXISTS symbols_category ON symbols (database, category);
+CREATE TABLE IF NOT EXISTS units (
+    name TEXT PRIMARY KEY, position INTEGER NOT NULL, conversions TEXT, quantities TEXT);
+""" # The primary keys also serve as the indexes on name.
+
+#############################################################################################################################################################################################
+## Classes
+class SQLiteStorage(object):
+    """ Holds the symbol and unit databases in a SQLite file. Symbol databases are identified by the name of their text file. Ex=SQLiteStorage("coalexicon.sqlite3") """
+    def __init__(self, path="coalexicon.sqlite3"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(schema)
+        self.connection.commit()
+
+    def close(self):
+        """ Discards uncommitted edits and closes the file. """
+        self.connection.rollback()
+        self.connection.close()
+
+    def commit(self):
+        """ Saves all edits since the last commit. """
+        self.connection.commit()
+
+    def has_symbols(self, database):
+        """ True if the specified symbol database has been imported. Ex_database='database_clx.txt' """
+        return self.connection.execute("SELECT 1 FROM symbols WHERE database = ? LIMIT 1", (database,)).fetchone() is not None
+
+    def has_units(self):
+        """ True if database_units.txt has been imported. """
+        return self.connection.execute("SELECT 1 FROM units LIMIT 1").fetchone() is not None
+
+    #########################################################################################################################################################################################
+    ## Symbols
+    def load_symbols(self, database):
+        """ Returns the same dictionary as load_symbol_database(), in the saved order. Ex={"distance": ['d', '0', 'l;s;r', 'm', '0', 'quantity']} """
+        rows = self.connection.execute(f"SELECT name, {', '.join(symbol_columns)} FROM symbols WHERE database = ? ORDER BY position", (database,))
+        return {row[0]: list(row[1:]) for row in rows}
+
+    def upsert_symbol(self, database, name, data):
+        """ Adds or updates a single entry. New entries are placed last. Ex_data=['d', '0', 'l;s;r', 'm', '0', 'quantity'] """
+        self.connection.execute(f"""INSERT INTO symbols (database, name, position, {', '.join(symbol_columns)})
+            VALUES (?, ?, (SELECT COALESCE(MAX(position), 0) + 1 FROM symbols WHERE database = ?), {', '.join('?' * len(symbol_columns))})
+            ON CONFLICT (database, name) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in symbol_columns)}""",
+            (database, name, database, *data[:len(symbol_columns)]))
+
+    def rename_symbol(self, database, old_name, new_name):
+        """ Renames a single entry and places it last, as Symbol Manager does. An existing entry with the new name is replaced. """
+        self.connection.execute("DELETE FROM symbols WHERE database = ? AND name = ?", (database, new_name))
+        self.connection.execute("""UPDATE symbols SET name = ?, position = (SELECT COALESCE(MAX(position), 0) + 1 FROM symbols WHERE database = ?)
+            WHERE database = ? AND name = ?""", (new_name, database, database, old_name))
+
+    def import_symbols(self, database, path=None):
+        """ Replaces a symbol database with the contents of its text file, and commits. """
+        table = read_table(path or database)
+        self.connection.execute("DELETE FROM symbols WHERE database = ?", (database,))
+        self.connection.executemany(f"INSERT INTO symbols (database, name, position, {', '.join(symbol_columns)}) VALUES (?, ?, ?, {', '.join('?' * len(symbol_columns))})",
+            ((database, name, position, *data[:len(symbol_columns)]) for position, (name, data) in enumerate(table.items(), 1)))
+        self.connection.commit()
+
+    def export_symbols(self, database, path=None):
+        """ Writes a symbol database to a tab-separated text file. """
+        with open(path or database, 'w', encoding='utf-8') as text:
+            for name, data in self.load_symbols(database).items():
+                print("\t".join([name] + data), file=text)
+
+    #########################################################################################################################################################################################
+    ## Units
+    def load_units(self):
+        """ Returns the same dictionary as load_unit_database(), in the saved order. Ex={"per_second": ['<conversions>', '<quantities>']} """
+        rows = self.connection.execute("SELECT name, conversions, quantities FROM units ORDER BY position")
+        return {row[0]: list(row[1:]) for row in rows}
+
+    def upsert_unit(self, name, data):
+        """ Adds or updates the conversions and quantities of a single unit. Ex_data=['<conversions>', '<quantities>'] """
+        self.connection.execute("""INSERT INTO units (name, position, conversions, quantities) VALUES (?, (SELECT COALESCE(MAX(position), 0) + 1 FROM units), ?, ?)
+            ON CONFLICT (name) DO UPDATE SET conversions = excluded.conversions, quantities = excluded.quantities""", (name, *data[:2]))
+
+    def import_units(self, path="database_units.txt"):
+        """ Replaces the unit database with the contents of its text file, and commits. """
+        table = read_table(path)
+        self.connection.execute("DELETE FROM units")
+        self.connection.executemany("INSERT INTO units (name, position, conversions, quantities) VALUES (?, ?, ?, ?)",
+            ((name, position, *data[:2]) for position, (name, data) in enumerate(table.items(), 1)))
+        self.connection.commit()
+
+    def export_units(self, path="database_units.txt"):
+        """ Writes the unit database to a tab-separated text file. """
+        with open(path, 'w', encoding='utf-8') as text:
+            for name, data in self.load_units().items():
+                print("\t".join([name] + data), file=text)
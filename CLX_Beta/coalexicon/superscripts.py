@@ -0,0 +1,53 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Superscripts
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Encodes and decodes the superscript exponents shown next to each unit. Ex=m⁻³ᐟ²
+## The translation tables are built once when the module is imported, so exponents of any size can be written or read without growing a list of exponent codes.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction # Used for fractional exponents.
+
+#############################################################################################################################################################################################
+## Global datasets
+superscript_digits = "⁰¹²³⁴⁵⁶⁷⁸⁹" # Immutable superscript digits from 0 to 9.
+superscript_minus = "⁻"
+fraction_slash = "ᐟ" # Separates the numerator and denominator of a fractional exponent. Ex=m³ᐟ²
+superscript_table = str.maketrans("0123456789-", superscript_digits + superscript_minus) # Ex="-12" → "⁻¹²"
+normal_table = str.maketrans(superscript_digits + superscript_minus, "0123456789-") # Ex="⁻¹²" → "-12"
+exponent_characters = frozenset(superscript_digits + superscript_minus + fraction_slash)
+
+#############################################################################################################################################################################################
+## Functions
+def superscript(number):
+    """ Returns an integer in superscript. Ex=superscript(-12) → '⁻¹²' """
+    return str(number).translate(superscript_table)
+
+def exponent_string(numerator, denominator=1):
+    """ Returns the exponent written after a unit symbol. An exponent of one is not written. Ex=exponent_string(-3, 2) → '⁻³ᐟ²', exponent_string(1) → '' """
+    if denominator == 1:
+        if numerator == 1:
+            return ""
+        return superscript(numerator)
+    return superscript(numerator) + fraction_slash + superscript(denominator)
+
+def split_exponent(unit, symbols=None):
+    """ Separates a unit symbol from its exponent and returns both. Units without an exponent have an exponent of one. If a collection of known symbols is given,
+        symbols that end in superscripts themselves are kept whole. Ex=split_exponent('m⁻³ᐟ²') → ('m', Fraction(-3, 2)), split_exponent('cm³²', ["cm³"]) → ('cm³', 2) """
+    end = len(unit)
+    while end > 1 and unit[end - 1] in exponent_characters: # Finds the first character of the exponent. The symbol itself is at least one character long.
+        end -= 1
+    if symbols is not None:
+        while end < len(unit) and unit[:end] not in symbols:
+            end += 1
+    symbol, exponent = unit[:end], unit[end:]
+    if not exponent:
+        return symbol, Fraction(1)
+    numerator, _, denominator = exponent.partition(fraction_slash)
+    numerator = numerator.translate(normal_table)
+    if numerator in ("", "-"): # True for "m⁻".
+        numerator += "1"
+    return symbol, Fraction(int(numerator), int(denominator.translate(normal_table) or 1))
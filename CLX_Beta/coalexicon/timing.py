@@ -0,0 +1,117 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Timing
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Records the wall-clock time of each stage of the Unit Manager pipeline and of the Symbol Manager loaders, so that a slow keystroke can be traced to the stage that caused it.
+## Timing is off by default, and until it is switched on a stage only enters and leaves a shared empty context manager. Each stage keeps a rolling window of its most recent times, from which the median and
+## the 95th and 99th percentiles are read, along with a count and total of every call since timing was switched on.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from collections import deque # Holds the rolling window of each stage.
+import json # Used to write summaries.
+import threading # Stages may be recorded by the background loaders as well as the GUI.
+from time import perf_counter
+
+#############################################################################################################################################################################################
+## Global datasets
+window_size = 1000 # Number of recent calls kept for the percentiles of each stage.
+percentiles = (50, 95, 99)
+
+#############################################################################################################################################################################################
+## Functions
+def percentile(ordered, percent):
+    """ Returns a percentile of a sorted list by the nearest-rank method. Ex=percentile([1, 2, 3, 4], 50) → 2 """
+    if not ordered:
+        return 0.0
+    rank = max(-(-percent * len(ordered) // 100), 1) # Rounds up.
+    return ordered[rank - 1]
+
+#############################################################################################################################################################################################
+## Classes
+class NullStage(object):
+    """ Stands in for a Stage while timing is off. """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        return False
+
+null_stage = NullStage()
+
+class Stage(object):
+    """ Times the code inside a with statement and records it under a stage name. Ex=with timer.stage("prefix_finder"): ... """
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        self.timer.record(self.name, perf_counter() - self.start)
+        return False
+
+class StageTimer(object):
+    """ Collects the times of named stages. Ex=StageTimer(enabled=True).summary() → {'prefix_finder': {'count': 12, 'total_ms': 0.3, 'p50_ms': 0.02, ...}} """
+    def __init__(self, enabled=False, window=window_size):
+        self.enabled = enabled
+        self.window = window
+        self.times = {} # Holds the most recent times of each stage in seconds, in the order the stages were first seen. Ex={'prefix_finder': deque([2.1e-05, ...])}
+        self.counts = {} # Holds the number of calls to each stage.
+        self.totals = {} # Holds the total time of each stage in seconds.
+        self.lock = threading.Lock() # Guards times, counts, and totals, which are written from more than one thread.
+
+    def stage(self, name):
+        """ Returns a context manager that records the time of its block, or does nothing while timing is off. """
+        return Stage(self, name) if self.enabled else null_stage
+
+    def record(self, name, seconds):
+        """ Adds one call to a stage. Ex=record("load_symbols", 0.042) """
+        with self.lock:
+            if name not in self.times:
+                self.times[name] = deque(maxlen=self.window)
+                self.counts[name] = 0
+                self.totals[name] = 0.0
+            self.times[name].append(seconds)
+            self.counts[name] += 1
+            self.totals[name] += seconds
+
+    def set_enabled(self, enabled=True):
+        """ Switches timing on or off. Records are kept until clear() is called. """
+        self.enabled = enabled
+
+    def clear(self):
+        """ Discards every record. """
+        with self.lock:
+            self.times.clear()
+            self.counts.clear()
+            self.totals.clear()
+
+    def summary(self):
+        """ Returns the count, total, and percentiles of each stage in milliseconds. Percentiles only cover the rolling window. """
+        result = {}
+        with self.lock: # Copies the records, so that the percentiles are sorted outside the lock.
+            records = [(name, list(times), self.counts[name], self.totals[name]) for name, times in self.times.items()]
+        for name, times, count, total in records:
+            ordered = sorted(times)
+            result[name] = {"count": count, "total_ms": total * 1000}
+            for percent in percentiles:
+                result[name][f"p{percent}_ms"] = percentile(ordered, percent) * 1000
+        return result
+
+    def report(self):
+        """ Returns the summary as a table of text. """
+        lines = [f"{'Stage':<36}{'Calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Total ms':>12}"]
+        for name, data in self.summary().items():
+            lines.append(f"{name:<36}{data['count']:>8}{data['p50_ms']:>10.3f}{data['p95_ms']:>10.3f}{data['p99_ms']:>10.3f}{data['total_ms']:>12.1f}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """ Writes the summary to a JSON file. Ex=dump("coalexicon_timing.json") """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.summary(), file, indent=4)
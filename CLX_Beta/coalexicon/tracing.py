@@ -0,0 +1,51 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Tracing
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Trace output for the GUI, divided into subsystems that can be switched on separately. Each subsystem has its own logger under "clx", and every logger is quiet by default, so a
+## trace call only compares two integers unless its subsystem is on. Messages use %-style arguments, which logging formats only when the message is actually written.
+## Subsystems may be switched on at startup with the CLX_TRACE environment variable, or at runtime with the "trace <subsystem>" keyword. Ex=CLX_TRACE=units,io
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import logging
+import os # Used to read CLX_TRACE.
+
+#############################################################################################################################################################################################
+## Global datasets
+subsystems = {"units": "clx.units", "symbols": "clx.symbols", "io": "clx.io", "graphing": "clx.graphing"} # Unit Manager, Symbol Manager, file and database access, and the Graphing Calculator.
+environment_variable = "CLX_TRACE" # Names the subsystems to trace at startup, separated by commas. Ex="units,io", "all"
+quiet_level = logging.WARNING # Warnings are written even when tracing is off.
+
+#############################################################################################################################################################################################
+## Functions
+def get_logger(subsystem):
+    """ Returns the logger of a subsystem. Ex=get_logger("units").debug("main_units()") """
+    return logging.getLogger(subsystems[subsystem])
+
+def subsystem_names(text):
+    """ Reads a list of subsystems separated by commas or spaces. "all" selects every subsystem, and unknown names are ignored. Ex=subsystem_names("units, io") → ['units', 'io'] """
+    names = [name for name in text.replace(",", " ").lower().split() if name in subsystems or name == "all"]
+    return list(subsystems) if "all" in names else names
+
+def set_trace(subsystem, enable=True):
+    """ Switches trace output on or off for a subsystem, or for every subsystem with "all". Returns the subsystems that were changed. Ex=set_trace("symbols") """
+    names = subsystem_names(subsystem)
+    for name in names:
+        get_logger(name).setLevel(logging.DEBUG if enable else quiet_level)
+    return names
+
+def setup_tracing(environ=None):
+    """ Sends trace output to the terminal without the logger name or level, as the former print() calls did, and switches on the subsystems named by CLX_TRACE. """
+    logger = logging.getLogger("clx")
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False # Keeps trace output out of the handlers of other applications.
+    logger.setLevel(quiet_level)
+    for name in subsystems:
+        get_logger(name).setLevel(quiet_level)
+    set_trace((environ if environ is not None else os.environ).get(environment_variable, ""))
@@ -0,0 +1,102 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Sorted Views
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Holds the rows shown by Symbol Manager for each combination of category, sorting method, and symbol index type. Each view is sorted once and kept until an edit could change
+## its order, so switching between categories and sorting methods does not sort anything. Views are separate lists, so sorting one never reorders another.
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Global datasets
+category_codes = {"All": None, "Quantities": "quantity", "Constants": "constant", "Modifiers": "modifier", "Other": "general"} # Matches menu categories to the last column of each entry.
+sort_columns = {"Name": {0}, "Primary": {1}, "Secondary": {2}, "Index": {1}, "Units": {4}} # Columns that decide the order of each sorting method. Ex=0 for Name and 4 for Units
+
+#############################################################################################################################################################################################
+## Functions
+def view_key(category, sort, index_type):
+    """ Returns the key of a view. Menu labels marked as defaults are read without the marker, and index_type only applies to the Symbol sort. Ex=view_key("All *", "Name *", "Index") → ('All', 'Name', None) """
+    sort = sort.rstrip(" *")
+    return category.rstrip(" *"), sort, index_type if sort == "Symbol" else None
+
+def sort_rows(rows, sort, index_type="Index"):
+    """ Returns a sorted copy of a list of rows. Ex=sort_rows([("distance", ['d', '0', 'l;s;r', 'm', '0', 'quantity'])], "Units") """
+    rows = sorted(rows, key=lambda row: row[0]) # Breaks ties by name.
+    if sort == "Symbol":
+        if index_type == "Primary":
+            rows.sort(key=lambda row: row[1][0])
+        elif index_type == "Secondary":
+            rows.sort(key=lambda row: row[1][1])
+        else:
+            rows.sort(key=lambda row: row[1][0])
+            rows = [row for row in rows if row[1][0] != "0"] + [row for row in rows if row[1][0] == "0"] # Places entries without symbols last.
+    elif sort == "Units":
+        rows.sort(key=lambda row: row[1][-3])
+        nonunit = [row[1][-3].startswith(("1", "<")) for row in rows]
+        rows = [row for row, last in zip(rows, nonunit) if not last] + [row for row, last in zip(rows, nonunit) if last] # Places dimensionless and unspecified entries last.
+    return rows
+
+#############################################################################################################################################################################################
+## Classes
+class SortedViews(object):
+    """ Caches the sorted rows of a symbol database for each category and sorting method. Ex=SortedViews(notation_database_dictionary).view("Quantities", "Units", "Index") """
+    def __init__(self, database=None):
+        self.database = {} # Holds the symbol database that views are made from. Not copied. Ex={"distance": ['d', '0', 'l;s;r', 'm', '0', 'quantity']}
+        self.search_rows = [] # Holds the results of the current search in order of relevance.
+        self.views = {} # Holds each view and the position of each name in it. Ex={('All', 'Name', None): ([("distance", [...])], {"distance": 0})}
+        if database is not None:
+            self.build(database)
+
+    def build(self, database):
+        """ Uses a new or reloaded symbol database and discards all views. """
+        self.database = database
+        self.views.clear()
+
+    def set_search(self, rows):
+        """ Replaces the search results and discards the views made from the previous results. """
+        self.search_rows = list(rows)
+        for key in [key for key in self.views if key[0] == "Search"]:
+            del self.views[key]
+
+    def category_rows(self, category):
+        """ Returns the unsorted rows of a category. """
+        if category == "Search":
+            return [(row[0], row[1]) for row in self.search_rows]
+        code = category_codes.get(category)
+        return [(name, data) for name, data in self.database.items() if code is None or data[-1] == code]
+
+    def view(self, category, sort, index_type="Index"):
+        """ Returns the rows of a category in the specified order, sorting them only if no current view exists. The list is shared with later calls, so edits to it persist. """
+        key = view_key(category, sort, index_type)
+        if key not in self.views:
+            category, sort, index_type = key
+            rows = self.category_rows(category)
+            if category != "Search" or sort != "Name": # Search results keep their order of relevance.
+                rows = sort_rows(rows, sort, index_type)
+            self.views[key] = rows, {row[0]: index for index, row in enumerate(rows)}
+        return self.views[key][0]
+
+    def update(self, name, column, old_name=None):
+        """ Applies an edit to one column of an entry. Views whose order depends on the column are discarded, and the entry's row is replaced in all others.
+            Renames use column 0 and give the previous name. Ex=update("distance", 4) """
+        old_name = old_name or name
+        data = self.database[name]
+        for key in list(self.views):
+            category, sort, index_type = key
+            rows, positions = self.views[key]
+            if old_name not in positions: # True for views that do not hold the entry.
+                if category == "All" or category_codes.get(category, False) == data[-1]:
+                    del self.views[key]
+                continue
+            if column in sort_columns[index_type or sort] and not (category == "Search" and sort == "Name"):
+                del self.views[key]
+            else:
+                position = positions.pop(old_name)
+                rows[position] = (name, data)
+                positions[name] = position
+
+    def add(self, name):
+        """ Discards the views that a new entry belongs to. """
+        code = self.database[name][-1]
+        for key in [key for key in self.views if key[0] == "All" or category_codes.get(key[0], False) == code]:
+            del self.views[key]
@@ -0,0 +1,38 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Test Configuration
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+##
+## Tests of the headless coalexicon package. Ex=python -m pytest tests
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Allows running the tests from any folder.
+import pytest
+from coalexicon import UnitEngine, load_conversion_database, load_symbol_database, load_unit_database
+
+#############################################################################################################################################################################################
+## Global datasets
+data_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # The folder that holds the database_*.txt files.
+
+#############################################################################################################################################################################################
+## Fixtures
+@pytest.fixture(scope="session")
+def conversion_database():
+    return load_conversion_database(os.path.join(data_directory, "database_conversions.txt"), cache=False)
+
+@pytest.fixture(scope="session")
+def unit_database():
+    return load_unit_database(os.path.join(data_directory, "database_units.txt"), cache=False)
+
+@pytest.fixture(scope="session")
+def symbol_database():
+    return load_symbol_database(os.path.join(data_directory, "database_clx.txt"), cache=False)
+
+@pytest.fixture
+def engine(conversion_database, unit_database):
+    """ A new UnitEngine over the shipped databases. Tests may change its state but not the databases. """
+    return UnitEngine(conversion_database, unit_database)
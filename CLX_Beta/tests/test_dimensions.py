@@ -0,0 +1,43 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Dimension Index Tests
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+import pytest
+from coalexicon.dimensions import DimensionIndex
+
+#############################################################################################################################################################################################
+## Fixtures
+@pytest.fixture
+def index(engine):
+    return DimensionIndex(engine, {
+        "energy": ['E', '0', '0', 'g⸱m²⸱s⁻²', 'E', 'quantity'],
+        "work": ['W', '0', '0', 'J', 'W', 'quantity'],
+        "velocity": ['v', '0', '0', 'm⸱s⁻¹', 'v', 'quantity'],
+        "definition": ['≡', '0', '≝', '<none>', '0', 'general']})
+
+#############################################################################################################################################################################################
+## Tests
+def test_signatures(index):
+    assert index.signature("g⸱m²⸱s⁻²") == index.signature("J") == (0, 0, 1, 0, 2, 0, -2)
+    assert index.signature("kg⸱m²⸱s⁻²") == index.signature("J") # Prefixes do not change the dimensions.
+    assert index.signature("<none>") is None
+
+def test_related_to_current(index, engine):
+    engine.multiply_units("eV")
+    assert index.related_to_current() == ["energy", "work"]
+    engine.clear()
+    engine.multiply_units("m")
+    engine.multiply_units("s", -1)
+    assert index.related_to_current() == ["velocity"]
+
+def test_updates(index):
+    energy = index.signature("J")
+    index.rename("work", "heat", ['Q', '0', '0', 'J', 'Q', 'quantity'])
+    index.add("velocity", ['v', '0', '0', 'J', 'v', 'quantity'])
+    assert index.related(energy) == ["energy", "heat", "velocity"]
+    index.remove("energy")
+    assert "energy" not in index.related(energy)
@@ -0,0 +1,72 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Unit Engine Tests
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction
+import pytest
+from coalexicon import UnitEngine, favorite_key
+
+#############################################################################################################################################################################################
+## Tests
+def test_buttons_reduce_to_named_units(engine):
+    engine.update_units_and_values(engine.add_symbol("m"), "×")
+    engine.update_units_and_values(engine.add_symbol("m"), "×")
+    engine.update_units_and_values(engine.add_symbol("s"), "÷")
+    engine.reduce()
+    assert engine.current_display == ["", "m²", "s⁻¹"]
+    engine.invert()
+    engine.reduce()
+    assert engine.current_display == ["", "m⁻²", "s"]
+
+def test_prefix_buttons_select_a_prefix(engine):
+    engine.update_units_and_values(engine.add_symbol("m"), "×", 1000)
+    engine.reduce()
+    assert engine.current_display == ["", "km"]
+    assert engine.current_unit_name == ["meter"]
+
+def test_convert_to_base(engine):
+    engine.multiply_units("eV")
+    engine.convert_to_base()
+    engine.reduce()
+    assert engine.current_display[1:] == ["g", "m²", "s⁻²"]
+    assert engine.reduced_value == pytest.approx(1.602e-16, rel=1e-3)
+
+def test_convert_fractional_exponent(engine):
+    engine.load_quantity("1", [["", "eV", Fraction(1, 2)]])
+    engine.convert_to_base()
+    engine.reduce()
+    assert engine.current_display[1:] == ["g¹ᐟ²", "m", "s⁻¹"]
+    assert engine.reduced_value == pytest.approx(1.602e-16 ** 0.5, rel=1e-3)
+
+def test_load_quantity_adds_repeated_units(engine):
+    engine.load_quantity("1", [["", "m", Fraction(1, 2)], ["", "m", 1]])
+    assert engine.exponents.exponent(engine.add_symbol("m")) == Fraction(3, 2)
+
+def test_exact_mode_keeps_fractions(conversion_database, unit_database):
+    engine = UnitEngine(conversion_database, unit_database, exact=True)
+    engine.load_quantity("1", [["m", "m", 1], ["k", "m", 1]])
+    engine.reduce()
+    assert engine.current_value == 1
+    assert isinstance(engine.current_value, Fraction)
+    assert engine.current_display == ["", "m²"]
+
+def test_binary_prefixes(engine):
+    engine.binary = True
+    engine.update_units_and_values(engine.add_symbol("m"), "×", 4096)
+    engine.reduce()
+    assert engine.current_display == ["4", "Kim"]
+
+def test_favorites_round_trip(engine):
+    engine.update_units_and_values(engine.add_symbol("m"), "×")
+    engine.update_units_and_values(engine.add_symbol("s"), "÷")
+    engine.reduce()
+    saved = engine.favorite_string()
+    engine.clear()
+    engine.load_favorite(saved.split(", "))
+    engine.reduce()
+    assert engine.current_display == ["", "m", "s⁻¹"]
+    assert favorite_key(saved) == favorite_key(engine.favorite_string())
@@ -0,0 +1,54 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Exponent Vector Tests
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction
+from coalexicon.exponents import ExponentVector, power
+
+#############################################################################################################################################################################################
+## Functions
+def vector(*exponents):
+    """ Returns a vector with the given exponents. Ex=vector(0, Fraction(1, 2)) """
+    result = ExponentVector(len(exponents))
+    for index, exponent in enumerate(exponents):
+        result.set_exponent(index, Fraction(exponent))
+    return result
+
+#############################################################################################################################################################################################
+## Tests
+def test_set_exponent_stores_lowest_terms():
+    result = vector(Fraction(-3, 2), Fraction(4, 2), 0)
+    assert list(result.numerators) == [-3, 2, 0]
+    assert list(result.roots) == [1, 0, 0]
+    assert result.exponents() == [Fraction(-3, 2), 2, 0]
+
+def test_halves_add_to_one():
+    result = vector(Fraction(1, 2))
+    result *= vector(Fraction(1, 2))
+    assert result.exponent(0) == 1
+    assert result.key() == vector(1).key()
+
+def test_division_and_cancellation():
+    result = vector(Fraction(3, 2), -1) / vector(Fraction(1, 2), -1)
+    assert result.exponents() == [1, 0]
+    assert not vector(1, 0) / vector(1, 0) # Empty once every exponent cancels.
+
+def test_power_and_inverse():
+    assert (vector(2, -1) ** Fraction(1, 2)).exponents() == [1, Fraction(-1, 2)]
+    assert (vector(Fraction(1, 3), 2) ** 3).exponents() == [1, 6]
+    assert vector(1, Fraction(-1, 2)).inverse().exponents() == [-1, Fraction(1, 2)]
+
+def test_copy_is_independent():
+    original = vector(1, 2)
+    copied = original.copy()
+    copied.set_exponent(0, 5)
+    assert original.exponent(0) == 1
+
+def test_power_function():
+    assert power(Fraction(1, 1000), 2) == Fraction(1, 1000000)
+    assert power(4, Fraction(1, 2)) == 2.0
+    assert isinstance(power(10, 3), int)
@@ -0,0 +1,57 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Expression Tests
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction
+import pytest
+from coalexicon import UnitEngine
+from coalexicon.engine import base_symbols
+from coalexicon.expressions import ExpressionParser, convert_expression
+
+#############################################################################################################################################################################################
+## Fixtures
+@pytest.fixture
+def parser(conversion_database):
+    return ExpressionParser(base_symbols[:-1] + [symbol for symbol in conversion_database if not symbol.startswith("-")])
+
+#############################################################################################################################################################################################
+## Tests
+@pytest.mark.parametrize("text, value, units", [
+    ("3.2 MeV/s", "3.2", [["M", "eV", 1], ["", "s", -1]]),
+    ("9.81 kg⸱m⸱s⁻²", "9.81", [["k", "g", 1], ["", "m", 1], ["", "s", -2]]),
+    ("m^(3/2) s**-1", "1", [["", "m", Fraction(3, 2)], ["", "s", -1]]),
+    ("2 m⁻³ᐟ²", "2", [["", "m", Fraction(-3, 2)]]),
+    ("1 m⋅s·g", "1", [["", "m", 1], ["", "s", 1], ["", "g", 1]]),
+    ("1 mi", "1", [["", "mi", 1]])])
+def test_parse(parser, text, value, units):
+    assert parser.parse(text) == (value, units)
+
+def test_numeric_factors(parser):
+    assert parser.parse("1 1/s") == (1, [["", "s", -1]])
+    assert parser.parse("2 m 3 s") == (6, [["", "m", 1], ["", "s", 1]])
+    assert parser.parse("10³ m") == (1000, [["", "m", 1]])
+    with pytest.raises(ValueError):
+        parser.parse_units("2 m")
+
+def test_binary_prefix(parser):
+    assert parser.parse("1 Kim") == ("1", [["Ki", "m", 1]])
+
+@pytest.mark.parametrize("text, value, units", [
+    ("3.2 MeV/s", 5.1264e-10, "g⸱m²⸱s⁻³"),
+    ("1 eV^(1/2)", 1.2657e-08, "g¹ᐟ²⸱m⸱s⁻¹"),
+    ("1 m^(1/2) m", 1, "m³ᐟ²"),
+    ("1 s⁻¹ᐟ² s⁻¹ᐟ²", 1, "s⁻¹"),
+    ("1 mm km", 1, "m²")])
+def test_convert_expression(conversion_database, unit_database, parser, text, value, units):
+    result = convert_expression(UnitEngine(conversion_database, unit_database), parser, text)
+    assert float(result[0]) == pytest.approx(value, rel=1e-4)
+    assert result[1] == units
+
+@pytest.mark.parametrize("text", ["1 foo", "1 MeVs", "1 Ki"])
+def test_unknown_units(conversion_database, unit_database, parser, text):
+    with pytest.raises(ValueError):
+        convert_expression(UnitEngine(conversion_database, unit_database), parser, text)
@@ -0,0 +1,33 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Formatting Tests
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from fractions import Fraction
+import pytest
+from coalexicon.formatting import is_value, scientific_notation, significand_exponent
+from coalexicon.prefixes import select_prefix
+
+#############################################################################################################################################################################################
+## Tests
+@pytest.mark.parametrize("value, text", [
+    (0, "0"), (0.0, "0"), (1, ""), (-1, "-1"), (1000, "10³"), (2000, "2×10³"), (0.123, "1.23×10⁻¹"), (-0.000123, "-1.23×10⁻⁴"), (-1000, "-10³"),
+    (9.999, "10"), (-9.999, "-10"), (0.09999, "10⁻¹"), (Fraction(1, 3), "3.33×10⁻¹"), (Fraction(-5, 2), "-2.50"), (10 ** 400, "10⁴⁰⁰"), (Fraction(1, 10 ** 400), "10⁻⁴⁰⁰")])
+def test_scientific_notation(value, text):
+    assert scientific_notation(value) == text
+
+@pytest.mark.parametrize("value, text", [(float('inf'), "inf"), (float('-inf'), "-inf"), (float('nan'), "nan")])
+def test_non_finite_values(value, text):
+    assert significand_exponent(value) == (text, 0)
+    assert scientific_notation(value) == text
+    assert select_prefix(value)[0] == "" # Left without a prefix instead of raising.
+
+def test_fraction_is_not_converted_to_float_first():
+    assert significand_exponent(Fraction(10 ** 400 + 1, 3)) == ("3.33", 399)
+
+@pytest.mark.parametrize("text, expected", [("-1.23×10⁻¹", True), ("10⁻³", True), ("inf", True), ("-inf", True), ("nan", True), ("m⁻¹", False), ("kg", False)])
+def test_is_value(text, expected):
+    assert is_value(text) == expected
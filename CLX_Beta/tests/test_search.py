@@ -0,0 +1,68 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Search Tests
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from coalexicon.search import FuzzyIndex, TrigramIndex, edit_distance
+
+#############################################################################################################################################################################################
+## Global datasets
+database = {
+    "mass": ['m', '0', '0', 'g', 'm', 'quantity'],
+    "atomic mass": ['mₐ', '0', '0', 'g', 'm', 'quantity'],
+    "Massive": ['M', '0', '0', 'g', 'M', 'general'],
+    "reduced Planck constant": ['ℏ', '0', '0', 'g⸱m²⸱s⁻¹', 'h', 'constant'],
+    "electric field": ['E', '0', '0', 'g⸱m⸱s⁻²⸱C⁻¹', 'E', 'quantity'],
+    "energy": ['E', '0', '0', 'g⸱m²⸱s⁻²', 'E', 'quantity']}
+
+#############################################################################################################################################################################################
+## Tests
+def test_trigram_ranking():
+    index = TrigramIndex(database)
+    assert index.search("mass") == ["mass", "Massive", "atomic mass"]
+    assert index.search("MASS")[0] == "mass"
+    assert index.search("ity") == []
+    assert set(index.search("e")) == {name for name in database if "e" in name.lower()}
+    assert index.search("m")[:2] == ["mass", "Massive"] # Names that begin with a short term come first.
+    assert index.search("") == list(database)
+
+def test_trigram_updates():
+    index = TrigramIndex(database)
+    index.rename("mass", "rest mass")
+    index.add("mass flow")
+    index.remove("Massive")
+    assert index.search("mass") == ["mass flow", "rest mass", "atomic mass"]
+    assert "mass" not in index and "rest mass" in index
+
+def test_fuzzy_symbols_units_and_typos():
+    index = FuzzyIndex(database)
+    assert index.search("ℏ") == ["reduced Planck constant"]
+    assert index.search("plank")[0] == "reduced Planck constant"
+    assert index.search("elctric fild") == ["electric field"]
+    assert index.search("field E") == ["electric field"] # Every token must match.
+    assert index.search("E")[2:] == [] and set(index.search("E")) == {"energy", "electric field"}
+    assert "energy" in index.search("m²")
+
+def test_fuzzy_single_character_groups():
+    index = FuzzyIndex(database)
+    results = index.search("m")
+    assert results[0] == "mass" # Exact symbol matches in the same case come first.
+    assert set(results) >= {"mass", "Massive"}
+    assert index.search("m", limit=1) == results[:1]
+
+def test_fuzzy_updates():
+    index = FuzzyIndex(database)
+    index.rename("energy", "kinetic energy", database["energy"])
+    index.add("impulse", ['J', '0', '0', 'g⸱m⸱s⁻¹', 'J', 'quantity'])
+    index.remove("mass")
+    assert "kinetic energy" in index.search("enrgy")
+    assert index.search("J") == ["impulse"]
+    assert "mass" not in index.search("m")
+
+def test_edit_distance():
+    assert edit_distance("plank", "planck", 2) == 1
+    assert edit_distance("field", "fild", 2) == 1
+    assert edit_distance("abc", "xyz", 1) == 2
@@ -0,0 +1,64 @@
+#############################################################################################################################################################################################
+## Coalexicon | CLX | Sorted View Tests
+## SPDX-FileCopyrightText: © 2020 Alexander Heinrich <alexander.heinrich@wsu.edu>
+## SPDX-License-Identifier: BSD-3-Clause
+#############################################################################################################################################################################################
+
+#############################################################################################################################################################################################
+## Imports
+from coalexicon.views import SortedViews, view_key
+
+#############################################################################################################################################################################################
+## Functions
+def sample():
+    return {
+        "velocity": ['v', '0', '0', 'm⸱s⁻¹', 'v', 'quantity'],
+        "acceleration": ['a', '0', '0', 'm⸱s⁻²', 'a', 'quantity'],
+        "speed of light": ['c', '0', '0', 'm⸱s⁻¹', 'c', 'constant'],
+        "definition": ['≡', '0', '≝', '<none>', '0', 'general']}
+
+def names(rows):
+    return [row[0] for row in rows]
+
+#############################################################################################################################################################################################
+## Tests
+def test_view_key():
+    assert view_key("All *", "Name *", "Index") == ("All", "Name", None)
+
+def test_categories_and_sorting():
+    views = SortedViews(sample())
+    assert names(views.view("All", "Name")) == ["acceleration", "definition", "speed of light", "velocity"]
+    assert names(views.view("Quantities", "Name")) == ["acceleration", "velocity"]
+    assert names(views.view("Constants", "Name")) == ["speed of light"]
+
+def test_views_are_cached():
+    views = SortedViews(sample())
+    assert views.view("All", "Name") is views.view("All", "Name")
+
+def test_update_replaces_rows_or_discards_views():
+    database = sample()
+    views = SortedViews(database)
+    by_name = views.view("All", "Name")
+    by_units = views.view("All", "Units")
+    database["velocity"] = ['v', '0', '0', 'km⸱s⁻¹', 'v', 'quantity']
+    views.update("velocity", 4)
+    assert views.view("All", "Name") is by_name # The order of names does not depend on the units.
+    assert by_name[-1] == ("velocity", database["velocity"])
+    assert views.view("All", "Units") is not by_units
+
+def test_rename_and_add():
+    database = sample()
+    views = SortedViews(database)
+    views.view("Quantities", "Name")
+    database["zeta"] = database.pop("velocity")
+    views.update("zeta", 0, old_name="velocity")
+    assert names(views.view("Quantities", "Name")) == ["acceleration", "zeta"]
+    database["jerk"] = ['j', '0', '0', 'm⸱s⁻³', 'j', 'quantity']
+    views.add("jerk")
+    assert names(views.view("Quantities", "Name")) == ["acceleration", "jerk", "zeta"]
+
+def test_search_keeps_relevance_order():
+    database = sample()
+    views = SortedViews(database)
+    views.set_search([("velocity", database["velocity"]), ("acceleration", database["acceleration"])])
+    assert names(views.view("Search", "Name")) == ["velocity", "acceleration"]
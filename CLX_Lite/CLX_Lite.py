@@ -22,9 +22,16 @@ from tkinter import font # Used to set a default font.
 from functools import partial # Used for interactive font styles.
 from time import sleep # Used for troubleshooting and delaying script execution.
 from fractions import Fraction # Used in simplifying fractional exponents.
+import logging # Used for trace output, which is off by default.
+import os # Used to read CLX_TRACE.
 
 #############################################################################################################################################################################################
 ## Global datasets
+units_log = logging.getLogger("clx.units") # Traces Unit Manager. Switched on with the "trace units" keyword or CLX_TRACE=units.
+symbols_log = logging.getLogger("clx.symbols") # Traces Symbol Manager.
+io_log = logging.getLogger("clx.io") # Traces loading and saving of notes, favorites, and databases.
+trace_loggers = {"units": units_log, "symbols": symbols_log, "io": io_log} # Subsystems that may be traced separately. Ex="trace io"
+
 current_unit_list = [] # Holds a mutable list of elements of positive_numerator_list and negative_numerator_list. Ex=["m", "m", "-s", "-s"]
 current_unit_name = [] # Holds a unique keyname for the current unit, given by name_creator. Ex=['meter_squared_per_second_squared']
 current_display = [] # Holds a list of all strings that are processed for the main display. Ex=["1.23×10⁻¹", "MeV", "s⁻¹"]
@@ -79,28 +86,46 @@ cell_dictionary = {} # Initializes a dictionary of key-value pairs. Ex={'Name1':
 
 #############################################################################################################################################################################################
 ## Functions
-def print_sets(function=True):
-    """ Optional. Called for troubleshooting and procedural insight. Optional. """
-    print('print_sets():')  
-    print(f'current_unit_list:                 {current_unit_list}')
-    print(f'current_unit_name:                 {current_unit_name}')
-    print(f'current_display:                   {current_display}')
-    #print(f'positive_numerator_custom_array:   {positive_numerator_custom_array}')
-    #print(f'negative_numerator_custom_array:   {negative_numerator_custom_array}')
-    #print(f'numerator_value_list:             {numerator_value_list}')
-    #print(f'denominator_value_list:           {denominator_value_list}')
-    print(f'units_exponents_totals:            {units_exponents_totals}')
-    #print(f'positive_numerator_symbols:        {positive_numerator_symbols}')
-    #print(f'exponent_array_custom:             {exponent_array_custom}')
-    #print(f'negative_numerator_symbols:        {negative_numerator_symbols}')
-    print(f'current_value:                     {current_value}')
-    if function:
-        print(f"{'-'*98}\n")
+def set_trace(subsystems, enable=True):
+    """ Switches trace output on or off for subsystems separated by commas or spaces. "all" selects every subsystem. Ex=set_trace("units, io") """
+    names = subsystems.replace(",", " ").lower().split()
+    for name, logger in trace_loggers.items():
+        if name in names or "all" in names:
+            logger.setLevel(logging.DEBUG if enable else logging.WARNING)
+
+def setup_tracing():
+    """ Sends trace output to the terminal without the logger name or level, and switches on the subsystems named by the CLX_TRACE environment variable. Ex=CLX_TRACE=units,io """
+    logger = logging.getLogger("clx")
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(logging.WARNING) # Warnings are written even when tracing is off.
+    set_trace(os.environ.get("CLX_TRACE", ""))
+
+def print_sets():
+    """ Optional. Called for troubleshooting and procedural insight. Writes the current units to the Unit Manager trace, and does nothing while the trace is off. """
+    if not units_log.isEnabledFor(logging.DEBUG):
+        return
+    units_log.debug('print_sets():')
+    units_log.debug('current_unit_list:                 %s', current_unit_list)
+    units_log.debug('current_unit_name:                 %s', current_unit_name)
+    units_log.debug('current_display:                   %s', current_display)
+    #units_log.debug('positive_numerator_custom_array:   %s', positive_numerator_custom_array)
+    #units_log.debug('negative_numerator_custom_array:   %s', negative_numerator_custom_array)
+    #units_log.debug('numerator_value_list:             %s', numerator_value_list)
+    #units_log.debug('denominator_value_list:           %s', denominator_value_list)
+    units_log.debug('units_exponents_totals:            %s', units_exponents_totals)
+    #units_log.debug('positive_numerator_symbols:        %s', positive_numerator_symbols)
+    #units_log.debug('exponent_array_custom:             %s', exponent_array_custom)
+    #units_log.debug('negative_numerator_symbols:        %s', negative_numerator_symbols)
+    units_log.debug('current_value:                     %s', current_value)
 
 def main_units():
     """ Calls a series of primary functions to process current data and update the GUI display. Called by entry_unit(), update_units_and_values(),
-        invert(), clear(), and favorites_trigger(). Two new lines signify the end of a main_units() call. """
-    print("main_units():\n") # Optional.
+        invert(), clear(), and favorites_trigger(). The current units are traced at the end of each call. """
+    units_log.debug("main_units()") # Optional.
     consolidate_current_unit_list() # Updates current_unit_consolidated, current_unit_custom, positive_numerator_custom_array, and negative_numerator_custom_array.
     name = name_creator() # Updates and returns current_unit_name.
     unit_data_finder(name) # Updates conversions and quantities displays.
@@ -109,12 +134,11 @@ def main_units():
     current_unit_custom_to_significand_order_units() # Processes data for display.
     significand_order_units_to_current_display() # Processes data for display.
     set_current_display() # Updates current unit display.
-    print_sets(False) # Optional.
-    print(f"\n{'-'*98}") # Optional.
+    print_sets() # Optional.
 
 def load_notes():
     """ Loads saved notes for the lower subframe. """
-    print("load_notes():") # Optional.
+    io_log.debug("load_notes()") # Optional.
     notes_index = 1
     with open("database_notes.txt", 'r', encoding='utf-8') as notes: # Loads previous notes from a text file.
         for line in notes.readlines():
@@ -139,11 +163,10 @@ def load_notes():
         textbox.delete('1.0', 'end')
         textbox.insert('end', notes.strip())
     notes_toggle()
-    print() # Optional.
 
 def load_units():
     """ Converts an existing text file to a global dictionary of saved values. ={"} """
-    print("load_units():") # Optional.
+    io_log.debug("load_units()") # Optional.
     global unit_database
     unit_database.clear() # Prepares the global list for updating.
     with open("database_units.txt", 'r', encoding='utf-8') as database:
@@ -172,7 +195,6 @@ def load_units():
         for j in range(len(data_list)):
             column_data.append(data_list[j][i])
         conversion_database[names_list[i]] = column_data
-    print() # Optional.
 
 def save_command():
     """ Opens a text file and calls the current application's save routine. """
@@ -189,7 +211,7 @@ def save_command():
 
 def save_units():
     """ Saves data within the Unit Manager application. """
-    print("save_units():") # Optional.
+    io_log.debug("save_units()") # Optional.
     global unit_database
     with open("database_units.txt", 'w', encoding='utf-8') as database:
         for name in unit_database: # Assumes notation_database_dictionary.
@@ -198,12 +220,11 @@ def save_units():
                 name_and_data = f"{name_and_data}\t{data}"
             print(name_and_data, file=database)
     sleep(0.5) # Optional, though errors may occur otherwise.
-    print() # Optional.
 
 def data_return(event, cell):
     """ Updates the database with the current entry. Called when return/enter has been pressed in Unit Manager. """
     global unit_database
-    print(f"data_return():") # Optional.
+    units_log.debug("data_return()") # Optional.
     data = cell.get()  # Gets text/data from the specified cell.
     new_list = []
     if current_unit_name[0] not in unit_database:
@@ -217,19 +238,20 @@ def data_return(event, cell):
         new_list.append(old_data)
         new_list.append(new_data)
     unit_database[current_unit_name[0]] = new_list
-    print() # Optional.
 
 def entry_unit(event, unit, operator):
     """ Adds or removes a user-defined unit from current_unit_list, positive_numerator_symbols, and negative_numerator_symbols. 
         For the operator variable, "×" corresponds to multiplication, and ÷ corresponds to division. """
-    print("entry_unit():\n") # Optional.
+    units_log.debug("entry_unit()") # Optional.
     #print(f"event: {event}\nunit: {unit}\noperator: {operator}") # Optional
     global entry_unit_index, current_value
     if event:
         unit = unit_entry.get()
         root.focus()
     if unit: # Prevents errors following a null entry.
-        if unit == "C" and current_database_file == "database_iso.txt":
+        if unit.startswith("trace "): # Triggers keyword entry to switch trace output on (×) or off (÷) for a subsystem. Ex="trace units", "trace symbols", "trace io", "trace all"
+            set_trace(unit[6:], operator == "×")
+        elif unit == "C" and current_database_file == "database_iso.txt":
             index = positive_numerator_symbols.index(unit)
             update_units_and_values(index, operator, convert=True)
         else: # True for units, as opposed to keywords.
@@ -283,7 +305,7 @@ def populate_exponent_codes():
 def update_units_and_values(button_index, operator, convert=False):
     """ Calls prefix_value_tuple() and updates current_unit_list, numerator_value_list, denominator_value_list, and current_value. 
         This is a fundamental function that runs immediately after any unit is entered. def entry_unit(event, unit, operator): """
-    print("update_units_and_values():") # Optional.
+    units_log.debug("update_units_and_values()") # Optional.
     global numerator_value_list, denominator_value_list, current_value
     #print(f"button_index: {button_index}\noperator: {operator}") # Optional.
     if button_index == 1 and current_database_file == "database_iso.txt" and not convert:
@@ -342,14 +364,13 @@ def update_units_and_values(button_index, operator, convert=False):
                             current_unit_list.remove(negative_numerator_symbols[button_index])
                             #print(False) # Optional.
                     current_unit_list.remove(positive_denominator_symbols[button_index])
-        print() # Optional.
         main_units()
 
 def consolidate_current_unit_list():
     """ Uses current_unit_list to build current_unit_consolidated, current_unit_custom, positive_numerator_custom_array, and negative_numerator_custom_array.
         It converts duplicate units to a single unit with a nonzero exponent and converts ("simplifies") user-defined units to their base equivalent for naming and
         data recollection. <×/÷> """
-    print("consolidate_current_unit_list():") # Optional.
+    units_log.debug("consolidate_current_unit_list()") # Optional.
     positive_numerator_list, negative_numerator_list = [], [] # Initializes simplified exponent arrays to be saved globally as <±>_numerator_exponent_array.
     positive_denominator_list = [] # Initializes simplified exponent arrays to be saved globally as positive_denominator_exponent_array.
     positive_numerator_custom, negative_numerator_custom = [], [] # Initializes the unsimplified numerator exponent arrays.
@@ -390,7 +411,6 @@ def consolidate_current_unit_list():
     negative_numerator_custom_array.clear()
     positive_numerator_custom_array.extend(positive_numerator_custom) # Updates a global list.
     negative_numerator_custom_array.extend(negative_numerator_custom) # Updates a global list.
-    print() # Optional.
 
 def fractional_exponent_to_tuple(positive_numerator, negative_numerator, positive_denominator, input_list):
     """ Simplifies the exponent of each unit an populates a list of lists with two elements: the numerator and denominator of each respective exponent. """
@@ -416,7 +436,7 @@ def fractional_exponent_to_tuple(positive_numerator, negative_numerator, positiv
 
 def name_creator():
     """ Generates a name for the current unit that may correspond to a database entry in unit_data_finder. """
-    print("name_creator():") # Optional.
+    units_log.debug("name_creator()") # Optional.
     global exponent_array, exponent_array_custom
     #print(f"exponent_tuple_array: {exponent_tuple_array}") # Ex=[[0, 1], [0, 1], [0, 1], [0, 1], [3, 2], [0, 1], [0, 1], [0, 1]] # Optional.
     #print(f"exponent_tuple_array_custom: {exponent_tuple_array_custom}") # Ex=[[0, 1], [0, 1], [0, 1], [0, 1], [3, 2], [0, 1], [0, 1], [0, 1]] # Optional.
@@ -570,12 +590,11 @@ def name_creator():
     exponent_array, exponent_array_custom = exponent_tuple_array, exponent_tuple_array_custom # Updates global values.
     exponent_tuple_array.clear()
     exponent_tuple_array_custom.clear()
-    print() # Optional.
     return unit_name
 
 def prefix_finder():
     """ Called by main_units() to update units_exponents_totals and current_unit_reduced. """
-    print("prefix_finder():") # Optional.
+    units_log.debug("prefix_finder()") # Optional.
     global units_exponents_totals
     #print(f"old units_exponents_totals: {units_exponents_totals}") # Optional.
     units_exponents_totals.clear() # Initializes list for data collection.
@@ -637,11 +656,10 @@ def prefix_finder():
             else:
                 continue
     #print(f"new units_exponents_totals: {units_exponents_totals}") # Optional.
-    print() # Optional.
 
 def units_exponents_totals_to_compound_units_list():
     """ Looks at units_exponents_totals to determine compound prefixes, output compound_units_list, and update current_value. """
-    print("units_exponents_totals_to_compound_units_list():") # Optional.
+    units_log.debug("units_exponents_totals_to_compound_units_list()") # Optional.
     global current_value, compound_units_list
     compound_units_list.clear()
     relative_total = 0
@@ -725,11 +743,10 @@ def units_exponents_totals_to_compound_units_list():
         compound_units_list.append(compound_unit_list) # Adds the current unit data to compound_units_list.
         #print(f"original value: {units_exponents_totals[i][3]}\nleftover_value: {leftover_value}\ncurrent_value: {current_value}") # Optional.
     #print(f"compound_units_list: {compound_units_list}\n") # Optional.
-    print() # Optional.
 
 def current_unit_custom_to_significand_order_units():
     """ Looks at compound_units_list and current_value to output significand_order_units. """
-    print("current_unit_custom_to_significand_order_units():") # Optional.
+    units_log.debug("current_unit_custom_to_significand_order_units()") # Optional.
     global significand_order_units, compound_units_list, current_value
     significand, order = 1, 1 # Initializes values.
     if len(str(current_value)) > 12: # Accounts for rounding errors.
@@ -769,11 +786,10 @@ def current_unit_custom_to_significand_order_units():
         significand = ""
     significand_order_units = [significand, order, compound_units_list]
     #print(f"significand_order_units: {significand_order_units}") # Optional.
-    print()  # Optional.
 
 def significand_order_units_to_current_display():
     """ Writes the current value in scientific notation and attaches current prefixes to their respective units. """
-    print("significand_order_units_to_current_display():") # Optional.
+    units_log.debug("significand_order_units_to_current_display()") # Optional.
     global significand_order_units, current_display
     current_display.clear()
     significand, order, units = significand_order_units[0], significand_order_units[1], significand_order_units[2]
@@ -857,11 +873,10 @@ def significand_order_units_to_current_display():
     for i in range(len(units)):
         unit = units[i][1] + units[i][0]
         current_display.append(unit) # Adds each unit to the list.
-    print() # Optional.
 
 def set_current_display():
     """ Sets the main unit display using nonzero values from current_display. """
-    print("set_current_display():") # Optional.
+    units_log.debug("set_current_display()") # Optional.
     global current_display, display_list
     nonzero_current_display, nonzero_unit_display = [], [] # Initializes lists of nonzero elements of current_display and unit_display.
     display_list, temporary_list = [], [] # Initializes the final display list and a temporary display list.
@@ -895,11 +910,10 @@ def set_current_display():
             if "⁻" in temporary_list[i]:
                 display_list.append(temporary_list[i])
     display.set(display_list)
-    print() # Optional.
 
 def display_trigger(event):
     """ Sends the units in the current display to the textbox in the lower subframe. Called by clicking inside the display frame. """
-    print("display_trigger():\n") # Optional.
+    units_log.debug("display_trigger()") # Optional.
     global textbox_index
     if textbox_index == 1:
         textbox = textbox_1
@@ -918,19 +932,19 @@ def display_trigger(event):
 
 def conversions_trigger():
     """ Called when conversions_button is pressed. Copies data from the current unit to the textbox. """
-    print("conversions_trigger():\n") # Optional.
+    units_log.debug("conversions_trigger()") # Optional.
     if conversions_text.get().strip():
         unit_data_finder(current_unit_name[0], 1)
 
 def quantities_trigger():
     """ Called when quantities_button is pressed. Copies data from the current unit to the textbox. """
-    print("quantities_trigger():\n") # Optional.
+    units_log.debug("quantities_trigger()") # Optional.
     if quantities_text.get().strip():
         unit_data_finder(current_unit_name[0], 2)
 
 def values_toggle():
     """ Called when values_button is pressed. Shows numerical data from current_display. """
-    print("values_toggle():\n") # Optional.
+    units_log.debug("values_toggle()") # Optional.
     if values_button.config('relief')[-1] == 'sunken':
         values_button.config(relief="raised")
     else:
@@ -939,7 +953,7 @@ def values_toggle():
 
 def invert():
     """ Sets current_unit_list to its multiplicative inverse. """
-    print("invert():\n") # Optional.
+    units_log.debug("invert()") # Optional.
     global current_value
     invert_current_unit_list = []
     for i in range(len(negative_numerator_symbols)):
@@ -963,7 +977,7 @@ def invert():
 
 def clear():
     """ Clears current_unit_list, current_display, numerator_value_list, denominator_value_list, and current_value. """
-    print("clear():\n") # Optional.    
+    units_log.debug("clear()") # Optional.
     global current_value
     current_unit_list.clear()
     current_display.clear()
@@ -979,7 +993,7 @@ def clear():
 def favorites_trigger(csv_units):
     """ Called whenever a saved favorite is toggled. Updates current_unit_list, positive_numerator_symbols, negative_numerator_symbols, numerator_value_list, and 
         denominator_value_list and increments entry_unit_index. Ex_csv_units=['m⁻¹', '-mi', '0;0;0;0;0;0;0;0;1;0', '0;0;0;0;0;0;0;0;0;0', '1.0']"""
-    print("favorites_trigger():") # Optional.
+    units_log.debug("favorites_trigger()") # Optional.
     #print(f"old positive_numerator_symbols: {positive_numerator_symbols}\nold negative_numerator_symbols: {negative_numerator_symbols}") # Optional.
     global entry_unit_index, current_value, numerator_value_list, denominator_value_list
     del csv_units[0] # Removes the string of combined units.
@@ -1023,12 +1037,11 @@ def favorites_trigger(csv_units):
     current_unit_list.clear() # Initializes the curent unit list for updating.
     current_unit_list.extend(csv_units) # Adds each saved unit to the current list.
     #print(f"new positive_numerator_symbols: {positive_numerator_symbols}\nnew negative_numerator_symbols: {negative_numerator_symbols}") # Optional.
-    print() # Optional.
     main_units()
 
 def favorites_update():
     """ Converts an existing text file to a global list of saved favorites, loads saved favorites, and calls favorites_buttons. """
-    print("favorites_update():") # Optional.
+    io_log.debug("favorites_update()") # Optional.
     favorites_read = open('database_favorites.txt', 'r', encoding='utf-8') # Loads previous favorites from a text file.
     favorites_saved = favorites_read.readlines() # Produces a list of previous favorites.
     favorites_read = open('database_favorites.txt', 'w', encoding='utf-8') # Loads previous favorites for updating.
@@ -1057,22 +1070,21 @@ def favorites_update():
             csv_unit_saved = f"1, {denominator_prefixes}, {numerator_prefixes}, {float(current_value)}"
     if csv_unit_saved in favorites_list: # Checks if the current unit is already in favorites.
         favorites_list.remove(csv_unit_saved) # Removes current unit from the global list.
-        print(f"Favorite removed: {unit_consolidated}") # Optional.
+        io_log.info("Favorite removed: %s", unit_consolidated) # Optional.
     else: # Adds current unit to the global list.
         if csv_unit_saved: # False at startup.
             favorites_list.append(csv_unit_saved)
-            print(f"Favorite added: {unit_consolidated}") # Optional.
+            io_log.info("Favorite added: %s", unit_consolidated) # Optional.
     for save in favorites_list: # Updates the text file.
         print(save, file=favorites_read)
     favorites_read.close() # Closes the updated text file.
     favorites.delete('1.0', 'end') # Prepares the favorites frame for updating.
     #favorites.insert('end', favorites_list) # Adds text to the favorites frame.
-    print() # Optional.
     favorites_buttons() # Updates the favorites frame.
 
 def favorites_buttons():
     """ Populates a horizontal list of buttons that correspond to saved units. """
-    print(f"favorites_buttons():") # Optional.
+    units_log.debug("favorites_buttons()") # Optional.
     for button in favorites.place_slaves(): # Prepares the favorites display for updating.
         button.place_forget() # Removes all prior buttons.
     button_0, button_1, button_2, button_3 = tk.StringVar(), tk.StringVar(), tk.StringVar(), tk.StringVar() # Initializes button labels.
@@ -1128,7 +1140,7 @@ def favorites_buttons():
     favorite_button_15.bind('<Enter>', partial(font_config, favorite_button_15, f'Cambria {small_text} bold')) # Optional font automation.
     favorite_button_15.bind('<Leave>', partial(font_config, favorite_button_15, f'Cambria {small_text}')) # Optional font automation.
     if len(favorites_list) == 0:
-        print("No favorites saved.") # Optional.
+        units_log.debug("No favorites saved.") # Optional.
     if len(favorites_list) >= 1:
         csv_units = favorites_list[0].split(", ") # Specifies button_0 for labelling.
         button_0.set(csv_units[0]) # Sets unit_consolidated as the label of button_0.
@@ -1210,14 +1222,11 @@ def favorites_buttons():
         favorite_button_15.place(relx=0, rely=0, relwidth=0.15, relheight=0.3) # Places a defined button in favorites_frame.
         favorites.window_create('end', window=favorite_button_15) # Places the button in the favorites Text module.
     if len(favorites_list) > 17:
-        print("Favorites full! Implement more memory to continue.") # Optional.
-    print() # Optional.
-    if current_database_list: # False at startup.
-        print("-"*98) # Optional.
+        units_log.warning("Favorites full! Implement more memory to continue.") # Optional.
 
 def prefix_toggle(prefix=""):
     """ Toggles the selected prefix and unselects all others. """
-    print("prefix_toggle():\n") # Optional.
+    units_log.debug("prefix_toggle()") # Optional.
     if prefix == "Y":
         if prefix_Y_button.config('relief')[-1] == 'sunken':
             prefix_Y_button.config(relief="raised")
@@ -1457,7 +1466,7 @@ def entry_data_finder(unit_symbol):
     if unit_symbol in conversion_database: # Returns a list of equivalent base units.
         return conversion_database[unit_symbol][0]
     else: # Returns zero if no data is found.
-        print(f"No data found for {unit_symbol}.\n") # Optional.
+        units_log.debug("No data found for %s.", unit_symbol) # Optional.
         return 0
 
 def unit_data_finder(unit_name, x=0):
@@ -1544,7 +1553,7 @@ def window_size(resize=False):
 def prefix_to_value(convert_to_base=False):
     """ Converts all prefixes to their numerical equivalent and multiplies the current value by each, then removes the prefixes from the numerator and denominator lists. 
         Called by convert_to_base() or convert_button. units_exponents_totals=[['s²', 's', 2, 2], ['eV', 'eV', 1, 1000000]] """
-    print("prefix_to_value():") # Optional.
+    units_log.debug("prefix_to_value()") # Optional.
     global current_value
     for i in range(len(units_exponents_totals)):
         if units_exponents_totals[i][1] == "g" and current_database_file == "database_iso.txt":
@@ -1569,12 +1578,11 @@ def prefix_to_value(convert_to_base=False):
             if denominator_value_list[i]:
                 denominator_value_list[i] = 1
     if not convert_to_base:
-        print() # Optional.
         main_units()
     
 def convert_to_base():
     """ Converts any non-base units to base units. Calls prefix_to_value before converting non-base units. current_unit_list=['m', 'm', '-s', '-s'] """
-    print("convert_to_base():\n") #  Optional.
+    units_log.debug("convert_to_base()") # Optional.
     global current_value, current_unit_list, numerator_value_list, denominator_value_list
     prefix_to_value(True) # Merges all prefixes with the current value.
     temp_unit_list = current_unit_list[:] # Creates a copy of the current base and non-base units.
@@ -1594,9 +1602,8 @@ def convert_to_base():
                 current_value *= conversion_database[current_unit_list[i]][1]
     current_unit_list = temp_unit_list 
     if current_database_file == "database_iso.txt" and convert: # convert_to_si()
-        print() # Optional.
         main_units()
-        print(f"convert_to_base():") # Optional.
+        units_log.debug("convert_to_base()") # Optional.
         numerator_value_list[2] += (1000 ** current_unit_list.count("g"))
         denominator_value_list[2] += (1000 ** current_unit_list.count("-g"))
         current_value /= (1000 ** current_unit_list.count("g"))
@@ -1619,7 +1626,6 @@ def convert_to_base():
                 temp_unit_list.append("-A")
         current_unit_list = temp_unit_list 
         #print(f"current_unit_list: {current_unit_list}") # Optional.
-    print() # Optional.
     main_units()
 
 def font_config(widget, fontslant, event):
@@ -1650,15 +1656,13 @@ def raise_frame():
 
 def main_symbols():
     """ Called to update the Symbol Manager entry cells. """
-    print(f"main_symbols():\n") # Optional.
+    symbols_log.debug("main_symbols()") # Optional.
     set_current_database_list()
     populate_cells()
-    print() # Optional.
-    print("-"*98) # Optional.
 
 def load_symbols(database='database_clx.txt'):
     """ Converts an existing text file to a global dictionary of saved values. ={"} """
-    print("load_symbols():") # Optional.
+    io_log.debug("load_symbols()") # Optional.
     global notation_database_dictionary, notation_database_list, notation_database_quantities, notation_database_constants, notation_database_modifiers, notation_database_other
     notation_database_dictionary.clear() # Prepares the global list for updating.
     notation_database_list.clear() # Prepares the global list for updating.
@@ -1688,12 +1692,11 @@ def load_symbols(database='database_clx.txt'):
         elif notation_database_list[i][-1][-1] == "general": # Produces a list of uncategorized entries from notation_database_dictionary.
             notation_database_other.append(notation_database_list[i])
     #print(f"notation_database_dictionary: {notation_database_dictionary}") # Optional.
-    print() # Optional.
 
 def save_symbols():
     """ Saves data within the Symbol Manager application. """
     global current_database_file
-    print("save_symbols():") # Optional.
+    io_log.debug("save_symbols()") # Optional.
     #print(f"current_database_file: {current_database_file}") # Optional.
     with open(current_database_file, 'w', encoding='utf-8') as database:
         for name in notation_database_dictionary: # Assumes notation_database_dictionary.
@@ -1702,12 +1705,11 @@ def save_symbols():
                 name_and_symbols = f"{name_and_symbols}\t{symbol}"
             print(name_and_symbols, file=database)
     sleep(0.5) # Optional.
-    print() # Optional.
     load_symbols(current_database_file)
 
 def change_preset_text(*args):
     """ Loads the specified database and updates related labels and functions. """
-    print(f"change_preset_text():\n") # Optional.
+    symbols_log.debug("change_preset_text()") # Optional.
     global current_database_file
     if preset_text.get() == "CLX":
         current_database_file = "database_clx.txt"
@@ -1735,7 +1737,7 @@ def change_preset_text(*args):
 def set_current_database_list():
     """ Updates Unit Manager to show entries of the specified category. Ex=[('<Name>', ['<Primary>', '<Secondary>', '<Other>', '<Units>', '<Index>', '<Category>'])]
         Allows changing the Symbol sorting method from Primary to Index. """
-    print("set_current_database_list():") # Optional.
+    symbols_log.debug("set_current_database_list()") # Optional.
     global current_database_list
     if current_category == "All" or current_category == "All *":
         current_database_list = notation_database_list
@@ -1774,29 +1776,26 @@ def set_current_database_list():
             else:
                 unit_database_list.append(current_database_list[row])
         current_database_list = unit_database_list + nonunit_database_list
-    print() # Optional.
 
 def change_category_text(*args):
     """ Handles minor tasks related to set_current_database_list() and change_preset_text(). Possible options are ["All", "Quantities", "Modifiers", "Other"]. """
-    print("change_category_text():") # Optional.
+    symbols_log.debug("change_category_text()") # Optional.
     #print(f"category: {category_text.get()}") # Optional.
     global current_category
     current_category = category_text.get()
-    print() # Optional.
     main_symbols()
     
 def change_sort_text(*args):
     """ Handles minor tasks related to set_current_database_list() and change_preset_text(). Possible options are ["Name", "Symbol", "Units"]. """
-    print("change_sort_text():") # Optional.
+    symbols_log.debug("change_sort_text()") # Optional.
     #print(f"sorting: {sort_text.get()}") # Optional.
     global current_sort
     current_sort = sort_text.get()
-    print() # Optional.
     main_symbols()
 
 def populate_cells():
     """ Removes previous cells from Symbol Manager, creates row and column labels, and creates entry cells for Symbol Manager. """
-    print(f"populate_cells():") # Optional.
+    symbols_log.debug("populate_cells()") # Optional.
     #print(f"cell_frame.winfo_children(): {cell_frame.winfo_children()}\n") # Optional.
     global current_database_list
     cell_frame.grid_forget() # Prepares the cells for updating.
@@ -1858,7 +1857,7 @@ def populate_cells():
 
 def cell_return(event, cell):
     """ Called when return/enter has been pressed. """
-    print(f"cell_return():") # Optional.
+    symbols_log.debug("cell_return()") # Optional.
     global current_database_list
     data = cell_dictionary[cell][0].get()  # Gets text/data from the specified cell.
     row, column = "", ""
@@ -1907,11 +1906,10 @@ def cell_return(event, cell):
             notation_database_dictionary[data] = ["0", "0", "0", "0", "0", category]
     finally:
         try: # Optional.
-            print(f"Selected entry: ['{name}': {append_list}]") # Optional.
+            symbols_log.debug("Selected entry: ['%s': %s]", name, append_list) # Optional.
         except: # Optional.
-            print(f"Selected entry: ['{data}': {append_list}]") # Optional.
+            symbols_log.debug("Selected entry: ['%s': %s]", data, append_list) # Optional.
         #print(f"Cell ID: {cell}; Cell data: {data}") # Optional.
-        print() # Optional.
 
 def configure_cell_canvas(cell_canvas):
     """ Resets the scroll region to encompass the inner frame. """
@@ -1919,7 +1917,7 @@ def configure_cell_canvas(cell_canvas):
 
 def search_names(event, widget):
     """ Looks through the current database to find names that include the search term(s). """
-    print(f"search_names():") # Optional.
+    symbols_log.debug("search_names()") # Optional.
     global current_database_list, current_category
     current_category = "Search"
     search_term = widget.get()
@@ -1937,7 +1935,6 @@ def search_names(event, widget):
                 search_list.append(row)
     notation_database_search.clear()
     notation_database_search.extend(search_list)
-    print() # Optional.
     main_symbols()
 
 def font_config(widget, fontslant, event):
@@ -2468,14 +2465,14 @@ close_button.bind('<Leave>', partial(font_config, close_button, f'Cambria {small
 
 #############################################################################################################################################################################################
 ## Startup Commands
-print(f"{'-'*98}\n{'-'*98}\nCoalexicon [CLX] Startup\nWelcome!\n\n{'-'*98}") # Optional.
+setup_tracing() # Switches on the subsystems named by CLX_TRACE.
+io_log.debug("Coalexicon [CLX] Startup") # Optional.
 favorites_update() # Loads saved favorites.
 load_notes() # Loads notes.
 load_units()  # Loads units for Unit Manager.
 load_symbols() # Loads default symbol database for Symbol Manager.
 main_symbols() # Creates cells and updates the display for Symbol Manager.
 raise_frame() # Triggers the default application, as set by application_index.
-print(f"{'-'*98}") # Optional.
 root.mainloop() # Starts the GUI.
 
 #############################################################################################################################################################################################